@@ -78,6 +78,13 @@ class RedisLyricsSearchRepository(
             val requestTitle = result["request_title"] as? String
             val requestArtist = result["request_artist"] as? String
 
+            // Non-ok results (not found, error, rejected) carry no song data
+            val status = result["status"] as? String ?: STATUS_OK
+            if (status != STATUS_OK) {
+                resolveWithoutResult(requestTitle, requestArtist, status)
+                return
+            }
+
             // Use title/artist for the actual song data (from Genius API)
             val title = result["title"] as? String ?: return
             val artist = result["artist"] as? String ?: return
@@ -109,4 +116,29 @@ class RedisLyricsSearchRepository(
             logger.error("Error processing Redis message", e)
         }
     }
+
+    private fun resolveWithoutResult(
+        requestTitle: String?,
+        requestArtist: String?,
+        status: String,
+    ) {
+        if (requestTitle == null || requestArtist == null) {
+            logger.warn("Ignoring $status result without request info")
+            return
+        }
+
+        val key = "$requestTitle:$requestArtist"
+        val continuation = pendingRequests.remove(key)
+
+        if (continuation != null) {
+            continuation.resume(null)
+            logger.info("Resolved request without result for: $key (status: $status)")
+        } else {
+            logger.warn("No pending request found for: $key. Pending keys: ${pendingRequests.keys}")
+        }
+    }
+
+    companion object {
+        private const val STATUS_OK = "ok"
+    }
 }
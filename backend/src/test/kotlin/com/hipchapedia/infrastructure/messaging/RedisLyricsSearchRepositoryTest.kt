@@ -13,6 +13,7 @@ import org.springframework.test.util.ReflectionTestUtils
 import kotlin.test.assertEquals
 import kotlin.test.assertNotNull
 import kotlin.test.assertNull
+import kotlin.test.assertTrue
 
 class RedisLyricsSearchRepositoryTest {
     private val redisTemplate: RedisTemplate<String, String> = mockk(relaxed = true)
@@ -106,6 +107,41 @@ class RedisLyricsSearchRepositoryTest {
             assertNull(result)
         }
 
+    @Test
+    fun `검색 결과가 없다는 메시지를 받으면 타임아웃 전에 null을 반환해야 한다`() =
+        runTest {
+            // given
+            val title = "Missing Song"
+            val artist = "Missing Artist"
+
+            val responseData =
+                mapOf(
+                    "status" to "not_found",
+                    "detail" to null,
+                    "request_title" to title,
+                    "request_artist" to artist,
+                )
+
+            val message: Message = mockk()
+            every { message.body } returns objectMapper.writeValueAsBytes(responseData)
+
+            // 별도 스레드에서 메시지 처리
+            Thread {
+                Thread.sleep(100)
+                repository.onMessage(message, null)
+            }.start()
+
+            // when
+            repository.publishSearchRequest(title, artist)
+            val startedAt = System.currentTimeMillis()
+            val result = repository.waitForResult(title, artist, 5)
+            val elapsed = System.currentTimeMillis() - startedAt
+
+            // then
+            assertNull(result)
+            assertTrue(elapsed < 5000)
+        }
+
     @Test
     fun `잘못된 형식의 메시지는 무시해야 한다`() {
         // given
@@ -0,0 +1,156 @@
+"""Fake Genius API and website with configurable latency, errors and page size."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+
+from aiohttp import web
+
+
+@dataclass
+class FakeGeniusOptions:
+    """Behaviour of the fake Genius server."""
+
+    latency_ms: float = 50.0
+    jitter_ms: float = 10.0
+    error_rate: float = 0.0
+    page_kb: int = 200
+    lyrics_lines: int = 60
+    seed: int = 0
+
+
+def build_page(page_kb: int, lyrics_lines: int) -> str:
+    """
+    Build a song page roughly the size of a real Genius page.
+
+    Args:
+        page_kb: Approximate page size in KiB
+        lyrics_lines: Number of lyrics lines in the page
+
+    Returns:
+        HTML with a lyrics container surrounded by filler markup
+    """
+    lyrics = "<br/>".join(
+        f"[Verse {i // 8 + 1}]" if i % 8 == 0 else f"Line {i} of the fake lyrics"
+        for i in range(lyrics_lines)
+    )
+    container = f'<div data-lyrics-container="true">{lyrics}</div>'
+
+    # Like real pages: mostly an inline JSON state blob plus some markup
+    remaining = max(0, page_kb * 1024 - len(container))
+    markup_line = '<div class="SongPage__Filler"><span>filler text</span></div>\n'
+    markup = markup_line * (remaining // 5 // len(markup_line))
+    state = '{"songPage":"' + "x" * (remaining - len(markup)) + '"}'
+
+    return (
+        "<!DOCTYPE html><html><head><title>Fake Genius</title>"
+        f"<script>window.__PRELOADED_STATE__ = {state};</script></head>"
+        f"<body>{markup}{container}</body></html>"
+    )
+
+
+class FakeGeniusServer:
+    """aiohttp server answering ``/search`` and ``/songs/{id}`` like Genius."""
+
+    def __init__(self, options: FakeGeniusOptions) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            options: Latency, error rate and page size
+        """
+        self.options = options
+        self.port = 0
+        self._page = build_page(options.page_kb, options.lyrics_lines)
+        self._random = random.Random(options.seed)
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        return f"http://127.0.0.1:{self.port}/"
+
+    async def _respond_slowly(self) -> web.Response | None:
+        """Wait for the configured latency and maybe return an error."""
+        latency = self.options.latency_ms + self._random.uniform(
+            -self.options.jitter_ms, self.options.jitter_ms
+        )
+        await asyncio.sleep(max(0.0, latency) / 1000)
+
+        if self._random.random() < self.options.error_rate:
+            return web.Response(status=500, text="Injected error")
+        return None
+
+    async def _handle_search(self, request: web.Request) -> web.Response:
+        """Return a single hit for the query."""
+        error = await self._respond_slowly()
+        if error is not None:
+            return error
+
+        artist, _, title = request.query.get("q", "").partition(" - ")
+        song_id = self._random.randrange(1, 10**7)
+        hit = {
+            "type": "song",
+            "result": {
+                "id": song_id,
+                "title": title or artist,
+                "url": f"{self.base_url}songs/{song_id}",
+                "primary_artist": {"name": artist},
+                "release_date_for_display": "January 1, 2024",
+            },
+        }
+        return web.json_response({"meta": {"status": 200}, "response": {"hits": [hit]}})
+
+    async def _handle_song_page(self, request: web.Request) -> web.Response:
+        """Return the generated song page."""
+        error = await self._respond_slowly()
+        if error is not None:
+            return error
+        return web.Response(text=self._page, content_type="text/html")
+
+    async def start(self, port: int = 0) -> None:
+        """
+        Start listening on localhost.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+        """
+        app = web.Application()
+        app.router.add_get("/search", self._handle_search)
+        app.router.add_get("/songs/{song_id}", self._handle_song_page)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def serve_forever(options: FakeGeniusOptions, connection: Connection) -> None:
+    """
+    Run the fake server in a child process and report its port.
+
+    Running the server in its own process keeps its CPU time and memory out
+    of the fetcher's measurements.
+
+    Args:
+        options: Latency, error rate and page size
+        connection: Pipe end the chosen port is sent through
+    """
+
+    async def run() -> None:
+        server = FakeGeniusServer(options)
+        await server.start()
+        connection.send(server.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
@@ -0,0 +1,72 @@
+"""In-process message repository for benchmarks without Redis."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+from src.domain.entities.result_status import ResultStatus
+from src.domain.entities.search_request import SearchRequest
+from src.domain.entities.song import Song
+from src.domain.repositories.message_repository import MessageRepository
+
+ResultCallback = Callable[[SearchRequest, ResultStatus], None]
+
+
+class InMemoryMessageRepository(MessageRepository):
+    """
+    Message repository backed by an asyncio queue.
+
+    Requests are submitted with ``submit`` and every published result is
+    reported to ``on_result``, so the fetcher can be driven without any
+    broker in between.
+    """
+
+    def __init__(self, on_result: ResultCallback) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            on_result: Called with the request and status of every result
+        """
+        self.on_result = on_result
+        self._requests: asyncio.Queue[SearchRequest | None] = asyncio.Queue()
+
+    def submit(self, request: SearchRequest) -> None:
+        """Deliver a request to the subscriber."""
+        self._requests.put_nowait(request)
+
+    def close(self) -> None:
+        """End the subscription once the submitted requests are consumed."""
+        self._requests.put_nowait(None)
+
+    def subscribe_requests(self) -> AsyncIterator[SearchRequest]:
+        """Yield submitted requests until the repository is closed."""
+        return self._subscribe()
+
+    async def _subscribe(self) -> AsyncIterator[SearchRequest]:
+        """Internal implementation of subscribe_requests."""
+        while (request := await self._requests.get()) is not None:
+            yield request
+
+    async def publish_result(
+        self, song: Song, original_request: SearchRequest | None = None
+    ) -> None:
+        """Report a found song."""
+        if original_request is not None:
+            self.on_result(original_request, ResultStatus.OK)
+
+    async def publish_status(
+        self,
+        original_request: SearchRequest,
+        status: ResultStatus,
+        detail: str | None = None,
+    ) -> None:
+        """Report a result without a song."""
+        self.on_result(original_request, status)
+
+    async def connect(self) -> None:
+        """Nothing to connect to."""
+
+    async def disconnect(self) -> None:
+        """Nothing to disconnect from."""
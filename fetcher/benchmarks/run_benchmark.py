@@ -0,0 +1,489 @@
+"""
+Load test of the lyrics fetcher against a fake Genius server.
+
+Requests are sent at a fixed arrival rate (open loop), so a slow fetcher
+shows up as growing latency instead of a lower send rate. Results are
+printed and optionally written as JSON for comparison in CI.
+
+Usage:
+    python -m benchmarks.run_benchmark --rate 100 --requests 2000
+    python -m benchmarks.run_benchmark --transport streams --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import redis.asyncio as redis
+
+from benchmarks.fake_genius_server import FakeGeniusOptions, serve_forever
+from benchmarks.in_memory_message_repository import InMemoryMessageRepository
+from src.domain.entities.result_status import ResultStatus
+from src.domain.entities.search_request import SearchRequest
+from src.domain.repositories.message_repository import MessageRepository
+from src.infrastructure.external.genius_client import GeniusClient
+from src.infrastructure.external.genius_lyrics_repository import (
+    GeniusLyricsRepository,
+)
+from src.infrastructure.messaging.redis_message_repository import (
+    RedisMessageRepository,
+)
+from src.infrastructure.messaging.redis_streams_message_repository import (
+    RedisStreamsMessageRepository,
+)
+from src.infrastructure.messaging.result_codec import ResultCodec, decode_result
+from src.presentation.lyrics_fetcher_service import (
+    LyricsFetcherService,
+    OverflowPolicy,
+)
+from src.use_cases.search_lyrics import SearchLyricsUseCase
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("memory", "pubsub", "streams")
+
+
+@dataclass
+class BenchmarkConfig:
+    """Load shape and fetcher settings of one benchmark run."""
+
+    transport: str = "memory"
+    rate: float = 50.0
+    requests: int = 500
+    max_concurrent_tasks: int = 10
+    queue_size: int = 100
+    overflow_policy: str = "block"
+    max_retries: int = 3
+    retry_backoff: float = 0.05
+    result_timeout_seconds: float = 30.0
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    result_format: str = "json"
+    server: FakeGeniusOptions = field(default_factory=FakeGeniusOptions)
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark run."""
+
+    sent: int
+    completed: int
+    outcomes: dict[str, int]
+    duration_seconds: float
+    throughput_rps: float
+    latency_ms: dict[str, float]
+    rss_mib: dict[str, float]
+
+
+def percentile(values: Sequence[float], quantile: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples
+        quantile: Quantile between 0 and 1
+
+    Returns:
+        The sample at the quantile, or NaN without samples
+    """
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
+
+
+def current_rss_mib() -> float:
+    """Resident set size of this process in MiB (Linux only, else NaN)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return math.nan
+    return pages * resource.getpagesize() / 2**20
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class ResultTracker:
+    """Match published results to send times by trace ID."""
+
+    def __init__(self, expected: int) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            expected: Number of requests that will be sent
+        """
+        self.expected = expected
+        self.sent_at: dict[str, float] = {}
+        self.latencies: list[float] = []
+        self.outcomes: dict[str, int] = {}
+        self.first_sent: float | None = None
+        self.last_completed: float | None = None
+        self.done = asyncio.Event()
+
+    def sent(self, trace_id: str) -> None:
+        """Record that a request left the driver."""
+        now = time.perf_counter()
+        self.sent_at[trace_id] = now
+        if self.first_sent is None:
+            self.first_sent = now
+
+    def completed(self, trace_id: str | None, status: ResultStatus) -> None:
+        """Record the result of a request, ignoring unknown or repeated ones."""
+        if trace_id is None or trace_id not in self.sent_at:
+            return
+
+        now = time.perf_counter()
+        self.latencies.append(now - self.sent_at.pop(trace_id))
+        self.outcomes[status.value] = self.outcomes.get(status.value, 0) + 1
+        self.last_completed = now
+        if len(self.latencies) >= self.expected:
+            self.done.set()
+
+    def result(self) -> BenchmarkResult:
+        """Summarize the run."""
+        duration = 0.0
+        if self.first_sent is not None and self.last_completed is not None:
+            duration = self.last_completed - self.first_sent
+
+        latencies_ms = [latency * 1000 for latency in self.latencies]
+        return BenchmarkResult(
+            sent=self.expected,
+            completed=len(self.latencies),
+            outcomes=dict(sorted(self.outcomes.items())),
+            duration_seconds=round(duration, 3),
+            throughput_rps=round(len(self.latencies) / duration, 2)
+            if duration
+            else 0.0,
+            latency_ms={
+                "mean": round(sum(latencies_ms) / len(latencies_ms), 2)
+                if latencies_ms
+                else math.nan,
+                "p50": round(percentile(latencies_ms, 0.50), 2),
+                "p95": round(percentile(latencies_ms, 0.95), 2),
+                "p99": round(percentile(latencies_ms, 0.99), 2),
+                "max": round(max(latencies_ms, default=math.nan), 2),
+            },
+            rss_mib={
+                "end": round(current_rss_mib(), 1),
+                "peak": round(peak_rss_mib(), 1),
+            },
+        )
+
+
+async def send_at_fixed_rate(
+    count: int, rate: float, send: Callable[[int], Awaitable[None]]
+) -> None:
+    """
+    Call ``send`` for each request index on a fixed schedule.
+
+    Args:
+        count: Number of requests
+        rate: Requests per second
+        send: Sends the request with the given index
+    """
+    started = time.perf_counter()
+    for index in range(count):
+        delay = started + index / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await send(index)
+
+
+def make_request(index: int) -> SearchRequest:
+    """Build a unique request so no layer can answer it from a cache."""
+    return SearchRequest(
+        title=f"Benchmark Song {index}",
+        artist="Benchmark Artist",
+        trace_id=uuid.uuid4().hex,
+    )
+
+
+def create_service(
+    config: BenchmarkConfig, genius_url: str, repository: MessageRepository
+) -> LyricsFetcherService:
+    """Wire the fetcher to the fake Genius server without caches or limits."""
+    client = GeniusClient(
+        api_token="benchmark",
+        api_root=genius_url,
+        web_root=genius_url,
+        max_retries=config.max_retries,
+        retry_backoff=config.retry_backoff,
+    )
+    return LyricsFetcherService(
+        message_repository=repository,
+        search_lyrics_use_case=SearchLyricsUseCase(
+            GeniusLyricsRepository(api_token="benchmark", client=client)
+        ),
+        max_concurrent_tasks=config.max_concurrent_tasks,
+        queue_size=config.queue_size,
+        overflow_policy=OverflowPolicy(config.overflow_policy),
+    )
+
+
+async def run_in_memory(config: BenchmarkConfig, genius_url: str) -> BenchmarkResult:
+    """Drive the fetcher through an in-process message repository."""
+    tracker = ResultTracker(config.requests)
+    repository = InMemoryMessageRepository(
+        on_result=lambda request, status: tracker.completed(request.trace_id, status)
+    )
+    service = create_service(config, genius_url, repository)
+    service_task = asyncio.create_task(service.start())
+
+    async def send(index: int) -> None:
+        request = make_request(index)
+        assert request.trace_id is not None
+        tracker.sent(request.trace_id)
+        repository.submit(request)
+
+    try:
+        await send_at_fixed_rate(config.requests, config.rate, send)
+        await asyncio.wait_for(tracker.done.wait(), config.result_timeout_seconds)
+    except TimeoutError:
+        logger.warning("Timed out waiting for results")
+    finally:
+        repository.close()
+        await service_task
+
+    return tracker.result()
+
+
+async def run_with_redis(config: BenchmarkConfig, genius_url: str) -> BenchmarkResult:
+    """Drive the fetcher through Redis pub/sub or streams."""
+    prefix = f"benchmark:{uuid.uuid4().hex[:8]}"
+    request_channel = f"{prefix}:requests"
+    request_stream = f"{prefix}:requests:stream"
+    result_channel = f"{prefix}:results"
+
+    codec = ResultCodec(result_format=config.result_format)
+    repository: RedisMessageRepository
+    if config.transport == "streams":
+        repository = RedisStreamsMessageRepository(
+            host=config.redis_host,
+            port=config.redis_port,
+            request_stream=request_stream,
+            result_channel=result_channel,
+            result_codec=codec,
+        )
+    else:
+        repository = RedisMessageRepository(
+            host=config.redis_host,
+            port=config.redis_port,
+            request_channel=request_channel,
+            result_channel=result_channel,
+            result_codec=codec,
+        )
+
+    tracker = ResultTracker(config.requests)
+    client = redis.Redis(
+        host=config.redis_host, port=config.redis_port, decode_responses=True
+    )
+    # Results may be binary, so they are read without decoding
+    results_client = redis.Redis(host=config.redis_host, port=config.redis_port)
+    results = results_client.pubsub()
+    await results.subscribe(result_channel)
+
+    async def listen() -> None:
+        async for message in results.listen():
+            if message["type"] != "message":
+                continue
+            data = decode_result(message["data"])
+            tracker.completed(data.get("trace_id"), ResultStatus(data["status"]))
+
+    listener = asyncio.create_task(listen())
+    service = create_service(config, genius_url, repository)
+    service_task = asyncio.create_task(service.start())
+
+    if config.transport == "pubsub":
+        # Messages published before the service subscribes would be lost
+        while not (await client.pubsub_numsub(request_channel))[0][1]:
+            await asyncio.sleep(0.01)
+
+    async def send(index: int) -> None:
+        request = make_request(index)
+        assert request.trace_id is not None
+        payload = json.dumps(
+            {
+                "title": request.title,
+                "artist": request.artist,
+                "trace_id": request.trace_id,
+            }
+        )
+        tracker.sent(request.trace_id)
+        if config.transport == "streams":
+            await client.xadd(request_stream, {"data": payload})
+        else:
+            await client.publish(request_channel, payload)
+
+    try:
+        await send_at_fixed_rate(config.requests, config.rate, send)
+        await asyncio.wait_for(tracker.done.wait(), config.result_timeout_seconds)
+    except TimeoutError:
+        logger.warning("Timed out waiting for results")
+    finally:
+        # Cancelling start() drains the work queue and disconnects
+        service_task.cancel()
+        listener.cancel()
+        await asyncio.gather(service_task, listener, return_exceptions=True)
+        await results.close()
+        await results_client.close()
+        await client.delete(request_stream)
+        await client.close()
+
+    return tracker.result()
+
+
+async def run_benchmark(config: BenchmarkConfig, genius_url: str) -> BenchmarkResult:
+    """
+    Run one benchmark against an already running fake Genius server.
+
+    Args:
+        config: Load shape and fetcher settings
+        genius_url: Root URL of the fake Genius server
+
+    Returns:
+        Throughput, latency and memory measurements
+    """
+    if config.transport == "memory":
+        return await run_in_memory(config, genius_url)
+    if config.transport in ("pubsub", "streams"):
+        return await run_with_redis(config, genius_url)
+    raise ValueError(f"Unknown transport: {config.transport}")
+
+
+def start_fake_server(
+    options: FakeGeniusOptions,
+) -> tuple[multiprocessing.process.BaseProcess, str]:
+    """
+    Start the fake Genius server in a child process.
+
+    Args:
+        options: Latency, error rate and page size
+
+    Returns:
+        The server process and its root URL
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=serve_forever, args=(options, sender), daemon=True)
+    process.start()
+    if not receiver.poll(30):
+        process.kill()
+        raise RuntimeError("Fake Genius server did not start")
+    port = receiver.recv()
+    return process, f"http://127.0.0.1:{port}/"
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Load test of the lyrics fetcher against a fake Genius server."
+    )
+    parser.add_argument("--transport", choices=TRANSPORTS, default="memory")
+    parser.add_argument("--rate", type=float, default=50.0, help="requests/s")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--max-concurrent-tasks", type=int, default=10)
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument(
+        "--overflow-policy", choices=[p.value for p in OverflowPolicy], default="block"
+    )
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-kb", type=int, default=200)
+    parser.add_argument("--redis-host", default="localhost")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--result-format", choices=("json", "msgpack"), default="json")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument(
+        "--max-p95-ms", type=float, help="fail if the p95 latency is higher"
+    )
+    parser.add_argument(
+        "--min-throughput", type=float, help="fail if fewer requests/s complete"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Returns:
+        Exit code, 1 if a threshold was missed or results are missing
+    """
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    args = parse_args(argv)
+    config = BenchmarkConfig(
+        transport=args.transport,
+        rate=args.rate,
+        requests=args.requests,
+        max_concurrent_tasks=args.max_concurrent_tasks,
+        queue_size=args.queue_size,
+        overflow_policy=args.overflow_policy,
+        redis_host=args.redis_host,
+        redis_port=args.redis_port,
+        result_format=args.result_format,
+        server=FakeGeniusOptions(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            page_kb=args.page_kb,
+        ),
+    )
+
+    server, genius_url = start_fake_server(config.server)
+    try:
+        result = asyncio.run(run_benchmark(config, genius_url))
+    finally:
+        server.terminate()
+        server.join()
+
+    report: dict[str, Any] = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "config": asdict(config),
+        "result": asdict(result),
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    failures = []
+    if result.completed < result.sent:
+        failures.append(f"only {result.completed}/{result.sent} requests completed")
+    if args.max_p95_ms is not None and result.latency_ms["p95"] > args.max_p95_ms:
+        failures.append(f"p95 {result.latency_ms['p95']}ms > {args.max_p95_ms}ms")
+    if args.min_throughput is not None and result.throughput_rps < args.min_throughput:
+        failures.append(
+            f"throughput {result.throughput_rps}/s < {args.min_throughput}/s"
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Batch backfill entry point.
+
+Fetches lyrics for every title/artist pair in a JSONL or CSV file through
+the same worker pool, rate limiter and cache as the service, e.g.:
+
+    python -m src.backfill charts-2024.jsonl --output charts-2024.results.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from src.config import Config
+from src.domain.entities.batch_search_request import BatchSearchRequest
+from src.infrastructure.messaging.batch_file_message_repository import (
+    BatchFileMessageRepository,
+    BatchProgress,
+    read_batch_file,
+)
+from src.infrastructure.tracing.tracer import default_tracer
+from src.main import create_service, create_span_exporter, setup_logging
+from src.presentation.lyrics_fetcher_service import OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+
+async def report_progress(
+    batch_id: str, progress: BatchProgress, interval_seconds: float
+) -> None:
+    """
+    Log batch progress periodically.
+
+    Args:
+        batch_id: Batch being processed
+        progress: Live progress of the run
+        interval_seconds: Time between reports
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        done = progress.resumed + progress.completed
+        logger.info(
+            f"Batch {batch_id}: {done}/{progress.total} done, "
+            f"{progress.throughput:.1f} items/s, {dict(progress.outcomes)}"
+        )
+
+
+async def run_batch(
+    config: Config,
+    batch: BatchSearchRequest,
+    output_path: Path,
+    checkpoint_path: Path,
+    report_interval_seconds: float = 10.0,
+) -> BatchProgress:
+    """
+    Process a batch until every item is done or the run is interrupted.
+
+    Args:
+        config: Application configuration
+        batch: Batch to process
+        output_path: JSON Lines file results are appended to
+        checkpoint_path: File recording finished items for resuming
+        report_interval_seconds: Time between progress log lines
+
+    Returns:
+        Progress of the run
+    """
+    repository = BatchFileMessageRepository(batch, output_path, checkpoint_path)
+    # Backfills wait for free workers instead of dropping items
+    config.overflow_policy = OverflowPolicy.BLOCK.value
+    service = create_service(config, message_repository=repository)
+
+    loop = asyncio.get_running_loop()
+
+    def signal_handler() -> None:
+        logger.info("Received shutdown signal, finishing items in flight")
+        asyncio.create_task(service.stop())
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler)
+
+    default_tracer.exporter = create_span_exporter(config, None)
+    await default_tracer.start()
+    reporter = asyncio.create_task(
+        report_progress(batch.batch_id, repository.progress, report_interval_seconds)
+    )
+    try:
+        # Returns once every pending item has been handed out and finished
+        await service.start()
+    finally:
+        reporter.cancel()
+        await default_tracer.stop()
+
+    return repository.progress
+
+
+def summarize(batch: BatchSearchRequest, progress: BatchProgress) -> dict[str, Any]:
+    """Aggregate figures of a finished run."""
+    return {
+        "batch_id": batch.batch_id,
+        "total": progress.total,
+        "resumed": progress.resumed,
+        "completed": progress.completed,
+        "remaining": progress.remaining,
+        "outcomes": dict(progress.outcomes),
+        "throughput_per_second": round(progress.throughput, 2),
+    }
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Fetch lyrics for a batch file")
+    parser.add_argument("input", type=Path, help="JSONL or CSV file of title/artist")
+    parser.add_argument("--output", type=Path, help="results file (JSONL)")
+    parser.add_argument("--checkpoint", type=Path, help="progress file for resuming")
+    parser.add_argument("--batch-id", help="defaults to the input file name")
+    parser.add_argument(
+        "--concurrency", type=int, help="workers (defaults to MAX_CONCURRENT_TASKS)"
+    )
+    parser.add_argument("--report-interval", type=float, default=10.0, help="seconds")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run a backfill from the command line.
+
+    Returns:
+        Exit code, 1 if items are left for a later run
+    """
+    args = parse_args(argv)
+    config = Config.from_env()
+    setup_logging(config.log_level)
+    if args.concurrency:
+        config.max_concurrent_tasks = args.concurrency
+
+    batch = read_batch_file(args.input, args.batch_id)
+    output_path = args.output or args.input.with_suffix(".results.jsonl")
+    checkpoint_path = args.checkpoint or output_path.with_name(
+        output_path.name + ".checkpoint"
+    )
+
+    progress = asyncio.run(
+        run_batch(config, batch, output_path, checkpoint_path, args.report_interval)
+    )
+    print(json.dumps(summarize(batch, progress), ensure_ascii=False, indent=2))
+    return 0 if progress.remaining == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
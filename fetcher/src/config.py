@@ -13,6 +13,26 @@ class Config:
     # Genius API
     genius_api_token: str
 
+    # Genius rate limiting (backend: "local" or "redis"; rate 0 disables)
+    genius_rate_limit: float = 10.0
+    genius_rate_burst: int = 10
+    genius_rate_limit_backend: str = "local"
+    genius_rate_limit_key: str = "lyrics:ratelimit:genius"
+    genius_max_retries: int = 3
+
+    # Lyrics providers (comma-separated, in priority order; mode: "fallback" or "hedged")
+    lyrics_providers: str = "genius"
+    lyrics_provider_mode: str = "fallback"
+    lyrics_hedge_delay_ms: float = 1000.0
+
+    # Per-provider circuit breaker (calls slower than the threshold count as failed)
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_window_seconds: float = 30.0
+    circuit_breaker_min_calls: int = 10
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_seconds: float = 5.0
+    circuit_breaker_open_seconds: float = 15.0
+
     # Redis
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -21,6 +41,87 @@ class Config:
     redis_request_channel: str = "lyrics:requests"
     redis_result_channel: str = "lyrics:results"
 
+    # Message batching
+    redis_read_batch_size: int = 10
+    redis_publish_batch_size: int = 1
+    redis_publish_linger_ms: float = 0.0
+
+    # Redis connections
+    redis_pool_size: int = 10
+    redis_health_check_interval_seconds: float = 15.0
+    redis_reconnect_backoff_seconds: float = 0.5
+    redis_reconnect_backoff_max_seconds: float = 30.0
+
+    # Result wire format ("json" or "msgpack")
+    result_format: str = "json"
+    result_compression: str = "zstd"
+    result_compress_threshold_bytes: int = 1024
+
+    # Message transport ("pubsub" or "streams")
+    message_transport: str = "pubsub"
+    redis_request_stream: str = "lyrics:requests:stream"
+    redis_consumer_group: str = "lyrics-fetchers"
+    redis_consumer_name: str | None = None
+    redis_stream_max_len: int = 10000
+    redis_stream_claim_idle_ms: int = 60000
+
+    # Request processing
+    max_concurrent_tasks: int = 10
+    queue_size: int = 100
+    overflow_policy: str = "block"
+    # Workers kept free of low-priority requests, and high-priority requests
+    # started per low-priority one while both are waiting
+    high_priority_reserved_tasks: int = 2
+    high_priority_weight: int = 4
+    # Cross-replica request leases: with pub/sub every replica receives every
+    # request, and only the one holding the SET NX PX lease processes it (the
+    # lease is deleted once the request is answered)
+    request_lease_enabled: bool = False
+    request_lease_ms: int = 30000
+    request_lease_prefix: str = "lyrics:lease:"
+
+    # Worker processes (0 = one per CPU core)
+    worker_processes: int = 1
+    health_report_interval_seconds: float = 30.0
+
+    # Lyrics cache
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_ttl_seconds: float = 3600.0
+    redis_cache_ttl_seconds: int = 86400
+    redis_cache_prefix: str = "lyrics:cache:"
+    cache_negative_ttl_seconds: float = 60.0
+    # Stale-while-revalidate: hits older than this are refreshed in the
+    # background by a small pool with its own rate budget (0 disables)
+    cache_refresh_after_seconds: float = 21600.0
+    cache_refresh_workers: int = 2
+    cache_refresh_rate: float = 0.5
+    cache_refresh_queue_size: int = 256
+    # Related-song prefetching: after a successful search, up to
+    # prefetch_max_songs album tracks and artist hits are looked up on a
+    # background pool with its own rate budget, within the Genius rate limit
+    # shared with searches (requires the cache)
+    prefetch_enabled: bool = False
+    prefetch_max_songs: int = 5
+    prefetch_workers: int = 1
+    prefetch_rate: float = 0.2
+    prefetch_queue_size: int = 64
+
+    # Persistent on-disk lyrics store (one directory per worker process)
+    persistent_store_enabled: bool = False
+    persistent_store_path: str = "data/lyrics-store"
+    persistent_store_max_bytes: int = 268435456
+
+    # Metrics endpoint (workers listen on port + worker index)
+    metrics_enabled: bool = True
+    metrics_host: str = "0.0.0.0"
+    metrics_port: int = 9100
+
+    # Request tracing ("none", "file" or "otlp")
+    tracing_exporter: str = "none"
+    tracing_file_path: str = "traces.jsonl"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+
     # Logging
     log_level: str = "INFO"
 
@@ -37,11 +138,118 @@ class Config:
                 "GENIUS_API_TOKEN",
                 "TZMYC5TFeNDmvuS73xLBtyp5_Ehlh3_wnBu8DSwBn5VcQatOSLeKks536S6P1aA7",
             ),
+            genius_rate_limit=float(os.getenv("GENIUS_RATE_LIMIT", "10")),
+            genius_rate_burst=int(os.getenv("GENIUS_RATE_BURST", "10")),
+            genius_rate_limit_backend=os.getenv(
+                "GENIUS_RATE_LIMIT_BACKEND", "local"
+            ).lower(),
+            genius_rate_limit_key=os.getenv(
+                "GENIUS_RATE_LIMIT_KEY", "lyrics:ratelimit:genius"
+            ),
+            genius_max_retries=int(os.getenv("GENIUS_MAX_RETRIES", "3")),
+            lyrics_providers=os.getenv("LYRICS_PROVIDERS", "genius").lower(),
+            lyrics_provider_mode=os.getenv("LYRICS_PROVIDER_MODE", "fallback").lower(),
+            lyrics_hedge_delay_ms=float(os.getenv("LYRICS_HEDGE_DELAY_MS", "1000")),
+            circuit_breaker_enabled=os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower()
+            == "true",
+            circuit_breaker_window_seconds=float(
+                os.getenv("CIRCUIT_BREAKER_WINDOW_SECONDS", "30")
+            ),
+            circuit_breaker_min_calls=int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "10")),
+            circuit_breaker_failure_rate=float(
+                os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5")
+            ),
+            circuit_breaker_slow_call_seconds=float(
+                os.getenv("CIRCUIT_BREAKER_SLOW_CALL_SECONDS", "5")
+            ),
+            circuit_breaker_open_seconds=float(
+                os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "15")
+            ),
             redis_host=os.getenv("REDIS_HOST", "localhost"),
             redis_port=int(os.getenv("REDIS_PORT", "6379")),
             redis_db=int(os.getenv("REDIS_DB", "0")),
             redis_password=os.getenv("REDIS_PASSWORD"),
             redis_request_channel=os.getenv("REDIS_REQUEST_CHANNEL", "lyrics:requests"),
             redis_result_channel=os.getenv("REDIS_RESULT_CHANNEL", "lyrics:results"),
+            redis_read_batch_size=int(os.getenv("REDIS_READ_BATCH_SIZE", "10")),
+            redis_publish_batch_size=int(os.getenv("REDIS_PUBLISH_BATCH_SIZE", "1")),
+            redis_publish_linger_ms=float(os.getenv("REDIS_PUBLISH_LINGER_MS", "0")),
+            redis_pool_size=int(os.getenv("REDIS_POOL_SIZE", "10")),
+            redis_health_check_interval_seconds=float(
+                os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "15")
+            ),
+            redis_reconnect_backoff_seconds=float(
+                os.getenv("REDIS_RECONNECT_BACKOFF_SECONDS", "0.5")
+            ),
+            redis_reconnect_backoff_max_seconds=float(
+                os.getenv("REDIS_RECONNECT_BACKOFF_MAX_SECONDS", "30")
+            ),
+            result_format=os.getenv("RESULT_FORMAT", "json").lower(),
+            result_compression=os.getenv("RESULT_COMPRESSION", "zstd").lower(),
+            result_compress_threshold_bytes=int(
+                os.getenv("RESULT_COMPRESS_THRESHOLD_BYTES", "1024")
+            ),
+            message_transport=os.getenv("MESSAGE_TRANSPORT", "pubsub").lower(),
+            redis_request_stream=os.getenv(
+                "REDIS_REQUEST_STREAM", "lyrics:requests:stream"
+            ),
+            redis_consumer_group=os.getenv("REDIS_CONSUMER_GROUP", "lyrics-fetchers"),
+            redis_consumer_name=os.getenv("REDIS_CONSUMER_NAME"),
+            redis_stream_max_len=int(os.getenv("REDIS_STREAM_MAX_LEN", "10000")),
+            redis_stream_claim_idle_ms=int(
+                os.getenv("REDIS_STREAM_CLAIM_IDLE_MS", "60000")
+            ),
+            max_concurrent_tasks=int(os.getenv("MAX_CONCURRENT_TASKS", "10")),
+            queue_size=int(os.getenv("QUEUE_SIZE", "100")),
+            overflow_policy=os.getenv("OVERFLOW_POLICY", "block").lower(),
+            high_priority_reserved_tasks=int(
+                os.getenv("HIGH_PRIORITY_RESERVED_TASKS", "2")
+            ),
+            high_priority_weight=int(os.getenv("HIGH_PRIORITY_WEIGHT", "4")),
+            request_lease_enabled=os.getenv("REQUEST_LEASE_ENABLED", "false").lower()
+            == "true",
+            request_lease_ms=int(os.getenv("REQUEST_LEASE_MS", "30000")),
+            request_lease_prefix=os.getenv("REQUEST_LEASE_PREFIX", "lyrics:lease:"),
+            worker_processes=int(os.getenv("WORKER_PROCESSES", "1")),
+            health_report_interval_seconds=float(
+                os.getenv("HEALTH_REPORT_INTERVAL_SECONDS", "30")
+            ),
+            cache_enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
+            cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "1024")),
+            cache_ttl_seconds=float(os.getenv("CACHE_TTL_SECONDS", "3600")),
+            redis_cache_ttl_seconds=int(os.getenv("REDIS_CACHE_TTL_SECONDS", "86400")),
+            redis_cache_prefix=os.getenv("REDIS_CACHE_PREFIX", "lyrics:cache:"),
+            cache_negative_ttl_seconds=float(
+                os.getenv("CACHE_NEGATIVE_TTL_SECONDS", "60")
+            ),
+            cache_refresh_after_seconds=float(
+                os.getenv("CACHE_REFRESH_AFTER_SECONDS", "21600")
+            ),
+            cache_refresh_workers=int(os.getenv("CACHE_REFRESH_WORKERS", "2")),
+            cache_refresh_rate=float(os.getenv("CACHE_REFRESH_RATE", "0.5")),
+            cache_refresh_queue_size=int(os.getenv("CACHE_REFRESH_QUEUE_SIZE", "256")),
+            prefetch_enabled=os.getenv("PREFETCH_ENABLED", "false").lower() == "true",
+            prefetch_max_songs=int(os.getenv("PREFETCH_MAX_SONGS", "5")),
+            prefetch_workers=int(os.getenv("PREFETCH_WORKERS", "1")),
+            prefetch_rate=float(os.getenv("PREFETCH_RATE", "0.2")),
+            prefetch_queue_size=int(os.getenv("PREFETCH_QUEUE_SIZE", "64")),
+            persistent_store_enabled=os.getenv(
+                "PERSISTENT_STORE_ENABLED", "false"
+            ).lower()
+            == "true",
+            persistent_store_path=os.getenv(
+                "PERSISTENT_STORE_PATH", "data/lyrics-store"
+            ),
+            persistent_store_max_bytes=int(
+                os.getenv("PERSISTENT_STORE_MAX_BYTES", "268435456")
+            ),
+            metrics_enabled=os.getenv("METRICS_ENABLED", "true").lower() == "true",
+            metrics_host=os.getenv("METRICS_HOST", "0.0.0.0"),
+            metrics_port=int(os.getenv("METRICS_PORT", "9100")),
+            tracing_exporter=os.getenv("TRACING_EXPORTER", "none").lower(),
+            tracing_file_path=os.getenv("TRACING_FILE_PATH", "traces.jsonl"),
+            tracing_otlp_endpoint=os.getenv(
+                "TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+            ),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
         )
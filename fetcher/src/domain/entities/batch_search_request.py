@@ -0,0 +1,26 @@
+"""Batch search request entity."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.domain.entities.search_request import SearchRequest
+
+
+@dataclass
+class BatchSearchRequest:
+    """Many title/artist searches submitted together, e.g. an album or chart."""
+
+    batch_id: str
+    items: list[SearchRequest]
+
+    def __post_init__(self) -> None:
+        """Validate required fields."""
+        if not self.batch_id:
+            raise ValueError("Batch ID cannot be empty")
+        if not self.items:
+            raise ValueError("Batch must contain at least one item")
+
+    def __len__(self) -> int:
+        """Number of items in the batch."""
+        return len(self.items)
@@ -0,0 +1,14 @@
+"""Priority of a search request."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class Priority(StrEnum):
+    """Scheduling lane of a search request."""
+
+    # Someone is waiting on the result, e.g. the backend's lyrics analysis
+    HIGH = "high"
+    # Bulk work such as backfills, served with spare capacity
+    LOW = "low"
@@ -0,0 +1,15 @@
+"""Status of a published lyrics result."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class ResultStatus(StrEnum):
+    """Outcome reported to the requester for a search request."""
+
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    ERROR = "error"
+    REJECTED = "rejected"
+    UNAVAILABLE = "unavailable"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+
+from src.domain.entities.priority import Priority
 
 
 @dataclass
@@ -11,6 +14,14 @@ class SearchRequest:
 
     title: str
     artist: str
+    # Transport-specific delivery ID used for acknowledgement (e.g. stream entry ID)
+    message_id: str | None = field(default=None, compare=False, repr=False)
+    # Trace the request belongs to, echoed in the result for correlation
+    trace_id: str | None = field(default=None, compare=False)
+    # Requests without a priority are treated as interactive
+    priority: Priority = field(default=Priority.HIGH, compare=False)
+    # Unix time after which the requester no longer waits for the result
+    expires_at: float | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         """Validate required fields."""
@@ -18,6 +29,27 @@ class SearchRequest:
             raise ValueError("Title cannot be empty")
         if not self.artist:
             raise ValueError("Artist cannot be empty")
+        # Raises ValueError for unknown priorities read from messages
+        self.priority = Priority(self.priority)
+
+    def remaining_seconds(self, now: float | None = None) -> float | None:
+        """
+        Time left until the request expires.
+
+        Args:
+            now: Current Unix time (defaults to the system clock)
+
+        Returns:
+            Seconds left (negative once expired), or None without a deadline
+        """
+        if self.expires_at is None:
+            return None
+        return self.expires_at - (time.time() if now is None else now)
+
+    def expired(self, now: float | None = None) -> bool:
+        """Check if the requester has stopped waiting for the result."""
+        remaining = self.remaining_seconds(now)
+        return remaining is not None and remaining <= 0
 
     def to_search_query(self) -> str:
         """Convert to search query string."""
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -15,6 +16,13 @@ class Song:
     url: str | None = None
     album: str | None = None
     release_date: str | None = None
+    # Unix time the lyrics were fetched from the source, kept by cache tiers
+    fetched_at: float = field(default_factory=time.time, compare=False)
+    # Source that matched the song and its IDs there, so related songs can
+    # be looked up without searching for the song again
+    source: str | None = field(default=None, compare=False)
+    source_id: int | None = field(default=None, compare=False)
+    source_artist_id: int | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         """Validate required fields."""
@@ -23,6 +31,10 @@ class Song:
         if not self.artist:
             raise ValueError("Artist cannot be empty")
 
+    def age_seconds(self, now: float | None = None) -> float:
+        """Time since the lyrics were fetched from the source."""
+        return (time.time() if now is None else now) - self.fetched_at
+
     def has_lyrics(self) -> bool:
         """Check if the song has lyrics."""
         return self.lyrics is not None and len(self.lyrics.strip()) > 0
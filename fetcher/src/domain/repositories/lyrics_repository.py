@@ -7,6 +7,10 @@ from abc import ABC, abstractmethod
 from src.domain.entities.song import Song
 
 
+class UpstreamUnavailableError(Exception):
+    """Raised instead of querying a lyrics source that is known to be failing."""
+
+
 class LyricsRepository(ABC):
     """Abstract repository for fetching song lyrics."""
 
@@ -23,3 +27,22 @@ class LyricsRepository(ABC):
             Song entity if found, None otherwise
         """
         pass
+
+    async def refresh_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song again, bypassing any cache of this repository.
+
+        Caching repositories override this to query their inner repository
+        and store the fresh result; others simply search.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        return await self.search_song(title=title, artist=artist)
+
+    async def close(self) -> None:
+        """Release resources held by the repository."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 
+from src.domain.entities.result_status import ResultStatus
 from src.domain.entities.search_request import SearchRequest
 from src.domain.entities.song import Song
 
@@ -34,6 +35,32 @@ class MessageRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def publish_status(
+        self,
+        original_request: SearchRequest,
+        status: ResultStatus,
+        detail: str | None = None,
+    ) -> None:
+        """
+        Publish a result without a song, e.g. when a request is rejected.
+
+        Args:
+            original_request: Request the status refers to
+            status: Outcome of the request
+            detail: Human-readable explanation (optional)
+        """
+
+    async def acknowledge(self, request: SearchRequest) -> None:
+        """
+        Acknowledge that a request has been fully processed.
+
+        Transports without delivery tracking ignore acknowledgements.
+
+        Args:
+            request: Request received from subscribe_requests
+        """
+
     @abstractmethod
     async def connect(self) -> None:
         """Establish connection to message broker."""
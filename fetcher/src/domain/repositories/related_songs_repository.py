@@ -0,0 +1,28 @@
+"""Repository interface for finding songs related to a song."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from src.domain.entities.song import Song
+
+
+class RelatedSongsRepository(ABC):
+    """Abstract repository suggesting songs likely to be looked up next."""
+
+    @abstractmethod
+    async def related_songs(self, song: Song, limit: int) -> list[tuple[str, str]]:
+        """
+        Find songs related to a song, most likely next lookup first.
+
+        Args:
+            song: Song found by an earlier search, with its source IDs
+            limit: Maximum number of songs to return
+
+        Returns:
+            (title, artist) pairs, excluding the song itself
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the repository."""
@@ -0,0 +1,108 @@
+"""Ranking of search candidates against the requested title and artist."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+from src.domain.utils.normalization import search_text, split_parentheticals
+from src.domain.utils.romanization import romanize
+
+TITLE_WEIGHT = 0.65
+ARTIST_WEIGHT = 0.35
+# Score a later candidate must gain per position to outrank an earlier one,
+# so near-ties keep the provider's own relevance order
+POSITION_PENALTY = 0.02
+
+
+@lru_cache(maxsize=4096)
+def match_variants(text: str) -> tuple[frozenset[str], ...]:
+    """
+    Trigram sets of the ways a title or artist may be written.
+
+    "Black Nut (블랙넛)" is matched as a whole, without the parenthetical
+    and as the parenthesized name alone, each romanized so that Hangul,
+    Kana and Latin spellings can be compared.
+
+    Args:
+        text: Title or artist name
+
+    Returns:
+        One trigram set per distinct variant
+    """
+    outer, inner = split_parentheticals(text)
+    keys = {
+        "".join(romanize(search_text(variant)).split())
+        for variant in (text, outer, *inner)
+    }
+    return tuple(_trigrams(key) for key in keys if key)
+
+
+def _trigrams(key: str) -> frozenset[str]:
+    """Character trigrams of a key, padded so short keys still have some."""
+    padded = f"  {key} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(text: str, other: str) -> float:
+    """
+    Similarity of two titles or artist names.
+
+    Args:
+        text: Requested text
+        other: Candidate text
+
+    Returns:
+        Best Dice coefficient over the variants of both, between 0 and 1
+    """
+    best = 0.0
+    for left in match_variants(text):
+        for right in match_variants(other):
+            shared = len(left & right)
+            if shared:
+                best = max(best, 2 * shared / (len(left) + len(right)))
+    return best
+
+
+def match_score(
+    title: str, artist: str, candidate_title: str, candidate_artist: str
+) -> float:
+    """
+    Score how well a candidate matches the request.
+
+    Args:
+        title: Requested title
+        artist: Requested artist
+        candidate_title: Title of the candidate
+        candidate_artist: Artist of the candidate
+
+    Returns:
+        Weighted title and artist similarity between 0 and 1
+    """
+    return TITLE_WEIGHT * similarity(title, candidate_title) + (
+        ARTIST_WEIGHT * similarity(artist, candidate_artist)
+    )
+
+
+def best_match(
+    title: str, artist: str, candidates: Sequence[tuple[str, str]]
+) -> int | None:
+    """
+    Pick the candidate that best matches the request.
+
+    Args:
+        title: Requested title
+        artist: Requested artist
+        candidates: (title, artist) pairs in the provider's relevance order
+
+    Returns:
+        Index of the best candidate, or None without candidates
+    """
+    best_index: int | None = None
+    best_score = 0.0
+    for index, (candidate_title, candidate_artist) in enumerate(candidates):
+        score = match_score(title, artist, candidate_title, candidate_artist)
+        score -= POSITION_PENALTY * index
+        if best_index is None or score > best_score:
+            best_index, best_score = index, score
+    return best_index
@@ -0,0 +1,89 @@
+"""Normalization helpers for search queries."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# Featured-artist credits, parenthesized or trailing ("Song (feat. X)", "Song ft. X")
+_FEATURING = re.compile(
+    r"\s*[(\[]\s*(?:feat|ft|featuring|with)\b\.?[^)\]]*[)\]]"
+    r"|\s+(?:feat|ft|featuring)\b\.?\s.*$",
+    re.IGNORECASE,
+)
+_PARENTHETICAL = re.compile(r"[(\[]([^)\]]*)[)\]]")
+_APOSTROPHES = re.compile(r"['’`]")
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize free text for comparison.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        NFKC-normalized, casefolded text with collapsed whitespace
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def strip_featuring(text: str) -> str:
+    """
+    Remove featured-artist credits.
+
+    Args:
+        text: Title or artist name
+
+    Returns:
+        Text without "feat." style credits
+    """
+    return _FEATURING.sub("", text)
+
+
+def split_parentheticals(text: str) -> tuple[str, list[str]]:
+    """
+    Separate parenthesized and bracketed parts from the rest of the text.
+
+    Args:
+        text: Title or artist name, e.g. "Black Nut (블랙넛)"
+
+    Returns:
+        The text without parentheticals and the parenthesized contents
+    """
+    return _PARENTHETICAL.sub(" ", text), _PARENTHETICAL.findall(text)
+
+
+def search_text(text: str) -> str:
+    """
+    Normalize a title or artist for lookups.
+
+    On top of normalize_text, featured-artist credits and punctuation are
+    dropped, so "Don't (feat. X)" and "dont" are looked up alike.
+    Parentheticals such as "(Remix)" are kept since they name other songs.
+
+    Args:
+        text: Title or artist name
+
+    Returns:
+        Normalized text, or normalize_text's result if nothing would remain
+    """
+    normalized = normalize_text(strip_featuring(text))
+    stripped = _PUNCTUATION.sub(" ", _APOSTROPHES.sub("", normalized))
+    stripped = " ".join(stripped.split())
+    return stripped or normalized
+
+
+def normalize_key(title: str, artist: str) -> str:
+    """
+    Build a stable lookup key for a title/artist pair.
+
+    Args:
+        title: Song title
+        artist: Artist name
+
+    Returns:
+        Normalized key shared by equivalent queries
+    """
+    return f"{search_text(artist)}\x1f{search_text(title)}"
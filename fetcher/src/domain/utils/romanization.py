@@ -0,0 +1,104 @@
+"""Romanization of Hangul and Kana for fuzzy matching."""
+
+from __future__ import annotations
+
+# Revised Romanization of Korean, per jamo and without sound-change rules
+_INITIALS = (
+    "g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s",
+    "ss", "", "j", "jj", "ch", "k", "t", "p", "h",
+)  # fmt: skip
+_MEDIALS = (
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae",
+    "oe", "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+)  # fmt: skip
+_FINALS = (
+    "", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l",
+    "p", "l", "m", "p", "p", "t", "t", "ng", "t", "t", "k", "t", "p", "t",
+)  # fmt: skip
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+# Hepburn romanization of hiragana; katakana is shifted onto hiragana first
+_KANA = dict(
+    zip(
+        "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほ"
+        "まみむめもやゆよらりるれろわをんがぎぐげござじずぜぞだぢづでど"
+        "ばびぶべぼぱぴぷぺぽゔぁぃぅぇぉゎ",
+        (
+            "a i u e o ka ki ku ke ko sa shi su se so ta chi tsu te to "
+            "na ni nu ne no ha hi fu he ho ma mi mu me mo ya yu yo "
+            "ra ri ru re ro wa o n ga gi gu ge go za ji zu ze zo "
+            "da ji zu de do ba bi bu be bo pa pi pu pe po vu "
+            "a i u e o wa"
+        ).split(),
+        strict=True,
+    )
+)
+_SMALL_Y = {"ゃ": "a", "ゅ": "u", "ょ": "o"}
+_SOKUON = "っ"
+_KATAKANA_FIRST = 0x30A1
+_KATAKANA_LAST = 0x30F6
+_KATAKANA_OFFSET = 0x60
+
+
+def _romanize_hangul(syllable: str) -> str:
+    """Romanize one precomposed Hangul syllable."""
+    index = ord(syllable) - _HANGUL_FIRST
+    initial, rest = divmod(index, 21 * 28)
+    medial, final = divmod(rest, 28)
+    return _INITIALS[initial] + _MEDIALS[medial] + _FINALS[final]
+
+
+def _to_hiragana(char: str) -> str:
+    """Map a katakana character onto its hiragana counterpart."""
+    if _KATAKANA_FIRST <= ord(char) <= _KATAKANA_LAST:
+        return chr(ord(char) - _KATAKANA_OFFSET)
+    return char
+
+
+def romanize(text: str) -> str:
+    """
+    Transliterate Hangul and Kana into Latin letters.
+
+    The transliteration is simplified (no assimilation, no long vowel
+    marks) and only meant to make scripts comparable; other characters
+    pass through unchanged.
+
+    Args:
+        text: Text in any script
+
+    Returns:
+        Text with Hangul syllables and Kana romanized
+    """
+    if text.isascii():
+        return text
+
+    chars = [_to_hiragana(char) for char in text]
+    parts: list[str] = []
+    geminate = False
+    for i, char in enumerate(chars):
+        if _HANGUL_FIRST <= ord(char) <= _HANGUL_LAST:
+            parts.append(_romanize_hangul(char))
+            continue
+        if char == _SOKUON:
+            geminate = True
+            continue
+        if char in _SMALL_Y and parts and i > 0 and chars[i - 1] in _KANA:
+            # Contracted sounds such as きゃ (kya) and しゃ (sha)
+            stem = parts[-1].removesuffix("i")
+            parts[-1] = stem + ("" if stem in ("sh", "ch", "j") else "y")
+            parts[-1] += _SMALL_Y[char]
+            continue
+        if char == "ー":
+            continue
+
+        romaji = _KANA.get(char)
+        if romaji is None:
+            parts.append(char)
+        else:
+            if geminate and romaji[0] not in "aeiou":
+                romaji = ("t" if romaji.startswith("ch") else romaji[0]) + romaji
+            parts.append(romaji)
+        geminate = False
+
+    return "".join(parts)
@@ -0,0 +1,117 @@
+"""Background pool running cache refreshes and prefetches."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.infrastructure.metrics.registry import default_registry
+from src.infrastructure.ratelimit.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+JOBS = default_registry.counter(
+    "lyrics_cache_background_jobs_total",
+    "Background cache jobs by pool and result",
+    ["pool", "result"],
+)
+QUEUE_DEPTH = default_registry.gauge(
+    "lyrics_cache_background_queue_depth",
+    "Background cache jobs waiting for a worker",
+    ["pool"],
+)
+
+Refresh = Callable[[], Awaitable[None]]
+
+
+class BackgroundRefresher:
+    """
+    Small worker pool that runs cache work off the request path.
+
+    Jobs are deduplicated by key and dropped when the queue is full, since
+    they only warm or refresh the cache and a later lookup can schedule
+    them again. An optional rate limiter gives the pool its own budget, so
+    background work never crowds out lookups for requests someone is
+    waiting on.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 256,
+        rate_limiter: RateLimiter | None = None,
+        name: str = "refresh",
+    ) -> None:
+        """
+        Initialize the pool; workers start with the first scheduled job.
+
+        Args:
+            workers: Number of concurrent jobs
+            queue_size: Maximum number of jobs waiting for a worker
+            rate_limiter: Budget jobs wait on before starting (optional)
+            name: Pool name used in metrics and logs
+        """
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+
+        self.workers = workers
+        self.rate_limiter = rate_limiter
+        self.name = name
+        self._queue: asyncio.Queue[tuple[str, Refresh]] = asyncio.Queue(queue_size)
+        self._scheduled: set[str] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        QUEUE_DEPTH.set_function(lambda: self._queue.qsize(), pool=name)
+
+    def schedule(self, key: str, refresh: Refresh) -> bool:
+        """
+        Queue a job unless one for the key is already pending.
+
+        Args:
+            key: Cache key the job works on
+            refresh: Coroutine factory performing the job
+
+        Returns:
+            Whether the job was queued
+        """
+        if key in self._scheduled:
+            return False
+        if self._queue.full():
+            JOBS.inc(pool=self.name, result="dropped")
+            return False
+
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+        self._scheduled.add(key)
+        self._queue.put_nowait((key, refresh))
+        JOBS.inc(pool=self.name, result="scheduled")
+        return True
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time."""
+        while True:
+            key, refresh = await self._queue.get()
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                await refresh()
+                JOBS.inc(pool=self.name, result="done")
+            except Exception as e:
+                JOBS.inc(pool=self.name, result="failed")
+                logger.warning(f"Background {self.name} of {key!r} failed: {e}")
+            finally:
+                self._scheduled.discard(key)
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued job has run."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the workers, abandoning queued jobs."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -0,0 +1,272 @@
+"""Caching decorator for lyrics repositories."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+
+import redis.asyncio as redis
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.cache.background_refresher import BackgroundRefresher
+from src.infrastructure.cache.lru_cache import TTLLRUCache
+from src.infrastructure.metrics.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+LOOKUPS = default_registry.counter(
+    "lyrics_cache_lookups_total", "Lyrics cache lookups by result", ["result"]
+)
+HIT_RATIO = default_registry.gauge(
+    "lyrics_cache_hit_ratio", "Fraction of lookups answered by either cache tier"
+)
+
+# Local cache entry recording that a lookup found nothing (compared by identity)
+_NOT_FOUND = Song(title="<not found>", artist="<not found>")
+
+# Redis value recording that a lookup found nothing
+_NOT_FOUND_MARKER = "null"
+
+
+@dataclass
+class LyricsCacheStats:
+    """Counters for the tiered lyrics cache."""
+
+    local_hits: int = 0
+    redis_hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups answered by either cache tier."""
+        hits = self.local_hits + self.redis_hits + self.negative_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+
+class CachedLyricsRepository(LyricsRepository):
+    """
+    Lyrics repository decorator with an in-process LRU and a Redis tier.
+
+    With a refresher, entries fetched more than ``refresh_after_seconds``
+    ago are still answered from the cache, and a background refresh
+    through the inner repository brings both tiers up to date
+    (stale-while-revalidate). The TTLs remain the hard limits.
+    """
+
+    def __init__(
+        self,
+        inner: LyricsRepository,
+        local_cache: TTLLRUCache[str, Song],
+        redis_client: redis.Redis | None = None,
+        redis_ttl_seconds: int = 86400,
+        key_prefix: str = "lyrics:cache:",
+        negative_ttl_seconds: float = 60.0,
+        refresher: BackgroundRefresher | None = None,
+        refresh_after_seconds: float = 21600.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            inner: Repository used on cache misses
+            local_cache: In-process LRU tier
+            redis_client: Shared Redis tier (optional, owned by this repository)
+            redis_ttl_seconds: TTL of entries stored in Redis
+            key_prefix: Prefix for Redis keys
+            negative_ttl_seconds: TTL of cached not-found lookups (0 disables)
+            refresher: Pool for background refreshes (optional, owned by this
+                repository)
+            refresh_after_seconds: Age after which a hit triggers a refresh
+        """
+        self.inner = inner
+        self.local_cache = local_cache
+        self.redis_client = redis_client
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.key_prefix = key_prefix
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.refresher = refresher
+        self.refresh_after_seconds = refresh_after_seconds
+        self._stats = LyricsCacheStats()
+        HIT_RATIO.set_function(lambda: self._stats.hit_ratio)
+
+    @property
+    def stats(self) -> LyricsCacheStats:
+        """Current cache counters."""
+        self._stats.evictions = self.local_cache.stats.evictions
+        return self._stats
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song, answering from the cache when possible.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        key = normalize_key(title, artist)
+
+        song = self.local_cache.get(key)
+        if song is _NOT_FOUND:
+            self._stats.negative_hits += 1
+            LOOKUPS.inc(result="negative_hit")
+            logger.debug(f"Negative cache hit: {key!r}")
+            return None
+        if song is not None:
+            self._stats.local_hits += 1
+            LOOKUPS.inc(result="local_hit")
+            logger.debug(f"Local cache hit: {key!r}")
+            self._refresh_if_stale(key, title, artist, song)
+            return song
+
+        song = await self._redis_get(key)
+        if song is _NOT_FOUND:
+            self._stats.negative_hits += 1
+            LOOKUPS.inc(result="negative_hit")
+            self.local_cache.set(key, song, ttl_seconds=self.negative_ttl_seconds)
+            logger.debug(f"Negative cache hit: {key!r}")
+            return None
+        if song is not None:
+            self._stats.redis_hits += 1
+            LOOKUPS.inc(result="redis_hit")
+            self.local_cache.set(key, song)
+            logger.debug(f"Redis cache hit: {key!r}")
+            self._refresh_if_stale(key, title, artist, song)
+            return song
+
+        self._stats.misses += 1
+        LOOKUPS.inc(result="miss")
+        song = await self.inner.search_song(title=title, artist=artist)
+
+        if song is None:
+            await self._store_not_found(key)
+        elif song.has_lyrics():
+            await self.store(key, song)
+
+        return song
+
+    async def refresh_song(self, title: str, artist: str) -> Song | None:
+        """
+        Look a song up through the inner repository and recache it.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        song = await self.inner.refresh_song(title=title, artist=artist)
+        if song is not None and song.has_lyrics():
+            await self.store(normalize_key(title, artist), song)
+        return song
+
+    def _refresh_if_stale(self, key: str, title: str, artist: str, song: Song) -> None:
+        """
+        Schedule a background refresh of an old cache hit.
+
+        A refresh that finds nothing leaves the cached song in place;
+        entries only disappear through their TTL.
+
+        Args:
+            key: Normalized lookup key
+            title: Requested title
+            artist: Requested artist
+            song: Song answered from the cache
+        """
+        if self.refresher is None or song.age_seconds() < self.refresh_after_seconds:
+            return
+
+        self._stats.stale_hits += 1
+        LOOKUPS.inc(result="stale_hit")
+
+        async def refresh() -> None:
+            await self.refresh_song(title=title, artist=artist)
+
+        if self.refresher.schedule(key, refresh):
+            logger.debug(f"Scheduled refresh of stale entry: {key!r}")
+
+    async def store(self, key: str, song: Song) -> None:
+        """
+        Store a song in both cache tiers.
+
+        Args:
+            key: Normalized lookup key
+            song: Song to cache
+        """
+        self.local_cache.set(key, song)
+        await self._redis_set(key, song)
+
+    async def _store_not_found(self, key: str) -> None:
+        """
+        Remember for a short while that a lookup found nothing.
+
+        Errors are raised by the inner repository rather than returned as
+        None, so only genuine misses end up in the negative cache.
+
+        Args:
+            key: Normalized lookup key
+        """
+        if self.negative_ttl_seconds <= 0:
+            return
+
+        self.local_cache.set(key, _NOT_FOUND, ttl_seconds=self.negative_ttl_seconds)
+
+        if self.redis_client is None:
+            return
+
+        try:
+            await self.redis_client.set(
+                self.key_prefix + key,
+                _NOT_FOUND_MARKER,
+                px=max(1, int(self.negative_ttl_seconds * 1000)),
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for {key!r}: {e}")
+
+    async def _redis_get(self, key: str) -> Song | None:
+        """Read a song, or the not-found marker, from the Redis tier."""
+        if self.redis_client is None:
+            return None
+
+        try:
+            raw = await self.redis_client.get(self.key_prefix + key)
+            if raw is None:
+                return None
+            if raw == _NOT_FOUND_MARKER:
+                return _NOT_FOUND
+            return Song(**json.loads(raw))
+        except Exception as e:
+            logger.warning(f"Redis cache read failed for {key!r}: {e}")
+            return None
+
+    async def _redis_set(self, key: str, song: Song) -> None:
+        """Write a song to the Redis tier."""
+        if self.redis_client is None:
+            return
+
+        try:
+            await self.redis_client.set(
+                self.key_prefix + key,
+                json.dumps(asdict(song), ensure_ascii=False),
+                ex=self.redis_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for {key!r}: {e}")
+
+    async def close(self) -> None:
+        """Stop refreshing and close the inner repository and the Redis tier."""
+        if self.refresher is not None:
+            await self.refresher.close()
+        await self.inner.close()
+        if self.redis_client is not None:
+            await self.redis_client.close()
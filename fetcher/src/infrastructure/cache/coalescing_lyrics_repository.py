@@ -0,0 +1,67 @@
+"""Request-coalescing decorator for lyrics repositories."""
+
+from __future__ import annotations
+
+import logging
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.concurrency.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingLyricsRepository(LyricsRepository):
+    """Share one upstream lookup between identical concurrent searches."""
+
+    def __init__(self, inner: LyricsRepository) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            inner: Repository performing the actual lookup
+        """
+        self.inner = inner
+        self._flights: SingleFlight[str, Song | None] = SingleFlight()
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of searches answered by joining an in-flight lookup."""
+        return self._flights.followers
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song, joining an identical in-flight search if any.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        key = normalize_key(title, artist)
+        if key in self._flights:
+            logger.debug(f"Joining in-flight search: {key!r}")
+
+        return await self._flights.do(
+            key, lambda: self.inner.search_song(title=title, artist=artist)
+        )
+
+    async def refresh_song(self, title: str, artist: str) -> Song | None:
+        """
+        Refresh a song through the inner repository without coalescing.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        return await self.inner.refresh_song(title=title, artist=artist)
+
+    async def close(self) -> None:
+        """Close the inner repository."""
+        await self.inner.close()
@@ -0,0 +1,145 @@
+"""On-disk store decorator for lyrics repositories."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import TypeVar
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.cache.segment_store import SegmentStore
+from src.infrastructure.metrics.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LOOKUPS = default_registry.counter(
+    "lyrics_store_lookups_total",
+    "Persistent lyrics store lookups by result",
+    ["result"],
+)
+STORE_BYTES = default_registry.gauge(
+    "lyrics_store_bytes", "Size of the persistent lyrics store segment"
+)
+
+
+class PersistentLyricsRepository(LyricsRepository):
+    """
+    Lyrics repository decorator backed by a local segment store.
+
+    Found songs with lyrics are written to disk, so a restarted fetcher
+    answers its working set without going upstream. Not-found results are
+    left to the negative cache, since songs may be published later.
+
+    Store reads and writes block on disk, so they run on a single
+    dedicated thread, which also keeps them in order. Compaction is queued
+    on that thread after the write that made it due, so no request waits
+    for it, though lookups arriving meanwhile queue behind it.
+    """
+
+    def __init__(self, inner: LyricsRepository, store: SegmentStore) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            inner: Repository used when the store has no entry
+            store: Open segment store (owned by this repository)
+        """
+        self.inner = inner
+        self.store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="lyrics-store"
+        )
+        self._compaction: Future[bool] | None = None
+        STORE_BYTES.set_function(lambda: self.store.size_bytes)
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song, answering from the store when possible.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        key = normalize_key(title, artist)
+
+        song = await self._get(key)
+        if song is not None:
+            LOOKUPS.inc(result="hit")
+            logger.debug(f"Persistent store hit: {key!r}")
+            return song
+
+        LOOKUPS.inc(result="miss")
+        song = await self.inner.search_song(title=title, artist=artist)
+        if song is not None and song.has_lyrics():
+            await self._put(key, song)
+        return song
+
+    async def refresh_song(self, title: str, artist: str) -> Song | None:
+        """
+        Look a song up through the inner repository and store it again.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        song = await self.inner.refresh_song(title=title, artist=artist)
+        if song is not None and song.has_lyrics():
+            await self._put(normalize_key(title, artist), song)
+        return song
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        """Run a store operation on the store thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn)
+
+    async def _get(self, key: str) -> Song | None:
+        """Read a song from the store, treating unreadable entries as misses."""
+        try:
+            raw = await self._run(lambda: self.store.get(key))
+            return None if raw is None else Song(**json.loads(raw))
+        except Exception as e:
+            logger.warning(f"Persistent store read failed for {key!r}: {e}")
+            return None
+
+    async def _put(self, key: str, song: Song) -> None:
+        """Write a song to the store, queueing compaction if it is due."""
+        value = json.dumps(asdict(song), ensure_ascii=False).encode()
+
+        def write() -> bool:
+            self.store.put(key, value)
+            return self.store.compaction_due()
+
+        try:
+            due = await self._run(write)
+        except Exception as e:
+            logger.warning(f"Persistent store write failed for {key!r}: {e}")
+            return
+        if due and self._compaction is None:
+            self._compaction = self._executor.submit(self.store.compact_if_due)
+            self._compaction.add_done_callback(self._compaction_done)
+
+    def _compaction_done(self, future: Future[bool]) -> None:
+        """Log a failed background compaction and allow the next one."""
+        self._compaction = None
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Persistent store compaction failed: {future.exception()}")
+
+    async def close(self) -> None:
+        """Close the inner repository and the store."""
+        await self.inner.close()
+        # Runs after any queued compaction, since the store thread is FIFO
+        await self._run(self.store.close)
+        self._executor.shutdown()
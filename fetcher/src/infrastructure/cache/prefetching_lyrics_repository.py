@@ -0,0 +1,189 @@
+"""Prefetching decorator for lyrics repositories."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.repositories.related_songs_repository import RelatedSongsRepository
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.cache.background_refresher import BackgroundRefresher
+from src.infrastructure.cache.lru_cache import TTLLRUCache
+from src.infrastructure.metrics.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+PREFETCHES = default_registry.counter(
+    "lyrics_prefetches_total",
+    "Related songs looked up ahead of time by result",
+    ["result"],
+)
+PREFETCH_HITS = default_registry.counter(
+    "lyrics_prefetch_hits_total", "Requests for a song prefetched beforehand"
+)
+PREFETCH_HIT_RATIO = default_registry.gauge(
+    "lyrics_prefetch_hit_ratio", "Fraction of prefetched songs requested afterwards"
+)
+
+
+@dataclass
+class PrefetchStats:
+    """Counters for related-song prefetching."""
+
+    expansions: int = 0
+    prefetched: int = 0
+    hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of prefetched songs requested afterwards."""
+        return self.hits / self.prefetched if self.prefetched else 0.0
+
+
+class PrefetchingLyricsRepository(LyricsRepository):
+    """
+    Lyrics repository decorator warming the cache with related songs.
+
+    After a successful search, the songs most likely to be requested next
+    (e.g. the following tracks of the album) are looked up through the
+    inner repository on a background pool, so that follow-up requests hit
+    the cache. The pool has its own rate budget, and a song's related
+    songs are only looked up once per ``remember_seconds``. Only songs
+    that were not cached yet count as prefetched for the hit ratio.
+    """
+
+    def __init__(
+        self,
+        inner: LyricsRepository,
+        related: RelatedSongsRepository,
+        pool: BackgroundRefresher,
+        max_songs: int = 5,
+        remember_seconds: float = 3600.0,
+        max_remembered: int = 4096,
+    ) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            inner: Caching repository prefetched songs are looked up through
+            related: Source of related songs (owned by this repository)
+            pool: Background pool running the lookups (owned by this
+                repository)
+            max_songs: Maximum number of songs prefetched per search
+            remember_seconds: Time a song's related songs count as prefetched
+                and a prefetched song counts towards the hit ratio
+            max_remembered: Maximum number of songs remembered for either
+        """
+        self.inner = inner
+        self.related = related
+        self.pool = pool
+        self.max_songs = max_songs
+        self._expanded = TTLLRUCache[str, bool](
+            max_entries=max_remembered, ttl_seconds=remember_seconds
+        )
+        self._prefetched = TTLLRUCache[str, bool](
+            max_entries=max_remembered, ttl_seconds=remember_seconds
+        )
+        self._stats = PrefetchStats()
+        PREFETCH_HIT_RATIO.set_function(lambda: self._stats.hit_ratio)
+
+    @property
+    def stats(self) -> PrefetchStats:
+        """Current prefetch counters."""
+        return self._stats
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song and schedule prefetching of its related songs.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        key = normalize_key(title, artist)
+        if self._prefetched.get(key):
+            self._prefetched.delete(key)
+            self._stats.hits += 1
+            PREFETCH_HITS.inc()
+            logger.debug(f"Request for prefetched song: {key!r}")
+
+        song = await self.inner.search_song(title=title, artist=artist)
+        if song is not None and song.has_lyrics():
+            self._expand(key, song)
+        return song
+
+    async def refresh_song(self, title: str, artist: str) -> Song | None:
+        """
+        Refresh a song through the inner repository without prefetching.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+        """
+        return await self.inner.refresh_song(title=title, artist=artist)
+
+    def _expand(self, key: str, song: Song) -> None:
+        """
+        Schedule the lookup of a song's related songs.
+
+        Args:
+            key: Normalized key of the requested song
+            song: Song found for the request
+        """
+        if self._expanded.get(key):
+            return
+
+        async def expand() -> None:
+            songs = await self.related.related_songs(song=song, limit=self.max_songs)
+            for related_title, related_artist in songs:
+                self._schedule_prefetch(related_title, related_artist)
+
+        if self.pool.schedule(f"related:{key}", expand):
+            self._expanded.set(key, True)
+            self._stats.expansions += 1
+
+    def _schedule_prefetch(self, title: str, artist: str) -> None:
+        """
+        Schedule the lookup of a single related song.
+
+        Args:
+            title: Related song title
+            artist: Related song artist
+        """
+        key = normalize_key(title, artist)
+        if self._prefetched.get(key):
+            return
+
+        async def prefetch() -> None:
+            started = time.time()
+            # The inner repository caches the song; searching it through
+            # self would prefetch the related songs of related songs
+            song = await self.inner.search_song(title=title, artist=artist)
+            if song is None or not song.has_lyrics():
+                PREFETCHES.inc(result="not_found")
+                return
+            if song.fetched_at < started:
+                # Answered by a cache tier, so nothing was fetched ahead of
+                # time and a later request says nothing about prefetching
+                PREFETCHES.inc(result="cached")
+                return
+            self._prefetched.set(key, True)
+            self._stats.prefetched += 1
+            PREFETCHES.inc(result="found")
+
+        self.pool.schedule(f"song:{key}", prefetch)
+
+    async def close(self) -> None:
+        """Stop prefetching and close the related-song source and inner repository."""
+        await self.pool.close()
+        await self.related.close()
+        await self.inner.close()
@@ -0,0 +1,472 @@
+"""Persistent key-value store of an append-only segment and a mapped index."""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+from src.infrastructure.metrics.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+COMPACTIONS = default_registry.counter(
+    "lyrics_store_compactions_total", "Segment store compactions by reason", ["reason"]
+)
+EVICTIONS = default_registry.counter(
+    "lyrics_store_evictions_total", "Records dropped to keep the store under its cap"
+)
+
+SEGMENT_FILE = "segment.dat"
+INDEX_FILE = "index.bin"
+VERSION = 1
+
+# magic, version, generation
+_SEGMENT_HEADER = struct.Struct("<4sHxxQ")
+# magic, version, generation, slot count, used slots, indexed segment length
+_INDEX_HEADER = struct.Struct("<4sHxxQQQQ")
+# key hash, record offset (0 = empty slot), record length
+_SLOT = struct.Struct("<QQI")
+# crc32 of key and value, key length, value length
+_RECORD_HEADER = struct.Struct("<III")
+
+_SEGMENT_MAGIC = b"LYRS"
+_INDEX_MAGIC = b"LYRI"
+
+# Slots are doubled once this fraction of them is used
+MAX_LOAD = 0.7
+# Size the store is trimmed to when compaction runs because of the cap
+EVICT_TO = 0.8
+# Dead-space compaction is not worth it for tiny segments
+MIN_COMPACT_BYTES = 1 << 20
+
+
+def _key_hash(key: bytes) -> int:
+    """64-bit hash of a key (0 is never returned)."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+class SegmentStore:
+    """
+    Append-only key-value store that survives restarts.
+
+    Records are appended to a segment file; an open-addressing hash table
+    of (key hash, offset, length) slots lives in a separate file that is
+    memory-mapped, so opening the store costs one mmap call rather than a
+    scan of the segment. Overwritten records stay in the segment as dead
+    space until compaction rewrites the live ones. Once the segment grows
+    past ``max_bytes``, compaction also drops the oldest records. Writes
+    never compact by themselves; callers run compact_if_due() when it
+    suits them, e.g. in the background.
+
+    Every read verifies the record checksum and key, so an index that
+    points past a torn write after a crash answers a miss instead of
+    garbage. Records appended after the index was last synced are replayed
+    on open. The store is single-writer: the segment is locked while open.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        initial_slots: int = 4096,
+        compact_ratio: float = 0.5,
+    ) -> None:
+        """
+        Open the store, creating it if needed.
+
+        Args:
+            directory: Directory holding the segment and index files
+            max_bytes: Segment size that triggers compaction with eviction
+            initial_slots: Index slots of a new store
+            compact_ratio: Fraction of dead space that triggers compaction
+
+        Raises:
+            ValueError: If ``max_bytes`` is too small to hold any record
+            RuntimeError: If another process has the store open
+        """
+        if max_bytes <= _SEGMENT_HEADER.size:
+            raise ValueError("max_bytes is too small to hold any record")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.initial_slots = initial_slots
+        self.compact_ratio = compact_ratio
+        self._generation = 0
+        self._end = 0
+        self._live_bytes = 0
+        self._index: mmap.mmap | None = None
+
+        directory.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(directory / SEGMENT_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(self._fd)
+            raise RuntimeError(f"Segment store {directory} is in use") from None
+
+        self._open_segment()
+        self._open_index()
+
+    @property
+    def size_bytes(self) -> int:
+        """Length of the segment file, dead records included."""
+        return self._end
+
+    @property
+    def live_bytes(self) -> int:
+        """Bytes of the segment taken by records the index points to."""
+        return self._live_bytes
+
+    def __len__(self) -> int:
+        """Number of stored keys."""
+        return self._header()[4]
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Read the value stored for a key.
+
+        Args:
+            key: Record key
+
+        Returns:
+            The stored value, or None if the key is unknown
+        """
+        key_bytes = key.encode()
+        slot, found = self._find(_key_hash(key_bytes))
+        if not found:
+            return None
+
+        _, offset, length = self._slot(slot)
+        return self._read_record(offset, length, key_bytes)
+
+    def put(self, key: str, value: bytes) -> None:
+        """
+        Store a value, replacing any earlier value of the key.
+
+        Values too large to ever fit under the cap are not stored.
+
+        Args:
+            key: Record key
+            value: Value to store
+        """
+        key_bytes = key.encode()
+        record = (
+            _RECORD_HEADER.pack(
+                zlib.crc32(key_bytes + value), len(key_bytes), len(value)
+            )
+            + key_bytes
+            + value
+        )
+        if len(record) > self.max_bytes * EVICT_TO - _SEGMENT_HEADER.size:
+            logger.warning(f"Not storing {key!r}: {len(record)} bytes exceeds the cap")
+            return
+
+        offset = self._end
+        os.pwrite(self._fd, record, offset)
+        self._end += len(record)
+        self._insert(_key_hash(key_bytes), offset, len(record))
+        self._set_header(segment_end=self._end)
+
+    def compaction_due(self) -> bool:
+        """Whether the segment is over its cap or has too much dead space."""
+        return self._end > self.max_bytes or (
+            self._end >= MIN_COMPACT_BYTES
+            and self._end - _SEGMENT_HEADER.size - self._live_bytes
+            > self._end * self.compact_ratio
+        )
+
+    def compact_if_due(self) -> bool:
+        """
+        Compact the segment if compaction_due() says so.
+
+        Returns:
+            Whether the segment was compacted
+        """
+        if not self.compaction_due():
+            return False
+        self.compact(evict=self._end > self.max_bytes)
+        return True
+
+    def compact(self, evict: bool = False) -> None:
+        """
+        Rewrite the segment with only the live records.
+
+        The new segment and index are written next to the old ones and
+        swapped in with renames; a crash in between leaves a generation
+        mismatch that makes the next open rebuild the index by scanning.
+
+        Args:
+            evict: Also drop the oldest records until the store is at
+                ``EVICT_TO`` of its cap
+        """
+        entries = sorted(
+            (offset, length, key_hash)
+            for key_hash, offset, length in self._slots()
+            if offset
+        )
+        dropped = 0
+        if evict:
+            target = self.max_bytes * EVICT_TO - _SEGMENT_HEADER.size
+            live = self._live_bytes
+            while dropped < len(entries) and live > target:
+                live -= entries[dropped][1]
+                dropped += 1
+            EVICTIONS.inc(dropped)
+        COMPACTIONS.inc(reason="cap" if evict else "dead_space")
+        logger.info(
+            f"Compacting segment store {self.directory}: "
+            f"{self._end} bytes, {len(entries)} records, {dropped} evicted"
+        )
+
+        generation = self._generation + 1
+        segment_path = self.directory / SEGMENT_FILE
+        tmp_path = segment_path.with_suffix(".tmp")
+        moved: list[tuple[int, int, int]] = []
+        with tmp_path.open("wb") as file:
+            file.write(_SEGMENT_HEADER.pack(_SEGMENT_MAGIC, VERSION, generation))
+            position = _SEGMENT_HEADER.size
+            for offset, length, key_hash in entries[dropped:]:
+                file.write(os.pread(self._fd, length, offset))
+                moved.append((key_hash, position, length))
+                position += length
+            file.flush()
+            os.fsync(file.fileno())
+
+        fd = os.open(tmp_path, os.O_RDWR)
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.replace(tmp_path, segment_path)
+        os.close(self._fd)
+        self._fd = fd
+        self._generation = generation
+        self._end = position
+
+        slots = self.initial_slots
+        while len(moved) >= slots * MAX_LOAD:
+            slots *= 2
+        self._create_index(slots)
+        for key_hash, offset, length in moved:
+            self._insert(key_hash, offset, length)
+        self._set_header(segment_end=self._end)
+        self.sync()
+
+    def sync(self) -> None:
+        """Flush the segment and index to disk."""
+        os.fsync(self._fd)
+        if self._index is not None:
+            self._index.flush()
+
+    def close(self) -> None:
+        """Sync and close the store."""
+        if self._index is None:
+            return
+        self.sync()
+        self._index.close()
+        self._index = None
+        os.close(self._fd)
+
+    def _open_segment(self) -> None:
+        """Validate the segment header, starting a new segment if needed."""
+        size = os.fstat(self._fd).st_size
+        header = os.pread(self._fd, _SEGMENT_HEADER.size, 0)
+        if size >= _SEGMENT_HEADER.size:
+            magic, version, generation = _SEGMENT_HEADER.unpack(header)
+            if magic == _SEGMENT_MAGIC and version == VERSION:
+                self._generation = generation
+                self._end = size
+                return
+            logger.warning(f"Discarding unreadable segment store in {self.directory}")
+        elif size:
+            logger.warning(f"Discarding truncated segment store in {self.directory}")
+
+        self._generation += 1
+        (self.directory / INDEX_FILE).unlink(missing_ok=True)
+        os.ftruncate(self._fd, 0)
+        os.pwrite(
+            self._fd, _SEGMENT_HEADER.pack(_SEGMENT_MAGIC, VERSION, self._generation), 0
+        )
+        self._end = _SEGMENT_HEADER.size
+
+    def _open_index(self) -> None:
+        """Map the index, rebuilding it from the segment if it is stale."""
+        path = self.directory / INDEX_FILE
+        if path.exists() and path.stat().st_size >= _INDEX_HEADER.size:
+            with path.open("r+b") as file:
+                self._index = mmap.mmap(file.fileno(), 0)
+            magic, version, generation, slots, _, segment_end = self._header()
+            if (
+                magic == _INDEX_MAGIC
+                and version == VERSION
+                and generation == self._generation
+                and len(self._index) == _INDEX_HEADER.size + slots * _SLOT.size
+                and segment_end <= self._end
+            ):
+                self._live_bytes = sum(length for _, _, length in self._slots())
+                # Replay records appended after the index was last synced
+                self._scan(segment_end)
+                return
+            self._index.close()
+            self._index = None
+
+        logger.info(f"Rebuilding segment store index in {self.directory}")
+        self._create_index(self.initial_slots)
+        self._scan(_SEGMENT_HEADER.size)
+
+    def _create_index(self, slots: int) -> None:
+        """Replace the index with an empty one of the given size."""
+        path = self.directory / INDEX_FILE
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w+b") as file:
+            file.truncate(_INDEX_HEADER.size + slots * _SLOT.size)
+            index = mmap.mmap(file.fileno(), 0)
+        _INDEX_HEADER.pack_into(
+            index, 0, _INDEX_MAGIC, VERSION, self._generation, slots, 0, 0
+        )
+        os.replace(tmp_path, path)
+
+        if self._index is not None:
+            self._index.close()
+        self._index = index
+        self._live_bytes = 0
+
+    def _scan(self, start: int) -> None:
+        """Index the records from an offset to the end of the segment."""
+        offset = start
+        for offset, key_bytes, _, length in self._records(start):
+            self._insert(_key_hash(key_bytes), offset, length)
+            offset += length
+
+        if offset < self._end:
+            logger.warning(
+                f"Truncating torn segment store tail at {offset} in {self.directory}"
+            )
+            os.ftruncate(self._fd, offset)
+            self._end = offset
+        self._set_header(segment_end=self._end)
+
+    def _records(self, start: int) -> Iterator[tuple[int, bytes, bytes, int]]:
+        """Yield (offset, key, value, length) of intact records from an offset."""
+        offset = start
+        while offset + _RECORD_HEADER.size <= self._end:
+            header = os.pread(self._fd, _RECORD_HEADER.size, offset)
+            checksum, key_length, value_length = _RECORD_HEADER.unpack(header)
+            length = _RECORD_HEADER.size + key_length + value_length
+            if offset + length > self._end:
+                return
+            body = os.pread(self._fd, key_length + value_length, offset + len(header))
+            if zlib.crc32(body) != checksum:
+                return
+            yield offset, body[:key_length], body[key_length:], length
+            offset += length
+
+    def _read_record(self, offset: int, length: int, key_bytes: bytes) -> bytes | None:
+        """Read a record's value, checking its checksum and key."""
+        data = os.pread(self._fd, length, offset)
+        if len(data) != length:
+            return None
+        checksum, key_length, value_length = _RECORD_HEADER.unpack_from(data)
+        body = data[_RECORD_HEADER.size :]
+        if (
+            key_length + value_length != len(body)
+            or zlib.crc32(body) != checksum
+            or body[:key_length] != key_bytes
+        ):
+            return None
+        return body[key_length:]
+
+    def _header(self) -> tuple[bytes, int, int, int, int, int]:
+        """Unpack the index header."""
+        assert self._index is not None
+        header: tuple[bytes, int, int, int, int, int] = _INDEX_HEADER.unpack_from(
+            self._index
+        )
+        return header
+
+    def _set_header(
+        self, used: int | None = None, segment_end: int | None = None
+    ) -> None:
+        """Update the slot count in use and the indexed segment length."""
+        magic, version, generation, slots, old_used, old_end = self._header()
+        assert self._index is not None
+        _INDEX_HEADER.pack_into(
+            self._index,
+            0,
+            magic,
+            version,
+            generation,
+            slots,
+            old_used if used is None else used,
+            old_end if segment_end is None else segment_end,
+        )
+
+    def _slot(self, slot: int) -> tuple[int, int, int]:
+        """Unpack one index slot."""
+        assert self._index is not None
+        entry: tuple[int, int, int] = _SLOT.unpack_from(
+            self._index, _INDEX_HEADER.size + slot * _SLOT.size
+        )
+        return entry
+
+    def _slots(self) -> Iterator[tuple[int, int, int]]:
+        """Unpack every index slot, empty ones included."""
+        assert self._index is not None
+        yield from _SLOT.iter_unpack(self._index[_INDEX_HEADER.size :])
+
+    def _find(self, key_hash: int) -> tuple[int, bool]:
+        """
+        Probe for a key hash.
+
+        Keys are told apart by their 64-bit hash alone; a collision makes
+        two keys share a slot, and reads then miss on the key check.
+
+        Returns:
+            The slot holding the hash, or the empty slot ending the probe,
+            and whether the hash was found
+        """
+        slots = self._header()[3]
+        slot = key_hash % slots
+        while True:
+            stored_hash, offset, _ = self._slot(slot)
+            if not offset:
+                return slot, False
+            if stored_hash == key_hash:
+                return slot, True
+            slot = (slot + 1) % slots
+
+    def _insert(self, key_hash: int, offset: int, length: int) -> None:
+        """Point a key hash at a record, growing the index when it fills up."""
+        slot, found = self._find(key_hash)
+        _, _, _, slots, used, _ = self._header()
+        if found:
+            self._live_bytes -= self._slot(slot)[2]
+        elif used + 1 > slots * MAX_LOAD:
+            self._grow(slots * 2)
+            self._insert(key_hash, offset, length)
+            return
+        else:
+            self._set_header(used=used + 1)
+
+        assert self._index is not None
+        _SLOT.pack_into(
+            self._index,
+            _INDEX_HEADER.size + slot * _SLOT.size,
+            key_hash,
+            offset,
+            length,
+        )
+        self._live_bytes += length
+
+    def _grow(self, slots: int) -> None:
+        """Rehash the index into a larger table."""
+        entries = [entry for entry in self._slots() if entry[1]]
+        segment_end = self._header()[5]
+        self._create_index(slots)
+        for key_hash, offset, length in entries:
+            self._insert(key_hash, offset, length)
+        self._set_header(segment_end=segment_end)
@@ -0,0 +1,149 @@
+"""Bounded work queue with a high- and a low-priority lane."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from typing import Generic, TypeVar
+
+from src.domain.entities.priority import Priority
+
+T = TypeVar("T")
+
+
+class PriorityWorkQueue(Generic[T]):
+    """
+    Work queue that keeps workers free for high-priority items.
+
+    Both lanes share one capacity. Low-priority items never occupy more
+    than ``workers - reserved_workers`` workers at a time, so that many
+    workers are always left for high-priority items, while low-priority
+    work still gets every worker the reservation does not cover. When both
+    lanes have work, a low-priority item is taken after every
+    ``high_weight`` high-priority ones, so a steady stream of interactive
+    requests slows bulk work down without starving it.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        workers: int,
+        reserved_workers: int = 0,
+        high_weight: int = 4,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            capacity: Maximum number of waiting items across both lanes
+            workers: Number of workers taking items
+            reserved_workers: Workers low-priority items may not occupy
+                (at least one worker is always left to them)
+            high_weight: High-priority items taken per low-priority one
+                while both lanes have work
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if high_weight <= 0:
+            raise ValueError("high_weight must be positive")
+
+        self.capacity = capacity
+        self.high_weight = high_weight
+        self.low_worker_limit = max(1, workers - reserved_workers)
+        self._lanes: dict[Priority, deque[T]] = {p: deque() for p in Priority}
+        self._in_flight: Counter[Priority] = Counter()
+        self._high_streak = 0
+        self._changed = asyncio.Condition()
+
+    def qsize(self, priority: Priority | None = None) -> int:
+        """Number of waiting items, in one lane or in both."""
+        if priority is not None:
+            return len(self._lanes[priority])
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def in_flight(self, priority: Priority) -> int:
+        """Number of items of a lane taken but not yet done."""
+        return self._in_flight[priority]
+
+    def full(self) -> bool:
+        """Whether a new item has to wait for room."""
+        return self.qsize() >= self.capacity
+
+    async def put(self, item: T, priority: Priority) -> None:
+        """
+        Add an item, waiting for room if the queue is full.
+
+        Args:
+            item: Item to queue
+            priority: Lane of the item
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: not self.full())
+            self._lanes[priority].append(item)
+            self._changed.notify_all()
+
+    def pop_oldest(self, priority: Priority) -> T | None:
+        """Remove the longest-waiting item of a lane, if any."""
+        lane = self._lanes[priority]
+        return lane.popleft() if lane else None
+
+    def pop_newest(self, priority: Priority) -> T | None:
+        """Remove the most recently queued item of a lane, if any."""
+        lane = self._lanes[priority]
+        return lane.pop() if lane else None
+
+    async def get(self) -> tuple[T, Priority]:
+        """
+        Take the next item a worker may run.
+
+        Returns:
+            The item and its lane; pass the lane to task_done() when the
+            item is finished
+        """
+        async with self._changed:
+            lane = await self._changed.wait_for(self._next_lane)
+            # wait_for() only returns once the predicate picked a lane
+            assert lane is not None
+            if lane is Priority.HIGH:
+                self._high_streak += 1
+            else:
+                self._high_streak = 0
+            self._in_flight[lane] += 1
+            item = self._lanes[lane].popleft()
+            self._changed.notify_all()
+            return item, lane
+
+    def _next_lane(self) -> Priority | None:
+        """Pick the lane to take from, or None if no item may run now."""
+        high = bool(self._lanes[Priority.HIGH])
+        low = (
+            bool(self._lanes[Priority.LOW])
+            and self._in_flight[Priority.LOW] < self.low_worker_limit
+        )
+        if high and low:
+            return (
+                Priority.LOW if self._high_streak >= self.high_weight else Priority.HIGH
+            )
+        if high:
+            return Priority.HIGH
+        if low:
+            return Priority.LOW
+        return None
+
+    async def task_done(self, priority: Priority) -> None:
+        """
+        Mark an item taken with get() as finished.
+
+        Args:
+            priority: Lane returned by get()
+        """
+        async with self._changed:
+            self._in_flight[priority] -= 1
+            self._changed.notify_all()
+
+    async def join(self) -> None:
+        """Wait until every queued item has been taken and finished."""
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: not self.qsize() and not sum(self._in_flight.values())
+            )
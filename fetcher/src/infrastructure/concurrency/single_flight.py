@@ -0,0 +1,87 @@
+"""Single-flight execution of concurrent calls sharing a key."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Flight(Generic[V]):
+    """An in-flight call and the number of callers waiting on it."""
+
+    task: asyncio.Task[V]
+    waiters: int = 0
+
+
+class SingleFlight(Generic[K, V]):
+    """Run at most one call per key at a time and share its outcome."""
+
+    def __init__(self) -> None:
+        """Initialize an empty flight table."""
+        self._flights: dict[K, _Flight[V]] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a call for ``key`` is currently in flight."""
+        return key in self._flights
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being executed."""
+        return len(self._flights)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """
+        Execute ``fn`` once for concurrent callers sharing ``key``.
+
+        The first caller starts the call; later callers join it and receive
+        the same result or exception. A caller that is cancelled leaves the
+        flight, and the call itself is cancelled once nobody is waiting; the
+        flight is forgotten first, so later callers start a new call.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine factory performing the actual work
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            RuntimeError: If the shared call was cancelled although this
+                caller was not
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.leaders += 1
+        else:
+            self.followers += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is None or current.cancelling():
+                if flight.waiters == 1 and not flight.task.done():
+                    self._forget(key, flight)
+                    flight.task.cancel()
+                raise
+            # Only the shared call was cancelled, which must not look like a
+            # cancellation of this caller
+            raise RuntimeError(f"Shared call for {key!r} was cancelled") from None
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: K, flight: _Flight[V]) -> None:
+        """Drop a finished flight so the next call starts fresh."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
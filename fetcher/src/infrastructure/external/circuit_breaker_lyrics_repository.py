@@ -0,0 +1,74 @@
+"""Circuit-breaking decorator for lyrics repositories."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.infrastructure.resilience.circuit_breaker import CircuitBreaker
+
+
+class CircuitBreakerLyricsRepository(LyricsRepository):
+    """
+    Fail fast instead of querying a lyrics source that keeps failing.
+
+    While the breaker is open, searches raise UpstreamUnavailableError
+    without waiting for the source's timeouts, so workers move on to
+    requests the caches or another provider can answer.
+
+    Besides raised errors, a hit that comes back without lyrics counts as
+    a failure: providers swallow lyrics-page errors and return the bare
+    hit, so a source whose pages all fail would otherwise look healthy.
+    A song that was not found is a healthy answer.
+    """
+
+    def __init__(self, inner: LyricsRepository, breaker: CircuitBreaker) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            inner: Repository querying the upstream source
+            breaker: Breaker tracking the source's health
+        """
+        self.inner = inner
+        self.breaker = breaker
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song if the breaker allows it.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+
+        Raises:
+            UpstreamUnavailableError: If the breaker rejected the call
+        """
+        permit = self.breaker.acquire()
+        started = time.monotonic()
+
+        try:
+            song = await self.inner.search_song(title=title, artist=artist)
+        except asyncio.CancelledError:
+            # Cancelled by a deadline or hedge, which says nothing about health
+            self.breaker.release(permit)
+            raise
+        except Exception:
+            self.breaker.record(permit, time.monotonic() - started, failed=True)
+            raise
+
+        self.breaker.record(
+            permit,
+            time.monotonic() - started,
+            failed=song is not None and not song.has_lyrics(),
+        )
+        return song
+
+    async def close(self) -> None:
+        """Close the inner repository."""
+        await self.inner.close()
@@ -0,0 +1,207 @@
+"""Lyrics repository querying several providers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.infrastructure.tracing.tracer import default_tracer
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderMode(StrEnum):
+    """How the composite repository combines its providers."""
+
+    FALLBACK = "fallback"
+    HEDGED = "hedged"
+
+
+@dataclass
+class ProviderStats:
+    """Counters and recent latencies of one lyrics provider."""
+
+    requests: int = 0
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    cancelled: int = 0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=200))
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of completed lookups that returned lyrics."""
+        completed = self.hits + self.misses + self.errors
+        return self.hits / completed if completed else 0.0
+
+    def latency_quantile(self, quantile: float) -> float | None:
+        """
+        Latency at the given quantile over the recent window.
+
+        Args:
+            quantile: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(quantile * len(ordered)))
+        return ordered[index]
+
+
+class CompositeLyricsRepository(LyricsRepository):
+    """
+    Lyrics repository that queries providers in priority order.
+
+    In fallback mode the next provider is only asked after the previous one
+    missed or failed. In hedged mode the next provider is additionally
+    started when the running ones have not answered within the p95 latency
+    of the last started provider, and the first result with lyrics wins.
+
+    A song without lyrics is only returned when no provider has lyrics.
+    None is returned only when every provider answered that it has no
+    match; if any provider failed instead, its error is raised so the miss
+    is not mistaken for a definitive one.
+    """
+
+    def __init__(
+        self,
+        providers: dict[str, LyricsRepository],
+        mode: ProviderMode = ProviderMode.FALLBACK,
+        hedge_delay_seconds: float = 1.0,
+        hedge_min_samples: int = 20,
+    ) -> None:
+        """
+        Initialize the composite repository.
+
+        Args:
+            providers: Providers by name, in priority order
+            mode: Whether to wait for each provider or hedge slow ones
+            hedge_delay_seconds: Hedge delay used until a provider has enough
+                latency samples for a p95 estimate
+            hedge_min_samples: Samples needed before the p95 is trusted
+        """
+        if not providers:
+            raise ValueError("At least one provider is required")
+
+        self.providers = providers
+        self.mode = ProviderMode(mode)
+        self.hedge_delay_seconds = hedge_delay_seconds
+        self.hedge_min_samples = hedge_min_samples
+        self._stats = {name: ProviderStats() for name in providers}
+
+    @property
+    def stats(self) -> dict[str, ProviderStats]:
+        """Per-provider counters and latencies."""
+        return self._stats
+
+    def hedge_delay(self, name: str) -> float:
+        """
+        How long to wait for a provider before starting the next one.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            The provider's p95 latency, or the configured default
+        """
+        stats = self._stats[name]
+        if len(stats.latencies) < self.hedge_min_samples:
+            return self.hedge_delay_seconds
+        p95 = stats.latency_quantile(0.95)
+        return self.hedge_delay_seconds if p95 is None else p95
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song across the providers.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+
+        Raises:
+            Exception: If no provider found the song and at least one failed
+        """
+        names = list(self.providers)
+        pending: dict[asyncio.Task[Song | None], str] = {}
+        fallback: Song | None = None
+        error: Exception | None = None
+
+        try:
+            while names or pending:
+                if names and (not pending or self.mode is ProviderMode.HEDGED):
+                    name = names.pop(0)
+                    task = asyncio.create_task(self._query(name, title, artist))
+                    pending[task] = name
+
+                timeout = None
+                if names and self.mode is ProviderMode.HEDGED:
+                    timeout = self.hedge_delay(name)
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.debug(f"Hedging {title} - {artist}: {name} is slow")
+
+                for task in done:
+                    pending.pop(task)
+                    try:
+                        song = task.result()
+                    except Exception as e:
+                        error = e
+                        continue
+
+                    if song is not None and song.has_lyrics():
+                        return song
+                    fallback = fallback or song
+        finally:
+            for task, name in pending.items():
+                task.cancel()
+                self._stats[name].cancelled += 1
+
+        if fallback is None and error is not None:
+            raise error
+        return fallback
+
+    async def _query(self, name: str, title: str, artist: str) -> Song | None:
+        """Ask one provider and record its outcome and latency."""
+        stats = self._stats[name]
+        stats.requests += 1
+        started = time.monotonic()
+
+        try:
+            with default_tracer.span("lyrics_provider", provider=name):
+                song = await self.providers[name].search_song(
+                    title=title, artist=artist
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.errors += 1
+            stats.latencies.append(time.monotonic() - started)
+            logger.warning(f"Provider {name} failed for {title} - {artist}: {e}")
+            raise
+
+        stats.latencies.append(time.monotonic() - started)
+        if song is not None and song.has_lyrics():
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        return song
+
+    async def close(self) -> None:
+        """Close every provider."""
+        for provider in self.providers.values():
+            await provider.close()
@@ -0,0 +1,353 @@
+"""Asynchronous HTTP client for the Genius API and song pages."""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import aiohttp
+
+from src.infrastructure.external.genius_lyrics_parser import LyricsStreamParser
+from src.infrastructure.metrics.registry import default_registry
+from src.infrastructure.ratelimit.rate_limiter import RateLimiter
+from src.infrastructure.tracing.tracer import current_span, default_tracer
+
+logger = logging.getLogger(__name__)
+
+REQUEST_DURATION = default_registry.histogram(
+    "genius_request_duration_seconds",
+    "Duration of Genius calls including retries, by stage",
+    ["stage"],
+)
+RESPONSES = default_registry.counter(
+    "genius_responses_total", "Genius HTTP responses by status code", ["status"]
+)
+PARSE_DURATION = default_registry.histogram(
+    "lyrics_parse_duration_seconds",
+    "CPU time spent parsing a lyrics page, excluding download time",
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class GeniusAPIError(Exception):
+    """Raised when Genius responds with an unexpected status code."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            status: HTTP status code returned by Genius
+            message: Error description
+        """
+        super().__init__(f"Genius API error {status}: {message}")
+        self.status = status
+
+
+class GeniusClient:
+    """Non-blocking Genius client sharing one pooled aiohttp session."""
+
+    API_ROOT = "https://api.genius.com/"
+    WEB_ROOT = "https://genius.com/"
+    CHUNK_SIZE = 16384
+
+    def __init__(
+        self,
+        api_token: str,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        keepalive_timeout: float = 30.0,
+        api_root: str = API_ROOT,
+        web_root: str = WEB_ROOT,
+        rate_limiter: RateLimiter | None = None,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            api_token: Genius API access token
+            timeout: Total timeout for a single HTTP request in seconds
+            max_connections: Maximum number of pooled connections
+            keepalive_timeout: Seconds an idle connection is kept alive
+            api_root: Base URL of the Genius API
+            web_root: Base URL of the Genius website
+            rate_limiter: Limiter awaited before every request (optional)
+            max_retries: Retries of a request answered with 429 or 5xx
+            retry_backoff: Base delay of the exponential backoff when no
+                ``Retry-After`` header is given
+        """
+        self.api_token = api_token
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.api_root = api_root
+        self.web_root = web_root
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session, its pooled connections and the limiter."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed Genius HTTP session")
+        self._session = None
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.close()
+
+    @asynccontextmanager
+    async def _get(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        error_message: str | None = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a rate-limited GET request, retrying throttled responses.
+
+        429 and 5xx responses slow the rate limiter down and pause it for
+        ``Retry-After`` (or an exponential backoff), after which the request
+        is retried up to ``max_retries`` times.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            error_message: Message of the raised error (defaults to the body)
+
+        Yields:
+            The successful response, with its body not yet read
+
+        Raises:
+            GeniusAPIError: If the final response is not successful
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                with default_tracer.span("genius.rate_limit_wait"):
+                    await self.rate_limiter.acquire()
+
+            session = self._get_session()
+            async with session.get(url, params=params, headers=headers) as response:
+                RESPONSES.inc(status=str(response.status))
+                if response.status == 200:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.speed_up()
+                    yield response
+                    return
+
+                retryable = response.status == 429 or response.status >= 500
+                if not retryable or attempt >= self.max_retries:
+                    raise GeniusAPIError(
+                        response.status, error_message or await response.text()
+                    )
+
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self.retry_backoff * 2**attempt
+                status = response.status
+
+            attempt += 1
+            span = current_span()
+            if span is not None:
+                span.set_attribute("retries", attempt)
+            logger.warning(
+                f"Genius responded {status}, retrying in {delay:.1f}s "
+                f"(attempt {attempt}/{self.max_retries})"
+            )
+            if self.rate_limiter is not None:
+                self.rate_limiter.slow_down()
+                await self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+
+    async def _get_json(
+        self, path: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Call a Genius API endpoint.
+
+        Args:
+            path: Endpoint path relative to the API root
+            params: Query parameters
+
+        Returns:
+            The ``response`` payload of the API reply
+        """
+        headers = {"Authorization": f"Bearer {self.api_token}"}
+        async with self._get(
+            self.api_root + path, params=params, headers=headers
+        ) as response:
+            data: dict[str, Any] = json.loads(await response.text())
+
+        payload: dict[str, Any] = data.get("response", data)
+        return payload
+
+    async def search_songs(self, query: str) -> dict[str, Any]:
+        """
+        Search songs hosted on Genius.
+
+        Args:
+            query: Search term
+
+        Returns:
+            Search payload containing ``hits``
+        """
+        with (
+            REQUEST_DURATION.time(stage="search"),
+            default_tracer.span("genius.search"),
+        ):
+            return await self._get_json("search", params={"q": query})
+
+    async def get_song(self, song_id: int) -> dict[str, Any]:
+        """
+        Fetch song metadata.
+
+        Args:
+            song_id: Genius song ID
+
+        Returns:
+            Song payload
+        """
+        with REQUEST_DURATION.time(stage="song"), default_tracer.span("genius.song"):
+            payload = await self._get_json(f"songs/{song_id}")
+        song: dict[str, Any] = payload["song"]
+        return song
+
+    async def get_album_tracks(self, album_id: int) -> list[dict[str, Any]]:
+        """
+        Fetch the tracklist of an album.
+
+        Args:
+            album_id: Genius album ID
+
+        Returns:
+            Tracks, each with its ``number`` and ``song`` payload
+        """
+        with (
+            REQUEST_DURATION.time(stage="album_tracks"),
+            default_tracer.span("genius.album_tracks"),
+        ):
+            payload = await self._get_json(f"albums/{album_id}/tracks")
+        tracks: list[dict[str, Any]] = payload.get("tracks", [])
+        return tracks
+
+    async def get_artist_songs(
+        self, artist_id: int, per_page: int = 10, sort: str = "popularity"
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch the first page of an artist's songs.
+
+        Args:
+            artist_id: Genius artist ID
+            per_page: Number of songs to return
+            sort: Sort order ("popularity" or "title")
+
+        Returns:
+            Song payloads
+        """
+        with (
+            REQUEST_DURATION.time(stage="artist_songs"),
+            default_tracer.span("genius.artist_songs"),
+        ):
+            payload = await self._get_json(
+                f"artists/{artist_id}/songs",
+                params={"sort": sort, "per_page": str(per_page)},
+            )
+        songs: list[dict[str, Any]] = payload.get("songs", [])
+        return songs
+
+    async def fetch_lyrics(
+        self, song_url: str, remove_section_headers: bool = True
+    ) -> str | None:
+        """
+        Scrape lyrics from a Genius song page.
+
+        The page is parsed chunk by chunk while it downloads, so the full
+        HTML is never held in memory or turned into a document tree.
+
+        Args:
+            song_url: Song page URL
+            remove_section_headers: Whether to remove [Chorus], [Verse], etc.
+
+        Returns:
+            Lyrics text if found, None otherwise
+        """
+        parser = LyricsStreamParser()
+        parsing = 0.0
+
+        with (
+            REQUEST_DURATION.time(stage="lyrics_fetch"),
+            default_tracer.span("genius.lyrics_fetch", url=song_url) as span,
+        ):
+            async with self._get(
+                song_url, error_message=f"Failed to fetch {song_url}"
+            ) as response:
+                decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(
+                    errors="replace"
+                )
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    started = time.perf_counter()
+                    parser.feed(decoder.decode(chunk))
+                    parsing += time.perf_counter() - started
+
+                started = time.perf_counter()
+                parser.feed(decoder.decode(b"", final=True))
+                lyrics = parser.lyrics(strip_headers=remove_section_headers)
+                parsing += time.perf_counter() - started
+
+            span.set_attribute("parse_seconds", parsing)
+
+        PARSE_DURATION.observe(parsing)
+        return lyrics
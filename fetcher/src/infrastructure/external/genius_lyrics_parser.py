@@ -0,0 +1,145 @@
+"""Lyrics extraction from Genius song pages."""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+# Elements that never have an end tag
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+def remove_section_headers(lyrics: str) -> str:
+    """
+    Remove [Verse], [Chorus], etc. headers from lyrics.
+
+    Args:
+        lyrics: Raw lyrics text
+
+    Returns:
+        Lyrics without section headers
+    """
+    lyrics = re.sub(r"(\[.*?\])*", "", lyrics)
+    return re.sub("\n{2}", "\n", lyrics)
+
+
+class LyricsStreamParser(HTMLParser):
+    """
+    Incremental parser collecting the text of lyrics containers.
+
+    The page can be fed in chunks as it arrives. Only the text inside
+    ``data-lyrics-container`` divs is kept; ``LyricsHeader`` divs and
+    elements excluded from selection are skipped and ``<br>`` becomes a
+    newline. No document tree is built.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        # Open elements inside the current container as (tag, skipped) pairs
+        self._stack: list[tuple[str, bool]] = []
+        self._container_empty = False
+        self.found_container = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Track lyrics containers and the elements opened inside them."""
+        attributes = dict(attrs)
+
+        if not self._stack:
+            if tag == "div" and attributes.get("data-lyrics-container") == "true":
+                self._stack.append((tag, False))
+                self._container_empty = True
+                self.found_container = True
+            return
+
+        self._container_empty = False
+        skipped = self._stack[-1][1] or self._is_skipped(tag, attributes)
+
+        if tag == "br":
+            if not skipped:
+                self._parts.append("\n")
+        elif tag not in VOID_ELEMENTS:
+            self._stack.append((tag, skipped))
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close the innermost open element with a matching tag."""
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+
+        while self._stack:
+            open_tag, _ = self._stack.pop()
+            if open_tag == tag:
+                break
+
+        if not self._stack and self._container_empty:
+            self._parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        """Collect text that is inside a container and not skipped."""
+        if not self._stack:
+            return
+
+        self._container_empty = False
+        if not self._stack[-1][1]:
+            self._parts.append(data)
+
+    @staticmethod
+    def _is_skipped(tag: str, attributes: dict[str, str | None]) -> bool:
+        """Whether an element and its descendants are left out of the lyrics."""
+        if attributes.get("data-exclude-from-selection") == "true":
+            return True
+        return tag == "div" and "LyricsHeader" in (attributes.get("class") or "")
+
+    def lyrics(self, strip_headers: bool = True) -> str | None:
+        """
+        Finish parsing and return the collected lyrics.
+
+        Args:
+            strip_headers: Whether to remove section headers
+
+        Returns:
+            Lyrics text if the page has lyrics containers, None otherwise
+        """
+        self.close()
+        if not self.found_container:
+            return None
+
+        lyrics = "".join(self._parts)
+        if strip_headers:
+            lyrics = remove_section_headers(lyrics)
+
+        lyrics = lyrics.strip("\n")
+        return lyrics or None
+
+
+def parse_lyrics(html: str, strip_headers: bool = True) -> str | None:
+    """
+    Extract lyrics from a Genius song page.
+
+    Args:
+        html: Song page HTML
+        strip_headers: Whether to remove section headers
+
+    Returns:
+        Lyrics text if the page has lyrics containers, None otherwise
+    """
+    parser = LyricsStreamParser()
+    parser.feed(html)
+    return parser.lyrics(strip_headers)
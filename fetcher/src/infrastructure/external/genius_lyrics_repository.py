@@ -3,29 +3,37 @@
 from __future__ import annotations
 
 import logging
-
-import lyricsgenius
+from collections.abc import Iterable
+from typing import Any
 
 from src.domain.entities.song import Song
 from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.repositories.related_songs_repository import RelatedSongsRepository
+from src.domain.utils.matching import best_match
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.external.genius_client import GeniusClient
+from src.infrastructure.metrics.common import ERRORS, RERANKED
 
 logger = logging.getLogger(__name__)
 
 
-class GeniusLyricsRepository(LyricsRepository):
-    """Genius API implementation for fetching song lyrics."""
+class GeniusLyricsRepository(LyricsRepository, RelatedSongsRepository):
+    """Genius API implementation for fetching song lyrics and related songs."""
 
-    def __init__(self, api_token: str) -> None:
+    def __init__(self, api_token: str, client: GeniusClient | None = None) -> None:
         """
         Initialize Genius API client.
 
         Args:
             api_token: Genius API access token
+            client: Preconfigured async Genius client (optional)
         """
-        self.genius = lyricsgenius.Genius(api_token)
-        # Configure genius client
-        self.genius.verbose = False
-        self.genius.remove_section_headers = True
+        self.genius = client or GeniusClient(api_token)
+        self.remove_section_headers = True
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self.genius.close()
 
     async def search_song(self, title: str, artist: str) -> Song | None:
         """
@@ -37,23 +45,22 @@ class GeniusLyricsRepository(LyricsRepository):
 
         Returns:
             Song entity if found, None otherwise
+
+        Raises:
+            Exception: If the Genius search request fails
         """
         try:
             query = f"{artist} - {title}"
             logger.debug(f"Searching Genius for: {query}")
 
-            # lyricsgenius is synchronous, but we wrap it in async interface
-            result = self.genius.search_songs(query)
+            result = await self.genius.search_songs(query)
 
-            if not result or "hits" not in result or len(result["hits"]) == 0:
+            hit_result = self._best_hit(result, title, artist)
+            if hit_result is None:
                 logger.info(f"No results found for: {query}")
                 return None
 
-            # Get the first hit's result
-            hit_result = result["hits"][0]["result"]
-
             # Extract basic info from search result
-            song_id = hit_result["id"]
             song_title = hit_result["title"]
             song_url = hit_result["url"]
 
@@ -63,14 +70,15 @@ class GeniusLyricsRepository(LyricsRepository):
             # Get release date
             release_date = hit_result.get("release_date_for_display")
 
-            # Fetch lyrics using the song ID
+            # The hit already carries the page URL, so scrape it directly
             lyrics = None
             try:
-                song_details = self.genius.search_song(song_id=song_id)
-                if song_details:
-                    lyrics = song_details.lyrics
+                lyrics = await self.genius.fetch_lyrics(
+                    song_url, remove_section_headers=self.remove_section_headers
+                )
             except Exception as e:
-                logger.warning(f"Could not fetch lyrics for song ID {song_id}: {e}")
+                ERRORS.inc(stage="lyrics_fetch", type=type(e).__name__)
+                logger.warning(f"Could not fetch lyrics from {song_url}: {e}")
 
             return Song(
                 title=song_title,
@@ -79,8 +87,103 @@ class GeniusLyricsRepository(LyricsRepository):
                 url=song_url,
                 album=None,  # Album info not directly available in search results
                 release_date=release_date,
+                source="genius",
+                source_id=hit_result.get("id"),
+                source_artist_id=hit_result.get("primary_artist", {}).get("id"),
             )
 
         except Exception as e:
             logger.error(f"Error fetching from Genius API: {e}", exc_info=True)
+            raise
+
+    async def related_songs(self, song: Song, limit: int) -> list[tuple[str, str]]:
+        """
+        Find the songs around a song on its album and the artist's hits.
+
+        The tracks following the song on its album come first, then the
+        album's earlier tracks, then the artist's most popular songs. The
+        song's Genius IDs from its search are reused, so songs matched by
+        another source have no related songs here.
+
+        Args:
+            song: Song found by an earlier search
+            limit: Maximum number of songs to return
+
+        Returns:
+            (title, artist) pairs, excluding the song itself
+        """
+        if song.source != "genius" or song.source_id is None:
+            return []
+
+        own_key = normalize_key(song.title, song.artist)
+        related: dict[str, tuple[str, str]] = {}
+
+        def add(songs: Iterable[dict[str, Any]]) -> None:
+            for entry in songs:
+                song_title = entry.get("title")
+                song_artist = entry.get("primary_artist", {}).get("name")
+                if not song_title or not song_artist or len(related) >= limit:
+                    continue
+                key = normalize_key(song_title, song_artist)
+                if key != own_key:
+                    related.setdefault(key, (song_title, song_artist))
+
+        album = (await self.genius.get_song(song.source_id)).get("album")
+        if album:
+            tracks = await self.genius.get_album_tracks(album["id"])
+            position = next(
+                (
+                    i
+                    for i, track in enumerate(tracks)
+                    if track.get("song", {}).get("id") == song.source_id
+                ),
+                -1,
+            )
+            following = tracks[position + 1 :] + tracks[: max(position, 0)]
+            add(track.get("song", {}) for track in following)
+
+        if len(related) < limit and song.source_artist_id is not None:
+            add(
+                await self.genius.get_artist_songs(
+                    song.source_artist_id, per_page=limit + 1
+                )
+            )
+
+        return list(related.values())
+
+    def _best_hit(
+        self, result: dict[str, Any] | None, title: str, artist: str
+    ) -> dict[str, Any] | None:
+        """
+        Pick the search hit closest to the request rather than blindly the first.
+
+        Args:
+            result: Search payload containing ``hits``
+            title: Requested title
+            artist: Requested artist
+
+        Returns:
+            The chosen song hit, or None if the search found no songs
+        """
+        hits: list[dict[str, Any]] = [
+            hit["result"]
+            for hit in (result or {}).get("hits", [])
+            if hit.get("type", "song") == "song"
+        ]
+        if not hits:
             return None
+
+        index = best_match(
+            title,
+            artist,
+            [
+                (hit["title"], hit.get("primary_artist", {}).get("name", ""))
+                for hit in hits
+            ],
+        )
+        if index:
+            RERANKED.inc(provider="genius")
+            logger.debug(
+                f"Picked hit {index + 1} of {len(hits)} for: {artist} - {title}"
+            )
+        return hits[index or 0]
@@ -0,0 +1,123 @@
+"""Musixmatch implementation of lyrics repository."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from musicxmatch_api import MusixMatchAPI
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.utils.matching import best_match
+from src.infrastructure.metrics.common import RERANKED
+
+logger = logging.getLogger(__name__)
+
+# Musixmatch appends this disclaimer to every lyrics body
+LYRICS_DISCLAIMER = "******* This Lyrics is NOT for Commercial use *******"
+
+
+def clean_lyrics(lyrics_body: str | None) -> str | None:
+    """
+    Strip the Musixmatch disclaimer and tracking ID from a lyrics body.
+
+    Args:
+        lyrics_body: Raw ``lyrics_body`` field
+
+    Returns:
+        Lyrics text, or None if nothing is left
+    """
+    if not lyrics_body:
+        return None
+
+    lyrics = lyrics_body.split(LYRICS_DISCLAIMER, 1)[0].strip()
+    return lyrics or None
+
+
+class MusixmatchLyricsRepository(LyricsRepository):
+    """
+    Musixmatch implementation for fetching song lyrics.
+
+    The ``musicxmatch-api`` client is synchronous, so every call runs in a
+    worker thread to keep the event loop free.
+    """
+
+    def __init__(self, client: Any | None = None) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            client: Preconfigured MusixMatchAPI instance (optional). The default
+                client is created on first use because its constructor fetches
+                the request signing secret over the network.
+        """
+        self._client = client
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self) -> Any:
+        """Return the Musixmatch client, creating it on first use."""
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await asyncio.to_thread(MusixMatchAPI)
+        return self._client
+
+    async def search_song(self, title: str, artist: str) -> Song | None:
+        """
+        Search for a song by title and artist using Musixmatch.
+
+        Args:
+            title: Song title
+            artist: Artist name
+
+        Returns:
+            Song entity if found, None otherwise
+
+        Raises:
+            Exception: If the Musixmatch search request fails
+        """
+        query = f"{artist} {title}"
+        logger.debug(f"Searching Musixmatch for: {query}")
+
+        client = await self._get_client()
+        result = await asyncio.to_thread(client.search_tracks, query)
+        track_list = result.get("message", {}).get("body", {}).get("track_list")
+
+        if not track_list:
+            logger.info(f"No results found for: {query}")
+            return None
+
+        tracks = [item["track"] for item in track_list]
+        index = best_match(
+            title,
+            artist,
+            [
+                (track.get("track_name") or "", track.get("artist_name") or "")
+                for track in tracks
+            ],
+        )
+        track = tracks[index or 0]
+        if index:
+            RERANKED.inc(provider="musixmatch")
+            logger.debug(f"Picked track {index + 1} of {len(tracks)} for: {query}")
+        track_id = track["track_id"]
+
+        lyrics = None
+        try:
+            response = await asyncio.to_thread(
+                client.get_track_lyrics, track_id=track_id
+            )
+            body = response.get("message", {}).get("body") or {}
+            lyrics = clean_lyrics(body.get("lyrics", {}).get("lyrics_body"))
+        except Exception as e:
+            logger.warning(f"Could not fetch lyrics for track ID {track_id}: {e}")
+
+        return Song(
+            title=track.get("track_name") or title,
+            artist=track.get("artist_name") or artist,
+            lyrics=lyrics,
+            url=track.get("track_share_url"),
+            album=track.get("album_name"),
+            release_date=track.get("first_release_date"),
+        )
@@ -0,0 +1,257 @@
+"""File-backed message repository for batch backfills."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from src.domain.entities.batch_search_request import BatchSearchRequest
+from src.domain.entities.result_status import ResultStatus
+from src.domain.entities.search_request import SearchRequest
+from src.domain.entities.song import Song
+from src.domain.repositories.message_repository import MessageRepository
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_HEADER = "# batch "
+
+
+def read_batch_file(path: Path, batch_id: str | None = None) -> BatchSearchRequest:
+    """
+    Read a batch from a JSONL or CSV file.
+
+    JSONL files hold one ``{"title": ..., "artist": ...}`` object per line;
+    CSV files need a header with ``title`` and ``artist`` columns. Invalid
+    rows are logged and skipped.
+
+    Args:
+        path: Input file (``.csv`` is read as CSV, anything else as JSONL)
+        batch_id: Batch ID (defaults to the file name without extension)
+
+    Returns:
+        The batch of search requests
+
+    Raises:
+        ValueError: If the file contains no valid rows
+    """
+    with path.open(encoding="utf-8", newline="") as file:
+        if path.suffix.lower() == ".csv":
+            rows: list[Any] = list(csv.DictReader(file))
+        else:
+            rows = []
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping line {number} of {path}: {e}")
+
+    items = []
+    for row in rows:
+        try:
+            items.append(SearchRequest(title=row["title"], artist=row["artist"]))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping invalid batch item {row!r}: {e}")
+
+    return BatchSearchRequest(batch_id=batch_id or path.stem, items=items)
+
+
+@dataclass
+class BatchProgress:
+    """Progress of a batch run."""
+
+    total: int
+    resumed: int = 0
+    completed: int = 0
+    outcomes: Counter[str] = field(default_factory=Counter)
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def remaining(self) -> int:
+        """Items neither finished earlier nor in this run."""
+        return self.total - self.resumed - self.completed
+
+    @property
+    def throughput(self) -> float:
+        """Items completed per second in this run."""
+        elapsed = time.monotonic() - self.started_at
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+
+class BatchFileMessageRepository(MessageRepository):
+    """
+    Message repository that feeds a batch to the fetcher service.
+
+    Items are delivered in order, skipping those recorded in the checkpoint
+    file. Each result is appended to a JSON Lines output file, and the
+    item's index is checkpointed once the service acknowledges it, so a
+    killed run resumes where it left off. An item whose result was written
+    just before the process died may be written again on resume.
+    """
+
+    def __init__(
+        self, batch: BatchSearchRequest, output_path: Path, checkpoint_path: Path
+    ) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            batch: Batch to process
+            output_path: JSON Lines file results are appended to
+            checkpoint_path: File recording the indices of finished items
+        """
+        self.batch = batch
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path
+        self.progress = BatchProgress(total=len(batch))
+        self._done: set[int] = set()
+        self._output: IO[str] | None = None
+        self._checkpoint: IO[str] | None = None
+
+    def _load_checkpoint(self) -> set[int]:
+        """
+        Read the indices finished by earlier runs.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another batch
+        """
+        if not self.checkpoint_path.exists():
+            return set()
+
+        lines = self.checkpoint_path.read_text(encoding="utf-8").splitlines()
+        if lines and lines[0] != CHECKPOINT_HEADER + self.batch.batch_id:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to another batch "
+                f"({lines[0].removeprefix(CHECKPOINT_HEADER)!r})"
+            )
+        # A torn last line is ignored, so that item simply runs again
+        return {int(line) for line in lines[1:] if line.isdigit()}
+
+    async def connect(self) -> None:
+        """Load the checkpoint and open the output files."""
+        self._done = self._load_checkpoint()
+        self.progress.resumed = len(self._done)
+        if self._done:
+            logger.info(
+                f"Resuming batch {self.batch.batch_id}: "
+                f"{len(self._done)}/{len(self.batch)} items already done"
+            )
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._output = self.output_path.open("a", encoding="utf-8")
+        new_checkpoint = not self.checkpoint_path.exists()
+        self._checkpoint = self.checkpoint_path.open("a", encoding="utf-8")
+        if new_checkpoint:
+            self._checkpoint.write(CHECKPOINT_HEADER + self.batch.batch_id + "\n")
+            self._checkpoint.flush()
+
+    async def disconnect(self) -> None:
+        """Close the output files."""
+        for file in (self._output, self._checkpoint):
+            if file is not None:
+                file.close()
+        self._output = self._checkpoint = None
+
+    def subscribe_requests(self) -> AsyncIterator[SearchRequest]:
+        """
+        Deliver the batch items that have not been finished yet.
+
+        Yields:
+            SearchRequest objects whose message ID is the item index
+        """
+        return self._subscribe_requests_impl()
+
+    async def _subscribe_requests_impl(self) -> AsyncIterator[SearchRequest]:
+        """Internal implementation of subscribe_requests."""
+        for index, item in enumerate(self.batch.items):
+            if index in self._done:
+                continue
+            yield SearchRequest(
+                title=item.title,
+                artist=item.artist,
+                message_id=str(index),
+                trace_id=item.trace_id,
+            )
+
+    def _write_result(self, request: SearchRequest, result: dict[str, Any]) -> None:
+        """Append one result line and count its outcome."""
+        if self._output is None:
+            raise RuntimeError("Batch output is not open. Call connect() first.")
+
+        line = {
+            "batch_id": self.batch.batch_id,
+            "index": int(request.message_id or -1),
+            "request_title": request.title,
+            "request_artist": request.artist,
+            **result,
+        }
+        if request.trace_id:
+            line["trace_id"] = request.trace_id
+        self._output.write(json.dumps(line, ensure_ascii=False) + "\n")
+        self._output.flush()
+        self.progress.outcomes[result["status"]] += 1
+
+    async def publish_result(
+        self, song: Song, original_request: SearchRequest | None = None
+    ) -> None:
+        """
+        Write a found song to the output file.
+
+        Args:
+            song: Song entity to write
+            original_request: Batch item the song was found for
+        """
+        if original_request is None:
+            raise ValueError("Batch results need the originating request")
+
+        self._write_result(
+            original_request,
+            {
+                "status": ResultStatus.OK.value,
+                "title": song.title,
+                "artist": song.artist,
+                "lyrics": song.lyrics,
+                "url": song.url,
+                "album": song.album,
+                "release_date": song.release_date,
+            },
+        )
+
+    async def publish_status(
+        self,
+        original_request: SearchRequest,
+        status: ResultStatus,
+        detail: str | None = None,
+    ) -> None:
+        """
+        Write a result without a song to the output file.
+
+        Args:
+            original_request: Batch item the status refers to
+            status: Outcome of the item
+            detail: Human-readable explanation (optional)
+        """
+        self._write_result(original_request, {"status": status.value, "detail": detail})
+
+    async def acknowledge(self, request: SearchRequest) -> None:
+        """
+        Checkpoint a finished item.
+
+        Args:
+            request: Batch item whose result has been written
+        """
+        if self._checkpoint is None or request.message_id is None:
+            return
+
+        self._checkpoint.write(request.message_id + "\n")
+        self._checkpoint.flush()
+        self._done.add(int(request.message_id))
+        self.progress.completed += 1
@@ -2,18 +2,89 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import random
+import time
 from collections.abc import AsyncIterator
+from contextlib import suppress
+from typing import Any
 
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import EqualJitterBackoff
 
+from src.domain.entities.priority import Priority
+from src.domain.entities.result_status import ResultStatus
 from src.domain.entities.search_request import SearchRequest
 from src.domain.entities.song import Song
 from src.domain.repositories.message_repository import MessageRepository
+from src.infrastructure.messaging.result_codec import ResultCodec
+from src.infrastructure.metrics.common import ERRORS
+from src.infrastructure.metrics.registry import default_registry
+from src.infrastructure.tracing.tracer import default_tracer
 
 logger = logging.getLogger(__name__)
 
+PUBLISH_DURATION = default_registry.histogram(
+    "redis_publish_duration_seconds",
+    "Time until a result is published, including batching delay",
+)
+PUBLISHED_BYTES = default_registry.counter(
+    "redis_published_bytes_total", "Bytes of result messages published"
+)
+RECONNECTS = default_registry.counter(
+    "redis_reconnects_total", "Attempts to re-establish the request subscription"
+)
+
+# Errors after which the subscription is re-established instead of failing
+CONNECTION_ERRORS = (redis.ConnectionError, redis.TimeoutError, OSError)
+
+
+def request_expiry(data: dict[str, Any], sent_at: float | None = None) -> float | None:
+    """
+    Read the deadline of a request message.
+
+    ``expires_at`` is an absolute Unix time in milliseconds; ``deadline_ms``
+    is a budget counted from when the request was sent, or from now if the
+    transport does not record that.
+
+    Args:
+        data: Decoded request message
+        sent_at: Unix time the request was sent (optional)
+
+    Returns:
+        Unix time the request expires at, or None without a deadline
+
+    Raises:
+        ValueError: If a deadline field is not a number
+    """
+    if data.get("expires_at") is not None:
+        return float(data["expires_at"]) / 1000
+    if data.get("deadline_ms") is not None:
+        start = time.time() if sent_at is None else sent_at
+        return start + float(data["deadline_ms"]) / 1000
+    return None
+
+
+def reconnect_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Randomizing the whole delay keeps replicas that lost Redis at the same
+    moment from reconnecting in lockstep.
+
+    Args:
+        attempt: Number of failed attempts so far
+        base: Delay bound of the first attempt in seconds
+        cap: Largest delay bound in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
 
 class RedisMessageRepository(MessageRepository):
     """Redis pub/sub implementation for message operations."""
@@ -26,6 +97,14 @@ class RedisMessageRepository(MessageRepository):
         password: str | None = None,
         request_channel: str = "lyrics:requests",
         result_channel: str = "lyrics:results",
+        read_batch_size: int = 10,
+        publish_batch_size: int = 1,
+        publish_linger_ms: float = 0.0,
+        pool_size: int = 10,
+        health_check_interval: float = 15.0,
+        reconnect_backoff: float = 0.5,
+        reconnect_backoff_max: float = 30.0,
+        result_codec: ResultCodec | None = None,
     ) -> None:
         """
         Initialize Redis connection parameters.
@@ -37,6 +116,15 @@ class RedisMessageRepository(MessageRepository):
             password: Redis password (optional)
             request_channel: Channel for incoming search requests
             result_channel: Channel for publishing results
+            read_batch_size: Maximum buffered messages drained per read
+            publish_batch_size: Results coalesced into one pipeline (1 disables batching)
+            publish_linger_ms: Longest time a result waits for its batch to fill
+            pool_size: Connections available to concurrent publishers
+            health_check_interval: Idle seconds after which a connection is
+                pinged before use
+            reconnect_backoff: First reconnect delay bound in seconds
+            reconnect_backoff_max: Largest reconnect delay bound in seconds
+            result_codec: Serializer of published results (JSON by default)
         """
         self.host = host
         self.port = port
@@ -44,43 +132,125 @@ class RedisMessageRepository(MessageRepository):
         self.password = password
         self.request_channel = request_channel
         self.result_channel = result_channel
+        self.pool_size = max(1, pool_size)
+        self.health_check_interval = health_check_interval
+        self.reconnect_backoff = reconnect_backoff
+        self.reconnect_backoff_max = reconnect_backoff_max
+        # Publishes, acks and other short commands
         self.client: redis.Redis | None = None
+        # Blocking reads, kept off the publish pool so they never hold its slots
+        self.consumer_client: redis.Redis | None = None
         self.pubsub: redis.client.PubSub | None = None
+        self.read_batch_size = max(1, read_batch_size)
+        self.publish_batch_size = max(1, publish_batch_size)
+        self.publish_linger_ms = publish_linger_ms
+        self.result_codec = result_codec or ResultCodec()
+        self._publish_buffer: list[tuple[bytes, asyncio.Future[None]]] = []
+        self._publish_lock = asyncio.Lock()
+        self._linger_task: asyncio.Task[None] | None = None
+
+    def _connection_kwargs(self) -> dict[str, Any]:
+        """Settings shared by every connection pool."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "db": self.db,
+            "password": self.password,
+            "decode_responses": True,
+            "health_check_interval": self.health_check_interval,
+            "socket_keepalive": True,
+            "socket_connect_timeout": 5.0,
+            "retry": Retry(EqualJitterBackoff(cap=1.0, base=0.05), retries=3),
+        }
+
+    def _consumer_socket_timeout(self) -> float | None:
+        """
+        Read timeout of the consumer connection.
+
+        Pub/sub reads pass their own timeout and are checked with pings, so
+        no socket timeout is needed.
+        """
+        return None
 
     async def connect(self) -> None:
-        """Establish connection to Redis."""
+        """Create the publish and consumer connection pools and subscribe."""
         try:
             self.client = redis.Redis(
-                host=self.host,
-                port=self.port,
-                db=self.db,
-                password=self.password,
-                decode_responses=True,
+                connection_pool=redis.BlockingConnectionPool(
+                    max_connections=self.pool_size, **self._connection_kwargs()
+                )
+            )
+            self.consumer_client = redis.Redis(
+                connection_pool=redis.ConnectionPool(
+                    socket_timeout=self._consumer_socket_timeout(),
+                    **self._connection_kwargs(),
+                )
+            )
+            await self.client.ping()
+            logger.info(
+                f"Connected to Redis at {self.host}:{self.port} "
+                f"(pool size {self.pool_size})"
             )
-            ping_result = self.client.ping()
-            if hasattr(ping_result, "__await__"):
-                await ping_result
-            logger.info(f"Connected to Redis at {self.host}:{self.port}")
 
-            self.pubsub = self.client.pubsub()
-            await self.pubsub.subscribe(self.request_channel)
-            logger.info(f"Subscribed to channel: {self.request_channel}")
+            await self._subscribe()
 
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}", exc_info=True)
             raise
 
+    async def _subscribe(self) -> None:
+        """Open a fresh pub/sub connection subscribed to the request channel."""
+        if not self.consumer_client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        if self.pubsub:
+            with suppress(Exception):
+                await self.pubsub.close()
+
+        self.pubsub = self.consumer_client.pubsub()
+        await self.pubsub.subscribe(self.request_channel)
+        logger.info(f"Subscribed to channel: {self.request_channel}")
+
+    async def _reconnect(self) -> None:
+        """Re-establish the subscription, backing off until Redis answers."""
+        attempt = 0
+        while True:
+            RECONNECTS.inc()
+            delay = reconnect_delay(
+                attempt, self.reconnect_backoff, self.reconnect_backoff_max
+            )
+            await asyncio.sleep(delay)
+            try:
+                await self._subscribe()
+                logger.info(f"Reconnected to Redis after {attempt + 1} attempt(s)")
+                return
+            except CONNECTION_ERRORS as e:
+                attempt += 1
+                logger.warning(f"Reconnect attempt {attempt} failed: {e}")
+
     async def disconnect(self) -> None:
         """Close connection to Redis."""
         try:
+            # Send what is still buffered; the lock makes this wait for a
+            # flush the linger task may have in progress
+            linger, self._linger_task = self._linger_task, None
+            await self._flush_results()
+            if linger is not None:
+                # From here on the linger task can only be sleeping or find
+                # an empty buffer, so cancelling it strands no publisher
+                linger.cancel()
+                await asyncio.gather(linger, return_exceptions=True)
+
             if self.pubsub:
                 await self.pubsub.unsubscribe(self.request_channel)
                 await self.pubsub.close()
                 logger.info("Unsubscribed and closed pubsub")
 
-            if self.client:
-                await self.client.close()
-                logger.info("Closed Redis connection")
+            for client in (self.consumer_client, self.client):
+                if client:
+                    await client.close()
+                    await client.connection_pool.disconnect()
+            logger.info("Closed Redis connections")
 
         except Exception as e:
             logger.error(f"Error during disconnect: {e}", exc_info=True)
@@ -102,26 +272,113 @@ class RedisMessageRepository(MessageRepository):
         logger.info("Started listening for search requests")
 
         try:
-            async for message in self.pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        data = json.loads(message["data"])
-                        request = SearchRequest(
-                            title=data["title"], artist=data["artist"]
-                        )
-                        logger.debug(f"Received request: {request}")
-                        yield request
+            while True:
+                try:
+                    batch = await self._read_batch()
+                except CONNECTION_ERRORS as e:
+                    # Requests published while disconnected are lost (pub/sub)
+                    logger.warning(f"Lost Redis subscription: {e}, reconnecting")
+                    await self._reconnect()
+                    continue
 
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        logger.error(
-                            f"Invalid message format: {message['data']}, error: {e}"
-                        )
-                        continue
+                for message in batch:
+                    request = self._parse_message(message)
+                    if request:
+                        yield request
 
         except Exception as e:
             logger.error(f"Error in subscribe_requests: {e}", exc_info=True)
             raise
 
+    async def _wait_for_message(self) -> dict[str, Any]:
+        """
+        Wait for the next pub/sub message, pinging while the channel is idle.
+
+        A subscribed connection that silently died would otherwise wait
+        forever, so an idle period is followed by a PING whose PONG must
+        arrive within the next one.
+
+        Returns:
+            The next message
+
+        Raises:
+            redis.ConnectionError: If a health check ping went unanswered
+        """
+        if not self.pubsub:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        timeout = self.health_check_interval or None
+        awaiting_pong = False
+        last_activity = time.monotonic()
+        while True:
+            message: dict[str, Any] | None = await self.pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=timeout
+            )
+            if message is not None:
+                if message["type"] != "pong":
+                    return message
+                awaiting_pong = False
+                last_activity = time.monotonic()
+                continue
+
+            # None also comes back early for ignored subscribe confirmations
+            if timeout is None or time.monotonic() - last_activity < timeout:
+                continue
+            if awaiting_pong:
+                raise redis.ConnectionError("Health check ping went unanswered")
+            await self.pubsub.ping()
+            awaiting_pong = True
+            last_activity = time.monotonic()
+
+    async def _read_batch(self) -> list[dict[str, Any]]:
+        """
+        Wait for the next message, then drain what is already buffered.
+
+        Returns:
+            Up to read_batch_size pub/sub messages
+        """
+        if not self.pubsub:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        messages: list[dict[str, Any]] = [await self._wait_for_message()]
+        while len(messages) < self.read_batch_size:
+            message = await self.pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=0.0
+            )
+            if message is None:
+                break
+            messages.append(message)
+        return messages
+
+    def _parse_message(self, message: dict[str, Any]) -> SearchRequest | None:
+        """
+        Convert a pub/sub message into a search request.
+
+        Args:
+            message: Raw pub/sub message
+
+        Returns:
+            SearchRequest, or None if the message is not a valid request
+        """
+        if message["type"] != "message":
+            return None
+
+        try:
+            data = json.loads(message["data"])
+            request = SearchRequest(
+                title=data["title"],
+                artist=data["artist"],
+                trace_id=data.get("trace_id"),
+                priority=data.get("priority", Priority.HIGH),
+                expires_at=request_expiry(data),
+            )
+            logger.debug(f"Received request: {request}")
+            return request
+
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"Invalid message format: {message['data']}, error: {e}")
+            return None
+
     async def publish_result(
         self, song: Song, original_request: SearchRequest | None = None
     ) -> None:
@@ -143,15 +400,17 @@ class RedisMessageRepository(MessageRepository):
                 "url": song.url,
                 "album": song.album,
                 "release_date": song.release_date,
+                "status": ResultStatus.OK.value,
             }
 
             # Add original request info for key matching
             if original_request:
                 result["request_title"] = original_request.title
                 result["request_artist"] = original_request.artist
+                if original_request.trace_id:
+                    result["trace_id"] = original_request.trace_id
 
-            message = json.dumps(result, ensure_ascii=False)
-            await self.client.publish(self.result_channel, message)
+            await self._publish(self.result_codec.encode(result))
 
             if original_request:
                 logger.info(
@@ -164,3 +423,128 @@ class RedisMessageRepository(MessageRepository):
         except Exception as e:
             logger.error(f"Error publishing result: {e}", exc_info=True)
             raise
+
+    async def publish_status(
+        self,
+        original_request: SearchRequest,
+        status: ResultStatus,
+        detail: str | None = None,
+    ) -> None:
+        """
+        Publish a result without a song to Redis.
+
+        Args:
+            original_request: Request the status refers to
+            status: Outcome of the request
+            detail: Human-readable explanation (optional)
+        """
+        if not self.client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        try:
+            result = {
+                "status": status.value,
+                "detail": detail,
+                "request_title": original_request.title,
+                "request_artist": original_request.artist,
+            }
+            if original_request.trace_id:
+                result["trace_id"] = original_request.trace_id
+
+            await self._publish(self.result_codec.encode(result))
+            logger.info(
+                f"Published {status.value} status for request: "
+                f"{original_request.title} by {original_request.artist}"
+            )
+
+        except Exception as e:
+            logger.error(f"Error publishing status: {e}", exc_info=True)
+            raise
+
+    async def _publish(self, message: bytes) -> None:
+        """
+        Publish a serialized result, through the batch pipeline if enabled.
+
+        In batched mode the call returns once the pipeline carrying the
+        message has been executed, so callers still observe publish errors.
+
+        Args:
+            message: Serialized result
+        """
+        if not self.client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        PUBLISHED_BYTES.inc(len(message))
+        started = time.perf_counter()
+        try:
+            with default_tracer.span("redis.publish"):
+                await self._send(message)
+        except Exception as e:
+            ERRORS.inc(stage="publish", type=type(e).__name__)
+            raise
+        finally:
+            PUBLISH_DURATION.observe(time.perf_counter() - started)
+
+    async def _send(self, message: bytes) -> None:
+        """Publish immediately or wait for the batch carrying the message."""
+        if not self.client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        if self.publish_batch_size <= 1 and self.publish_linger_ms <= 0:
+            await self.client.publish(self.result_channel, message)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._publish_buffer.append((message, future))
+
+        if len(self._publish_buffer) >= self.publish_batch_size:
+            await self._flush_results()
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._flush_after_linger())
+
+        await future
+
+    async def _flush_after_linger(self) -> None:
+        """Flush a partially filled batch once the linger time has passed."""
+        await asyncio.sleep(self.publish_linger_ms / 1000)
+        self._linger_task = None
+        await self._flush_results()
+
+    async def _flush_results(self) -> None:
+        """Send every buffered result in one pipeline, preserving order."""
+        async with self._publish_lock:
+            batch, self._publish_buffer = self._publish_buffer, []
+            if not batch:
+                return
+
+            if not self.client:
+                error = RuntimeError("Not connected to Redis. Call connect() first.")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+
+            try:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for message, _ in batch:
+                        pipe.publish(self.result_channel, message)
+                    await pipe.execute()
+                logger.debug(f"Flushed {len(batch)} results in one pipeline")
+
+            except asyncio.CancelledError:
+                # Publishers must not wait forever for an interrupted batch
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(
+                            ConnectionError("Result publishing was interrupted")
+                        )
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
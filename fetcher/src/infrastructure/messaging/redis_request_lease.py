@@ -0,0 +1,180 @@
+"""Cross-replica request leases held in Redis."""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import uuid
+from collections import Counter
+
+import redis.asyncio as redis
+
+from src.domain.entities.search_request import SearchRequest
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.metrics.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+LEASES = default_registry.counter(
+    "request_leases_total", "Request lease attempts by result", ["result"]
+)
+
+# Hands a lease back if this replica still holds it
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+# Extends a lease this replica holds, or takes it again if it expired
+# unclaimed; fails only if another replica holds it now
+RENEW_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder and holder ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return 1
+"""
+
+
+class RedisRequestLease:
+    """
+    Claim requests across replicas with ``SET NX PX`` leases.
+
+    With pub/sub every replica receives every request. The replica whose
+    ``SET NX`` succeeds for the normalized (title, artist) key processes
+    the request, and the others skip it: the holder received the same
+    message and its result answers the song. A lease expires after
+    ``lease_ms`` if its holder crashes, and is deleted as soon as the
+    request is answered, so a later request for the same song is always
+    processed, from the shared cache if it was just looked up. Within a
+    replica, leases are reentrant, so identical requests it receives still
+    share the lookup as before. If Redis is unreachable every request is
+    processed, since a duplicate result is better than none.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        lease_ms: int = 30000,
+        key_prefix: str = "lyrics:lease:",
+        owner: str | None = None,
+    ) -> None:
+        """
+        Initialize the lease manager.
+
+        Args:
+            client: Redis client (owned by this lease manager)
+            lease_ms: Time a lease is held at most without being renewed,
+                e.g. if its holder crashes
+            key_prefix: Prefix for Redis keys
+            owner: Value identifying this replica (defaults to host, PID and
+                a random suffix)
+        """
+        self.client = client
+        self.lease_ms = lease_ms
+        self.key_prefix = key_prefix
+        self.owner = (
+            owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._release = client.register_script(RELEASE_SCRIPT)
+        self._renew = client.register_script(RENEW_SCRIPT)
+        # Requests holding each lease of this replica
+        self._held: Counter[str] = Counter()
+
+    def _key(self, request: SearchRequest) -> str:
+        """Redis key of a request's lease."""
+        return self.key_prefix + normalize_key(request.title, request.artist)
+
+    async def acquire(self, request: SearchRequest) -> bool:
+        """
+        Claim a request for this replica.
+
+        Args:
+            request: Incoming search request
+
+        Returns:
+            Whether this replica should process the request; pass it to
+            release() once done
+        """
+        key = self._key(request)
+        if self._held[key]:
+            self._held[key] += 1
+            LEASES.inc(result="acquired")
+            return True
+
+        try:
+            acquired = await self.client.set(key, self.owner, nx=True, px=self.lease_ms)
+        except Exception as e:
+            LEASES.inc(result="error")
+            logger.warning(f"Request lease unavailable, processing anyway: {e}")
+            return True
+
+        if not acquired:
+            LEASES.inc(result="held_elsewhere")
+            return False
+
+        self._held[key] += 1
+        LEASES.inc(result="acquired")
+        return True
+
+    async def renew(self, request: SearchRequest) -> bool:
+        """
+        Extend the lease of a request claimed with acquire().
+
+        Called when the request leaves the work queue, since the lease may
+        have run out while it waited.
+
+        Args:
+            request: Request about to be processed
+
+        Returns:
+            Whether this replica should still process the request; False if
+            another replica claimed the song meanwhile
+        """
+        key = self._key(request)
+        if not self._held[key]:
+            # Admitted without a lease while Redis was unreachable
+            return True
+
+        try:
+            renewed = await self._renew(keys=[key], args=[self.owner, self.lease_ms])
+        except Exception as e:
+            LEASES.inc(result="error")
+            logger.warning(f"Request lease unavailable, processing anyway: {e}")
+            return True
+
+        if not renewed:
+            LEASES.inc(result="lost")
+            return False
+        return True
+
+    async def release(self, request: SearchRequest) -> None:
+        """
+        Hand back the lease of a request claimed with acquire().
+
+        Args:
+            request: Processed, rejected or expired request
+        """
+        key = self._key(request)
+        if not self._held[key]:
+            # Processed without a lease while Redis was unreachable
+            return
+
+        self._held[key] -= 1
+        if self._held[key]:
+            return
+        del self._held[key]
+
+        try:
+            await self._release(keys=[key], args=[self.owner])
+        except Exception as e:
+            logger.warning(f"Could not release request lease {key!r}: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        await self.client.close()
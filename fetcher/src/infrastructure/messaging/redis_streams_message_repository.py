@@ -0,0 +1,292 @@
+"""Redis Streams consumer-group implementation of message repository."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.domain.entities.priority import Priority
+from src.domain.entities.search_request import SearchRequest
+from src.infrastructure.messaging.redis_message_repository import (
+    CONNECTION_ERRORS,
+    RedisMessageRepository,
+    request_expiry,
+)
+from src.infrastructure.messaging.result_codec import ResultCodec
+
+logger = logging.getLogger(__name__)
+
+
+def default_consumer_name() -> str:
+    """Return a consumer name unique to this host and process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class RedisStreamsMessageRepository(RedisMessageRepository):
+    """
+    Durable request transport built on a Redis Streams consumer group.
+
+    Requests are read with XREADGROUP so every entry is delivered to exactly
+    one consumer in the group and stays pending until it is acknowledged
+    with XACK. Entries left pending by crashed consumers are reclaimed with
+    XAUTOCLAIM, and the stream is trimmed to an approximate MAXLEN. Results
+    are still published on the pub/sub result channel.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        request_stream: str = "lyrics:requests:stream",
+        result_channel: str = "lyrics:results",
+        consumer_group: str = "lyrics-fetchers",
+        consumer_name: str | None = None,
+        batch_size: int = 10,
+        block_ms: int = 5000,
+        claim_min_idle_ms: int = 60000,
+        claim_interval_seconds: float = 30.0,
+        max_len: int = 10000,
+        publish_batch_size: int = 1,
+        publish_linger_ms: float = 0.0,
+        pool_size: int = 10,
+        health_check_interval: float = 15.0,
+        reconnect_backoff: float = 0.5,
+        reconnect_backoff_max: float = 30.0,
+        result_codec: ResultCodec | None = None,
+    ) -> None:
+        """
+        Initialize Redis Streams parameters.
+
+        Args:
+            host: Redis host
+            port: Redis port
+            db: Redis database number
+            password: Redis password (optional)
+            request_stream: Stream holding incoming search requests
+            result_channel: Channel for publishing results
+            consumer_group: Consumer group shared by all fetcher replicas
+            consumer_name: Name of this consumer (defaults to host and PID)
+            batch_size: Maximum entries read per XREADGROUP/XAUTOCLAIM call
+            block_ms: How long XREADGROUP blocks waiting for new entries
+            claim_min_idle_ms: Idle time after which pending entries are reclaimed
+            claim_interval_seconds: Seconds between reclaim and trim passes
+            max_len: Approximate maximum stream length kept by XTRIM
+            publish_batch_size: Results coalesced into one pipeline (1 disables batching)
+            publish_linger_ms: Longest time a result waits for its batch to fill
+            pool_size: Connections available to concurrent publishers
+            health_check_interval: Idle seconds after which a connection is
+                pinged before use
+            reconnect_backoff: First reconnect delay bound in seconds
+            reconnect_backoff_max: Largest reconnect delay bound in seconds
+            result_codec: Serializer of published results (JSON by default)
+        """
+        super().__init__(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            request_channel=request_stream,
+            result_channel=result_channel,
+            read_batch_size=batch_size,
+            publish_batch_size=publish_batch_size,
+            publish_linger_ms=publish_linger_ms,
+            pool_size=pool_size,
+            health_check_interval=health_check_interval,
+            reconnect_backoff=reconnect_backoff,
+            reconnect_backoff_max=reconnect_backoff_max,
+            result_codec=result_codec,
+        )
+        self.request_stream = request_stream
+        self.consumer_group = consumer_group
+        self.consumer_name = consumer_name or default_consumer_name()
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_min_idle_ms = claim_min_idle_ms
+        self.claim_interval_seconds = claim_interval_seconds
+        self.max_len = max_len
+        self._last_claim = 0.0
+
+    def _consumer_socket_timeout(self) -> float | None:
+        """Fail reads that outlast the XREADGROUP block time by a margin."""
+        return self.block_ms / 1000 + max(self.health_check_interval, 5.0)
+
+    async def _subscribe(self) -> None:
+        """Check the connection and ensure the consumer group exists."""
+        if not self.consumer_client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        await self.consumer_client.ping()
+        await self._ensure_group()
+        logger.info(
+            f"Consuming stream {self.request_stream} as "
+            f"{self.consumer_group}/{self.consumer_name}"
+        )
+
+    async def _ensure_group(self) -> None:
+        """Create the consumer group, e.g. after Redis lost its data."""
+        if not self.consumer_client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        try:
+            await self.consumer_client.xgroup_create(
+                self.request_stream, self.consumer_group, id="0", mkstream=True
+            )
+            logger.info(
+                f"Created consumer group {self.consumer_group} "
+                f"on stream {self.request_stream}"
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _subscribe_requests_impl(self) -> AsyncIterator[SearchRequest]:
+        """Internal implementation of subscribe_requests."""
+        if not self.consumer_client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        logger.info("Started reading search requests from stream")
+
+        try:
+            while True:
+                try:
+                    entries = await self._read_entries()
+                except CONNECTION_ERRORS as e:
+                    logger.warning(f"Lost Redis connection: {e}, reconnecting")
+                    await self._reconnect()
+                    continue
+                except redis.ResponseError as e:
+                    if "NOGROUP" not in str(e):
+                        raise
+                    logger.warning("Consumer group is missing, recreating it")
+                    await self._ensure_group()
+                    continue
+
+                for entry_id, fields in entries:
+                    request = await self._parse_entry(entry_id, fields)
+                    if request:
+                        yield request
+
+        except Exception as e:
+            logger.error(f"Error in subscribe_requests: {e}", exc_info=True)
+            raise
+
+    async def _read_entries(self) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Read reclaimed entries when a reclaim pass is due, then new ones.
+
+        Returns:
+            Stream entries to process
+        """
+        if not self.consumer_client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        if time.monotonic() - self._last_claim >= self.claim_interval_seconds:
+            self._last_claim = time.monotonic()
+            reclaimed = await self._reclaim_pending()
+            if reclaimed:
+                return reclaimed
+
+        response: Any = await self.consumer_client.xreadgroup(
+            self.consumer_group,
+            self.consumer_name,
+            {self.request_stream: ">"},
+            count=self.batch_size,
+            block=self.block_ms,
+        )
+        return [entry for _stream, entries in response or [] for entry in entries]
+
+    async def _reclaim_pending(self) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Take over entries left pending by crashed consumers and trim the stream.
+
+        Returns:
+            Reclaimed stream entries
+        """
+        if not self.consumer_client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        reclaimed: list[tuple[str, dict[str, Any]]] = []
+        start_id = "0-0"
+        while True:
+            next_id, entries, *_deleted = await self.consumer_client.xautoclaim(
+                self.request_stream,
+                self.consumer_group,
+                self.consumer_name,
+                min_idle_time=self.claim_min_idle_ms,
+                start_id=start_id,
+                count=self.batch_size,
+            )
+            reclaimed.extend(entry for entry in entries if entry[1] is not None)
+            if next_id == "0-0" or len(reclaimed) >= self.batch_size:
+                break
+            start_id = next_id
+
+        if reclaimed:
+            logger.warning(f"Reclaimed {len(reclaimed)} pending stream entries")
+
+        await self.consumer_client.xtrim(self.request_stream, maxlen=self.max_len)
+        return reclaimed
+
+    async def _parse_entry(
+        self, entry_id: str, fields: dict[str, Any]
+    ) -> SearchRequest | None:
+        """
+        Convert a stream entry into a search request.
+
+        Entries carry either a JSON ``data`` field, matching the pub/sub
+        payload, or plain ``title``/``artist`` fields. Malformed entries are
+        acknowledged so they are not redelivered forever.
+
+        Args:
+            entry_id: Stream entry ID
+            fields: Stream entry fields
+
+        Returns:
+            SearchRequest, or None if the entry is invalid
+        """
+        try:
+            data = json.loads(fields["data"]) if "data" in fields else fields
+            request = SearchRequest(
+                title=data["title"],
+                artist=data["artist"],
+                message_id=entry_id,
+                trace_id=data.get("trace_id"),
+                priority=data.get("priority", Priority.HIGH),
+                # Stream entry IDs start with the millisecond time of XADD
+                expires_at=request_expiry(
+                    data, sent_at=int(entry_id.split("-")[0]) / 1000
+                ),
+            )
+            logger.debug(f"Received request {entry_id}: {request}")
+            return request
+
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"Invalid stream entry {entry_id}: {fields}, error: {e}")
+            await self._ack(entry_id)
+            return None
+
+    async def acknowledge(self, request: SearchRequest) -> None:
+        """
+        Acknowledge a processed request with XACK.
+
+        Args:
+            request: Request received from subscribe_requests
+        """
+        if request.message_id is not None:
+            await self._ack(request.message_id)
+
+    async def _ack(self, entry_id: str) -> None:
+        """Remove an entry from this group's pending list."""
+        if not self.client:
+            raise RuntimeError("Not connected to Redis. Call connect() first.")
+
+        await self.client.xack(self.request_stream, self.consumer_group, entry_id)
@@ -0,0 +1,156 @@
+"""Wire formats for published results."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import zlib
+from enum import IntEnum
+from types import ModuleType
+from typing import Any
+
+# First byte of compact messages; never the first byte of JSON or msgpack data
+MAGIC = b"\xc1"
+VERSION = 1
+
+
+class Compression(IntEnum):
+    """Compression of a compact message body, stored in its header."""
+
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+
+
+def _import_optional(name: str) -> ModuleType:
+    """
+    Import an optional dependency of the compact format.
+
+    Args:
+        name: Module name
+
+    Returns:
+        The imported module
+
+    Raises:
+        RuntimeError: If the module is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise RuntimeError(
+            f"The compact result format requires '{name}'. "
+            "Install the fetcher with the 'compact' extra."
+        ) from e
+
+
+class ResultCodec:
+    """
+    Encodes result messages as JSON or as compact binary frames.
+
+    A compact frame is ``MAGIC``, a version byte and a compression byte,
+    followed by the msgpack-encoded result, compressed with zstd or zlib
+    once it reaches the size threshold. JSON remains the default so
+    existing subscribers keep working until they can decode both.
+    """
+
+    def __init__(
+        self,
+        result_format: str = "json",
+        compression: str = "zstd",
+        compress_threshold: int = 1024,
+        compression_level: int = 3,
+    ) -> None:
+        """
+        Initialize the codec.
+
+        Args:
+            result_format: "json" or "msgpack"
+            compression: "zstd", "zlib" or "none" (msgpack format only)
+            compress_threshold: Smallest packed size in bytes that is compressed
+            compression_level: zstd or zlib compression level
+
+        Raises:
+            ValueError: If the format or compression is unknown
+            RuntimeError: If an optional dependency is missing
+        """
+        if result_format not in ("json", "msgpack"):
+            raise ValueError(f"Unknown result format: {result_format}")
+        try:
+            self.compression = Compression[compression.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown result compression: {compression}") from None
+
+        self.result_format = result_format
+        self.compress_threshold = compress_threshold
+        self.compression_level = compression_level
+        self._msgpack: ModuleType | None = None
+        self._zstd_compressor: Any = None
+
+        if result_format == "msgpack":
+            self._msgpack = _import_optional("msgpack")
+            if self.compression is Compression.ZSTD:
+                zstandard = _import_optional("zstandard")
+                self._zstd_compressor = zstandard.ZstdCompressor(
+                    level=compression_level
+                )
+
+    def encode(self, result: dict[str, Any]) -> bytes:
+        """
+        Serialize a result message.
+
+        Args:
+            result: Result fields
+
+        Returns:
+            UTF-8 JSON, or a compact binary frame
+        """
+        if self._msgpack is None:
+            return json.dumps(result, ensure_ascii=False).encode()
+
+        body: bytes = self._msgpack.packb(result, use_bin_type=True)
+        compression = Compression.NONE
+        if len(body) >= self.compress_threshold:
+            if self.compression is Compression.ZSTD:
+                body = self._zstd_compressor.compress(body)
+                compression = Compression.ZSTD
+            elif self.compression is Compression.ZLIB:
+                body = zlib.compress(body, self.compression_level)
+                compression = Compression.ZLIB
+
+        return MAGIC + bytes((VERSION, compression)) + body
+
+
+def decode_result(data: str | bytes) -> dict[str, Any]:
+    """
+    Parse a result message in either format.
+
+    Args:
+        data: JSON text or bytes, or a compact binary frame
+
+    Returns:
+        Result fields
+
+    Raises:
+        ValueError: If the message is malformed or uses an unknown version
+    """
+    if isinstance(data, str) or not data.startswith(MAGIC):
+        result: dict[str, Any] = json.loads(data)
+        return result
+
+    if len(data) < 3:
+        raise ValueError("Truncated compact result header")
+    version, compression = data[1], data[2]
+    if version != VERSION:
+        raise ValueError(f"Unsupported compact result version: {version}")
+
+    body = data[3:]
+    if compression == Compression.ZSTD:
+        body = _import_optional("zstandard").ZstdDecompressor().decompress(body)
+    elif compression == Compression.ZLIB:
+        body = zlib.decompress(body)
+    elif compression != Compression.NONE:
+        raise ValueError(f"Unknown compact result compression: {compression}")
+
+    unpacked: dict[str, Any] = _import_optional("msgpack").unpackb(body, raw=False)
+    return unpacked
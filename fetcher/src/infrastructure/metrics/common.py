@@ -0,0 +1,14 @@
+"""Metrics recorded by several modules."""
+
+from __future__ import annotations
+
+from src.infrastructure.metrics.registry import default_registry
+
+ERRORS = default_registry.counter(
+    "fetcher_errors_total", "Errors by stage and exception type", ["stage", "type"]
+)
+RERANKED = default_registry.counter(
+    "search_hits_reranked_total",
+    "Searches answered with a hit other than the provider's first",
+    ["provider"],
+)
@@ -0,0 +1,71 @@
+"""Rate limiter interface with adaptive slowdown."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    """
+    Token-bucket style limiter that callers wait on before each request.
+
+    The configured rate is scaled by an adaptive factor: ``slow_down`` halves
+    it when the upstream signals overload and ``speed_up`` recovers it step by
+    step after successful calls (additive increase, multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.05,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests allowed back to back
+            min_rate_factor: Lowest fraction of ``rate`` slowdown can reach
+            recovery_step: Fraction of ``rate`` regained per successful call
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst <= 0:
+            raise ValueError("burst must be positive")
+
+        self.rate = rate
+        self.burst = burst
+        self.min_rate_factor = min_rate_factor
+        self.recovery_step = recovery_step
+        self._rate_factor = 1.0
+
+    @property
+    def effective_rate(self) -> float:
+        """Current requests per second after adaptive slowdown."""
+        return self.rate * self._rate_factor
+
+    def slow_down(self) -> None:
+        """Halve the effective rate after a throttled or failed response."""
+        self._rate_factor = max(self.min_rate_factor, self._rate_factor / 2)
+
+    def speed_up(self) -> None:
+        """Move the effective rate back towards the configured rate."""
+        self._rate_factor = min(1.0, self._rate_factor + self.recovery_step)
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+
+    @abstractmethod
+    async def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for a while, e.g. to honour ``Retry-After``.
+
+        Args:
+            seconds: How long no request may be sent
+        """
+
+    async def close(self) -> None:
+        """Release resources held by the limiter."""
@@ -0,0 +1,142 @@
+"""Token bucket shared by all fetcher replicas through Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import redis.asyncio as redis
+
+from src.infrastructure.ratelimit.rate_limiter import RateLimiter
+from src.infrastructure.ratelimit.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Refills the bucket and takes a token atomically. Returns 0 when a token was
+# taken, otherwise the number of milliseconds to wait before trying again.
+TOKEN_BUCKET_SCRIPT = """
+local pause_ms = redis.call('PTTL', KEYS[2])
+if pause_ms > 0 then
+    return pause_ms
+end
+
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate / 1000)
+
+local wait_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait_ms = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait_ms
+"""
+
+# Sets the shared pause unless a longer one is already in place, so a short
+# Retry-After seen by one replica never ends another replica's longer pause
+PAUSE_SCRIPT = """
+local pause_ms = tonumber(ARGV[1])
+if redis.call('PTTL', KEYS[1]) < pause_ms then
+    redis.call('SET', KEYS[1], '1', 'PX', pause_ms)
+end
+return 0
+"""
+
+
+class RedisTokenBucket(RateLimiter):
+    """
+    Distributed token bucket evaluated by a Lua script in Redis.
+
+    Every replica draws from the same bucket, so the configured rate is a
+    global budget. A pause set by one replica (e.g. after a 429) holds back
+    all of them. If Redis is unreachable the limiter falls back to a local
+    bucket with the same settings rather than failing requests.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        rate: float,
+        burst: int,
+        key: str = "lyrics:ratelimit:genius",
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.05,
+    ) -> None:
+        """
+        Initialize the bucket.
+
+        Args:
+            client: Redis client (owned by this limiter)
+            rate: Sustained requests per second across all replicas
+            burst: Bucket capacity
+            key: Redis key holding the bucket state
+            min_rate_factor: Lowest fraction of ``rate`` slowdown can reach
+            recovery_step: Fraction of ``rate`` regained per successful call
+        """
+        super().__init__(rate, burst, min_rate_factor, recovery_step)
+        self.client = client
+        self.key = key
+        self.pause_key = f"{key}:pause"
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+        self._pause = client.register_script(PAUSE_SCRIPT)
+        self._fallback = TokenBucket(rate, burst, min_rate_factor, recovery_step)
+        self._lock = asyncio.Lock()
+
+    def slow_down(self) -> None:
+        """Halve the effective rate of this replica and of the fallback."""
+        super().slow_down()
+        self._fallback.slow_down()
+
+    def speed_up(self) -> None:
+        """Recover the effective rate of this replica and of the fallback."""
+        super().speed_up()
+        self._fallback.speed_up()
+
+    async def acquire(self) -> None:
+        """Wait for a token from the shared bucket."""
+        async with self._lock:
+            while True:
+                try:
+                    wait_ms = int(
+                        await self._script(
+                            keys=[self.key, self.pause_key],
+                            args=[self.effective_rate, self.burst],
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(f"Redis rate limiter unavailable, using local: {e}")
+                    await self._fallback.acquire()
+                    return
+
+                if wait_ms <= 0:
+                    return
+                await asyncio.sleep(wait_ms / 1000)
+
+    async def pause(self, seconds: float) -> None:
+        """
+        Hold back every replica for a while.
+
+        A pause only ever extends the one already shared by the replicas.
+
+        Args:
+            seconds: How long no token is handed out
+        """
+        await self._fallback.pause(seconds)
+        try:
+            await self._pause(keys=[self.pause_key], args=[max(1, int(seconds * 1000))])
+        except Exception as e:
+            logger.warning(f"Could not share rate limiter pause: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        await self.client.close()
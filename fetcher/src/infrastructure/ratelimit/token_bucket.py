@@ -0,0 +1,71 @@
+"""In-process token bucket rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from src.infrastructure.ratelimit.rate_limiter import RateLimiter
+
+
+class TokenBucket(RateLimiter):
+    """
+    Token bucket shared by all tasks of one process.
+
+    Callers queue on a lock and are released in arrival order as tokens
+    become available, so excess work waits instead of failing.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.05,
+    ) -> None:
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity
+            min_rate_factor: Lowest fraction of ``rate`` slowdown can reach
+            recovery_step: Fraction of ``rate`` regained per successful call
+        """
+        super().__init__(rate, burst, min_rate_factor, recovery_step)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.effective_rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait for a token, honouring any active pause."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.effective_rate)
+
+    async def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for a while.
+
+        Args:
+            seconds: How long no token is handed out
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
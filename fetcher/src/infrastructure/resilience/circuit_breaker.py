@@ -0,0 +1,201 @@
+"""Circuit breaker tracking the health of an upstream dependency."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+
+from src.domain.repositories.lyrics_repository import UpstreamUnavailableError
+from src.infrastructure.metrics.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+STATE = default_registry.gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state (0 = closed, 1 = half-open, 2 = open)",
+    ["name"],
+)
+TRANSITIONS = default_registry.counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes by new state",
+    ["name", "state"],
+)
+REJECTED = default_registry.counter(
+    "circuit_breaker_rejected_total", "Calls failed fast by an open breaker", ["name"]
+)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker driven by a rolling window of calls.
+
+    A call counts as failed if the caller reports it failed (e.g. it
+    raised) or it took longer than ``slow_call_seconds``. Once at least
+    ``min_calls`` calls in the last ``window_seconds`` include a
+    ``failure_rate`` share of failures, the breaker opens and rejects calls
+    for ``open_seconds``. It then lets up to ``half_open_calls`` trial calls
+    through at a time while still rejecting the rest, so a recovering
+    upstream is not hit by the whole backlog at once. Enough successful
+    trials close the breaker; a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = 30.0,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        open_seconds: float = 15.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Name of the guarded dependency, used in metrics and errors
+            window_seconds: Age of the oldest call counted towards the rate
+            min_calls: Calls needed in the window before the breaker may open
+            failure_rate: Share of failed calls that opens the breaker
+            slow_call_seconds: Duration from which a call counts as failed
+            open_seconds: Time calls are rejected before a trial call
+            half_open_calls: Successful trial calls needed to close again
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        # (finished at, failed) of recent calls while closed
+        self._calls: deque[tuple[float, bool]] = deque()
+        self._trials = 0
+        self._trial_successes = 0
+        # Bumped on every state change, so outcomes of calls admitted in an
+        # earlier state are not mistaken for trials or recent calls
+        self._generation = 0
+        STATE.set(0, name=name)
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the wait is over."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def acquire(self) -> int:
+        """
+        Ask permission for a call.
+
+        Returns:
+            Permit to pass to record() or release() once the call is over
+
+        Raises:
+            UpstreamUnavailableError: If the breaker is open, or half-open
+                with every trial slot taken
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return self._generation
+        if state is CircuitState.HALF_OPEN and self._trials < self.half_open_calls:
+            self._trials += 1
+            return self._generation
+
+        REJECTED.inc(name=self.name)
+        raise UpstreamUnavailableError(f"{self.name} is unavailable (circuit {state})")
+
+    def record(self, permit: int, duration: float, failed: bool = False) -> None:
+        """
+        Record the outcome of a call allowed by acquire().
+
+        Outcomes of calls admitted before the last state change are ignored,
+        e.g. a slow call started while closed that ends while half-open.
+
+        Args:
+            permit: Value returned by acquire() for the call
+            duration: Time the call took in seconds
+            failed: Whether the call raised or gave an unusable answer
+        """
+        if permit != self._generation:
+            return
+        failed = failed or duration >= self.slow_call_seconds
+
+        if self._state is CircuitState.HALF_OPEN:
+            self._trials = max(0, self._trials - 1)
+            if failed:
+                logger.warning(f"Trial call to {self.name} failed, reopening circuit")
+                self._open()
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        now = self._clock()
+        self._calls.append((now, failed))
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+        failures = sum(1 for _, call_failed in self._calls if call_failed)
+        if len(self._calls) >= self.min_calls and failures >= self.failure_rate * len(
+            self._calls
+        ):
+            logger.warning(
+                f"Opening circuit for {self.name}: "
+                f"{failures}/{len(self._calls)} recent calls failed or were slow"
+            )
+            self._open()
+
+    def release(self, permit: int) -> None:
+        """
+        Give back a permission whose call was cancelled without an outcome.
+
+        Args:
+            permit: Value returned by acquire() for the call
+        """
+        if permit == self._generation and self._state is CircuitState.HALF_OPEN:
+            self._trials = max(0, self._trials - 1)
+
+    def _open(self) -> None:
+        """Start rejecting calls."""
+        self._opened_at = self._clock()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Switch state, resetting the bookkeeping of the new state."""
+        if state is not CircuitState.OPEN:
+            logger.info(f"Circuit for {self.name} is now {state}")
+        self._state = state
+        self._generation += 1
+        self._calls.clear()
+        self._trials = 0
+        self._trial_successes = 0
+        STATE.set(_STATE_VALUES[state], name=self.name)
+        TRANSITIONS.inc(name=self.name, state=state.value)
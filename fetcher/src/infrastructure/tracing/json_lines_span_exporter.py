@@ -0,0 +1,42 @@
+"""Span exporter writing JSON lines to a local file."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+from src.infrastructure.tracing.span import Span
+from src.infrastructure.tracing.span_exporter import SpanExporter
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Append each span as one JSON object per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File the spans are appended to
+        """
+        self.path = Path(path)
+
+    async def export(self, spans: Sequence[Span]) -> None:
+        """
+        Append a batch of spans to the file.
+
+        Args:
+            spans: Spans to export
+        """
+        lines = "".join(
+            json.dumps(span.to_dict(), ensure_ascii=False) + "\n" for span in spans
+        )
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        """Write lines without blocking the event loop."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
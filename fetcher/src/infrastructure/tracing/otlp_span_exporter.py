@@ -0,0 +1,121 @@
+"""Span exporter posting OTLP/HTTP JSON to a collector."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import aiohttp
+
+from src.infrastructure.tracing.span import AttributeValue, Span
+from src.infrastructure.tracing.span_exporter import SpanExporter
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+def _attribute(key: str, value: AttributeValue) -> dict[str, Any]:
+    """Encode one attribute as an OTLP key/value pair."""
+    if isinstance(value, bool):
+        encoded: dict[str, Any] = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": value}
+    return {"key": key, "value": encoded}
+
+
+def encode_spans(spans: Sequence[Span], service_name: str) -> dict[str, Any]:
+    """
+    Build an OTLP ``ExportTraceServiceRequest`` in its JSON mapping.
+
+    Args:
+        spans: Finished spans
+        service_name: Value of the ``service.name`` resource attribute
+
+    Returns:
+        Request body accepted by ``POST /v1/traces``
+    """
+    encoded = []
+    for span in spans:
+        attributes = dict(span.attributes)
+        if span.error is not None:
+            attributes["error.type"] = span.error
+
+        otlp_span: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": [_attribute(k, v) for k, v in attributes.items()],
+            "status": {
+                "code": STATUS_CODE_OK if span.error is None else STATUS_CODE_ERROR
+            },
+        }
+        if span.parent_id is not None:
+            otlp_span["parentSpanId"] = span.parent_id
+        encoded.append(otlp_span)
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [{"scope": {"name": service_name}, "spans": encoded}],
+            }
+        ]
+    }
+
+
+class OTLPSpanExporter(SpanExporter):
+    """Send spans to an OpenTelemetry collector over OTLP/HTTP with JSON."""
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        service_name: str = "lyrics-fetcher",
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            endpoint: Collector traces URL
+            service_name: Service name reported with every batch
+            timeout_seconds: Timeout of one export request
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout_seconds = timeout_seconds
+        self._session: aiohttp.ClientSession | None = None
+
+    async def export(self, spans: Sequence[Span]) -> None:
+        """
+        Post a batch of spans to the collector.
+
+        Args:
+            spans: Spans to export
+
+        Raises:
+            aiohttp.ClientResponseError: If the collector rejects the batch
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+            )
+
+        async with self._session.post(
+            self.endpoint, json=encode_spans(spans, self.service_name)
+        ) as response:
+            response.raise_for_status()
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,57 @@
+"""Timed span of work within a request trace."""
+
+from __future__ import annotations
+
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+AttributeValue = str | int | float | bool
+
+
+def new_trace_id() -> str:
+    """Generate a random 128-bit trace ID as 32 hex characters."""
+    return secrets.token_hex(16)
+
+
+def new_span_id() -> str:
+    """Generate a random 64-bit span ID as 16 hex characters."""
+    return secrets.token_hex(8)
+
+
+@dataclass
+class Span:
+    """One stage of a request, linked to its parent through the trace."""
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=new_span_id)
+    parent_id: str | None = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    error: str | None = None
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Duration of a finished span in seconds."""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """
+        Attach a value to the span.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+        """
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the span to a JSON-compatible dict."""
+        data = asdict(self)
+        data["duration_seconds"] = self.duration_seconds
+        return data
@@ -0,0 +1,25 @@
+"""Span exporter interface."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.infrastructure.tracing.span import Span
+
+
+class SpanExporter(ABC):
+    """Destination for finished spans, called with batches."""
+
+    @abstractmethod
+    async def export(self, spans: Sequence[Span]) -> None:
+        """
+        Send a batch of finished spans.
+
+        Args:
+            spans: Spans to export
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the exporter."""
@@ -0,0 +1,185 @@
+"""Request tracing with spans propagated through context variables."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+
+from src.infrastructure.tracing.span import AttributeValue, Span, new_trace_id
+from src.infrastructure.tracing.span_exporter import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Span active in the current task, if any."""
+    return _current_span.get()
+
+
+class Tracer:
+    """
+    Create spans and hand finished ones to an exporter in batches.
+
+    The active span is kept in a context variable, so spans opened further
+    down the call stack (and in tasks created from it) become its children
+    without passing anything around. Without an exporter spans are still
+    created, which keeps trace IDs flowing into results, but nothing is
+    buffered.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter | None = None,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 5.0,
+        max_buffered_spans: int = 8192,
+    ) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter: Destination of finished spans (optional)
+            batch_size: Buffered spans that trigger an early flush
+            flush_interval_seconds: Seconds between periodic flushes
+            max_buffered_spans: Spans kept while the exporter lags behind;
+                further spans are dropped
+        """
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffered_spans = max_buffered_spans
+        self.dropped = 0
+        self._buffer: list[Span] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._pending_flush: asyncio.Task[None] | None = None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        trace_id: str | None = None,
+        start_ns: int | None = None,
+        **attributes: AttributeValue,
+    ) -> Iterator[Span]:
+        """
+        Time the enclosed block as a span.
+
+        Args:
+            name: Span name
+            trace_id: Trace to start or join; defaults to the current trace,
+                or a new one outside any span
+            start_ns: Start time in Unix nanoseconds (defaults to now)
+            attributes: Initial span attributes
+
+        Yields:
+            The active span
+        """
+        parent = _current_span.get()
+        if trace_id is None:
+            trace_id = parent.trace_id if parent else new_trace_id()
+
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            parent_id=(
+                parent.span_id if parent and parent.trace_id == trace_id else None
+            ),
+            start_ns=start_ns or time.time_ns(),
+            attributes=dict(attributes),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self._finish(span)
+
+    def record(
+        self, name: str, start_ns: int, end_ns: int, **attributes: AttributeValue
+    ) -> None:
+        """
+        Record an interval that has already ended as a child of the current span.
+
+        Args:
+            name: Span name
+            start_ns: Start time in Unix nanoseconds
+            end_ns: End time in Unix nanoseconds
+            attributes: Span attributes
+        """
+        parent = _current_span.get()
+        self._finish(
+            Span(
+                name=name,
+                trace_id=parent.trace_id if parent else new_trace_id(),
+                parent_id=parent.span_id if parent else None,
+                start_ns=start_ns,
+                end_ns=end_ns,
+                attributes=dict(attributes),
+            )
+        )
+
+    def _finish(self, span: Span) -> None:
+        """Buffer a finished span for export."""
+        if self.exporter is None:
+            return
+
+        if len(self._buffer) >= self.max_buffered_spans:
+            self.dropped += 1
+            return
+
+        self._buffer.append(span)
+        if len(self._buffer) >= self.batch_size and self._pending_flush is None:
+            with suppress(RuntimeError):
+                self._pending_flush = asyncio.get_running_loop().create_task(
+                    self.flush()
+                )
+
+    async def flush(self) -> None:
+        """Export every buffered span."""
+        self._pending_flush = None
+        spans, self._buffer = self._buffer, []
+        if not spans or self.exporter is None:
+            return
+
+        try:
+            await self.exporter.export(spans)
+        except Exception as e:
+            self.dropped += len(spans)
+            logger.warning(f"Failed to export {len(spans)} spans: {e}")
+
+    async def _flush_periodically(self) -> None:
+        """Flush the buffer every flush interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    async def start(self) -> None:
+        """Start periodic flushing."""
+        if self.exporter is not None and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing, export what is left and close the exporter."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        await self.flush()
+        if self.exporter is not None:
+            await self.exporter.close()
+
+
+# Process-wide tracer, configured with an exporter at startup
+default_tracer = Tracer()
@@ -4,17 +4,74 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import signal
 import sys
+from pathlib import Path
+
+import redis.asyncio as redis
 
 from src.config import Config
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import LyricsRepository
+from src.domain.repositories.message_repository import MessageRepository
+from src.infrastructure.cache.background_refresher import BackgroundRefresher
+from src.infrastructure.cache.cached_lyrics_repository import (
+    CachedLyricsRepository,
+)
+from src.infrastructure.cache.coalescing_lyrics_repository import (
+    CoalescingLyricsRepository,
+)
+from src.infrastructure.cache.lru_cache import TTLLRUCache
+from src.infrastructure.cache.persistent_lyrics_repository import (
+    PersistentLyricsRepository,
+)
+from src.infrastructure.cache.prefetching_lyrics_repository import (
+    PrefetchingLyricsRepository,
+)
+from src.infrastructure.cache.segment_store import SegmentStore
+from src.infrastructure.external.circuit_breaker_lyrics_repository import (
+    CircuitBreakerLyricsRepository,
+)
+from src.infrastructure.external.composite_lyrics_repository import (
+    CompositeLyricsRepository,
+    ProviderMode,
+)
+from src.infrastructure.external.genius_client import GeniusClient
 from src.infrastructure.external.genius_lyrics_repository import (
     GeniusLyricsRepository,
 )
+from src.infrastructure.external.musixmatch_lyrics_repository import (
+    MusixmatchLyricsRepository,
+)
 from src.infrastructure.messaging.redis_message_repository import (
     RedisMessageRepository,
 )
-from src.presentation.lyrics_fetcher_service import LyricsFetcherService
+from src.infrastructure.messaging.redis_request_lease import RedisRequestLease
+from src.infrastructure.messaging.redis_streams_message_repository import (
+    RedisStreamsMessageRepository,
+)
+from src.infrastructure.messaging.result_codec import ResultCodec
+from src.infrastructure.ratelimit.rate_limiter import RateLimiter
+from src.infrastructure.ratelimit.redis_token_bucket import RedisTokenBucket
+from src.infrastructure.ratelimit.token_bucket import TokenBucket
+from src.infrastructure.resilience.circuit_breaker import CircuitBreaker
+from src.infrastructure.tracing.json_lines_span_exporter import (
+    JsonLinesSpanExporter,
+)
+from src.infrastructure.tracing.otlp_span_exporter import OTLPSpanExporter
+from src.infrastructure.tracing.span_exporter import SpanExporter
+from src.infrastructure.tracing.tracer import default_tracer
+from src.presentation.lyrics_fetcher_service import (
+    LyricsFetcherService,
+    OverflowPolicy,
+)
+from src.presentation.metrics_server import MetricsServer
+from src.presentation.worker_supervisor import (
+    HealthQueue,
+    WorkerSupervisor,
+    report_health,
+)
 from src.use_cases.search_lyrics import SearchLyricsUseCase
 
 
@@ -32,27 +89,353 @@ def setup_logging(log_level: str) -> None:
     )
 
 
-def create_service(config: Config) -> LyricsFetcherService:
+def create_rate_limiter(config: Config) -> RateLimiter | None:
+    """
+    Create the rate limiter for Genius API calls.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Local or Redis-backed token bucket, or None if rate limiting is disabled
+    """
+    if config.genius_rate_limit <= 0:
+        return None
+
+    if config.genius_rate_limit_backend == "local":
+        return TokenBucket(
+            rate=config.genius_rate_limit, burst=config.genius_rate_burst
+        )
+
+    if config.genius_rate_limit_backend == "redis":
+        return RedisTokenBucket(
+            client=redis.Redis(
+                host=config.redis_host,
+                port=config.redis_port,
+                db=config.redis_db,
+                password=config.redis_password,
+                decode_responses=True,
+            ),
+            rate=config.genius_rate_limit,
+            burst=config.genius_rate_burst,
+            key=config.genius_rate_limit_key,
+        )
+
+    raise ValueError(f"Unknown rate limit backend: {config.genius_rate_limit_backend}")
+
+
+def create_span_exporter(
+    config: Config, worker_index: int | None = None
+) -> SpanExporter | None:
+    """
+    Create the exporter for request traces.
+
+    Args:
+        config: Application configuration
+        worker_index: Index of this worker when supervised (optional)
+
+    Returns:
+        File or OTLP exporter, or None if tracing export is disabled
+    """
+    if config.tracing_exporter == "none":
+        return None
+
+    if config.tracing_exporter == "file":
+        path = Path(config.tracing_file_path)
+        if worker_index is not None:
+            # One file per worker so processes never interleave writes
+            path = path.with_name(f"{path.stem}.{worker_index}{path.suffix}")
+        return JsonLinesSpanExporter(path)
+
+    if config.tracing_exporter == "otlp":
+        return OTLPSpanExporter(endpoint=config.tracing_otlp_endpoint)
+
+    raise ValueError(f"Unknown tracing exporter: {config.tracing_exporter}")
+
+
+def create_message_repository(config: Config) -> MessageRepository:
+    """
+    Create the message repository for the configured transport.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Message repository for pub/sub or Redis Streams
+    """
+    result_codec = ResultCodec(
+        result_format=config.result_format,
+        compression=config.result_compression,
+        compress_threshold=config.result_compress_threshold_bytes,
+    )
+
+    if config.message_transport == "pubsub":
+        return RedisMessageRepository(
+            host=config.redis_host,
+            port=config.redis_port,
+            db=config.redis_db,
+            password=config.redis_password,
+            request_channel=config.redis_request_channel,
+            result_channel=config.redis_result_channel,
+            read_batch_size=config.redis_read_batch_size,
+            publish_batch_size=config.redis_publish_batch_size,
+            publish_linger_ms=config.redis_publish_linger_ms,
+            pool_size=config.redis_pool_size,
+            health_check_interval=config.redis_health_check_interval_seconds,
+            reconnect_backoff=config.redis_reconnect_backoff_seconds,
+            reconnect_backoff_max=config.redis_reconnect_backoff_max_seconds,
+            result_codec=result_codec,
+        )
+
+    if config.message_transport == "streams":
+        return RedisStreamsMessageRepository(
+            host=config.redis_host,
+            port=config.redis_port,
+            db=config.redis_db,
+            password=config.redis_password,
+            request_stream=config.redis_request_stream,
+            result_channel=config.redis_result_channel,
+            consumer_group=config.redis_consumer_group,
+            consumer_name=config.redis_consumer_name,
+            batch_size=config.redis_read_batch_size,
+            publish_batch_size=config.redis_publish_batch_size,
+            publish_linger_ms=config.redis_publish_linger_ms,
+            pool_size=config.redis_pool_size,
+            health_check_interval=config.redis_health_check_interval_seconds,
+            reconnect_backoff=config.redis_reconnect_backoff_seconds,
+            reconnect_backoff_max=config.redis_reconnect_backoff_max_seconds,
+            result_codec=result_codec,
+            claim_min_idle_ms=config.redis_stream_claim_idle_ms,
+            max_len=config.redis_stream_max_len,
+        )
+
+    raise ValueError(f"Unknown message transport: {config.message_transport}")
+
+
+def lyrics_provider_names(config: Config) -> list[str]:
+    """
+    List the configured lyrics providers in order.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Provider names
+    """
+    return [name.strip() for name in config.lyrics_providers.split(",") if name.strip()]
+
+
+def create_lyrics_provider(
+    name: str, config: Config, genius_rate_limiter: RateLimiter | None = None
+) -> LyricsRepository:
+    """
+    Create a single lyrics provider.
+
+    Args:
+        name: Provider name ("genius" or "musixmatch")
+        config: Application configuration
+        genius_rate_limiter: Limiter for Genius API calls (optional)
+
+    Returns:
+        Lyrics repository for the provider
+    """
+    if name == "genius":
+        genius_client = GeniusClient(
+            api_token=config.genius_api_token,
+            rate_limiter=genius_rate_limiter,
+            max_retries=config.genius_max_retries,
+        )
+        return GeniusLyricsRepository(
+            api_token=config.genius_api_token, client=genius_client
+        )
+
+    if name == "musixmatch":
+        return MusixmatchLyricsRepository()
+
+    raise ValueError(f"Unknown lyrics provider: {name}")
+
+
+def create_lyrics_repository(
+    config: Config, genius_rate_limiter: RateLimiter | None = None
+) -> LyricsRepository:
+    """
+    Create the lyrics repository for the configured providers.
+
+    Args:
+        config: Application configuration
+        genius_rate_limiter: Limiter for Genius API calls (optional)
+
+    Returns:
+        The only provider, or a composite of all providers
+    """
+    providers = {
+        name: create_lyrics_provider(name, config, genius_rate_limiter)
+        for name in lyrics_provider_names(config)
+    }
+
+    if config.circuit_breaker_enabled:
+        providers = {
+            name: CircuitBreakerLyricsRepository(
+                inner=provider,
+                breaker=CircuitBreaker(
+                    name=name,
+                    window_seconds=config.circuit_breaker_window_seconds,
+                    min_calls=config.circuit_breaker_min_calls,
+                    failure_rate=config.circuit_breaker_failure_rate,
+                    slow_call_seconds=config.circuit_breaker_slow_call_seconds,
+                    open_seconds=config.circuit_breaker_open_seconds,
+                ),
+            )
+            for name, provider in providers.items()
+        }
+
+    if len(providers) == 1:
+        return next(iter(providers.values()))
+
+    return CompositeLyricsRepository(
+        providers=providers,
+        mode=ProviderMode(config.lyrics_provider_mode),
+        hedge_delay_seconds=config.lyrics_hedge_delay_ms / 1000,
+    )
+
+
+def create_prefetching_repository(
+    config: Config,
+    lyrics_repository: LyricsRepository,
+    genius_rate_limiter: RateLimiter | None = None,
+) -> LyricsRepository:
+    """
+    Wrap the lyrics repository to prefetch songs related to each search.
+
+    Args:
+        config: Application configuration
+        lyrics_repository: Caching repository prefetched songs go through
+        genius_rate_limiter: Limiter shared with the Genius provider, so
+            prefetching spends the same Genius API budget (optional)
+
+    Returns:
+        The prefetching repository, or the given one if prefetching cannot
+        be used with this configuration
+    """
+    logger = logging.getLogger(__name__)
+
+    if not config.cache_enabled:
+        logger.warning("Prefetching requires CACHE_ENABLED=true, disabling it")
+        return lyrics_repository
+    if "genius" not in lyrics_provider_names(config):
+        logger.warning("Prefetching requires the genius provider, disabling it")
+        return lyrics_repository
+
+    related = GeniusLyricsRepository(
+        api_token=config.genius_api_token,
+        client=GeniusClient(
+            api_token=config.genius_api_token,
+            rate_limiter=genius_rate_limiter,
+            max_retries=config.genius_max_retries,
+        ),
+    )
+    return PrefetchingLyricsRepository(
+        inner=lyrics_repository,
+        related=related,
+        pool=BackgroundRefresher(
+            workers=config.prefetch_workers,
+            queue_size=config.prefetch_queue_size,
+            rate_limiter=TokenBucket(rate=config.prefetch_rate, burst=1),
+            name="prefetch",
+        ),
+        max_songs=config.prefetch_max_songs,
+        remember_seconds=config.cache_ttl_seconds,
+    )
+
+
+def create_service(
+    config: Config,
+    message_repository: MessageRepository | None = None,
+    worker_index: int | None = None,
+) -> LyricsFetcherService:
     """
     Create and wire up the service with all dependencies.
 
     Args:
         config: Application configuration
+        message_repository: Request source replacing the configured transport
+        worker_index: Index of this worker when supervised (optional)
 
     Returns:
         Configured LyricsFetcherService instance
     """
-    # Create repositories
-    lyrics_repository = GeniusLyricsRepository(api_token=config.genius_api_token)
+    # Create repositories. Every Genius client shares one rate limiter, so
+    # prefetching cannot raise the request rate above GENIUS_RATE_LIMIT.
+    genius_rate_limiter = None
+    if "genius" in lyrics_provider_names(config):
+        genius_rate_limiter = create_rate_limiter(config)
+    lyrics_repository = create_lyrics_repository(config, genius_rate_limiter)
 
-    message_repository = RedisMessageRepository(
-        host=config.redis_host,
-        port=config.redis_port,
-        db=config.redis_db,
-        password=config.redis_password,
-        request_channel=config.redis_request_channel,
-        result_channel=config.redis_result_channel,
-    )
+    if config.persistent_store_enabled:
+        path = Path(config.persistent_store_path)
+        if worker_index is not None:
+            # The store is single-writer, so every worker keeps its own
+            path = path.with_name(f"{path.name}.{worker_index}")
+        lyrics_repository = PersistentLyricsRepository(
+            inner=lyrics_repository,
+            store=SegmentStore(path, max_bytes=config.persistent_store_max_bytes),
+        )
+
+    if config.cache_enabled:
+        refresher = None
+        if config.cache_refresh_after_seconds > 0:
+            refresher = BackgroundRefresher(
+                workers=config.cache_refresh_workers,
+                queue_size=config.cache_refresh_queue_size,
+                rate_limiter=TokenBucket(rate=config.cache_refresh_rate, burst=1),
+            )
+        lyrics_repository = CachedLyricsRepository(
+            inner=lyrics_repository,
+            local_cache=TTLLRUCache[str, Song](
+                max_entries=config.cache_max_entries,
+                ttl_seconds=config.cache_ttl_seconds,
+            ),
+            redis_client=redis.Redis(
+                host=config.redis_host,
+                port=config.redis_port,
+                db=config.redis_db,
+                password=config.redis_password,
+                decode_responses=True,
+            ),
+            redis_ttl_seconds=config.redis_cache_ttl_seconds,
+            key_prefix=config.redis_cache_prefix,
+            negative_ttl_seconds=config.cache_negative_ttl_seconds,
+            refresher=refresher,
+            refresh_after_seconds=config.cache_refresh_after_seconds,
+        )
+
+    # Identical concurrent searches share one upstream lookup
+    lyrics_repository = CoalescingLyricsRepository(inner=lyrics_repository)
+
+    if config.prefetch_enabled:
+        lyrics_repository = create_prefetching_repository(
+            config, lyrics_repository, genius_rate_limiter
+        )
+
+    uses_pubsub = message_repository is None and config.message_transport == "pubsub"
+    if message_repository is None:
+        message_repository = create_message_repository(config)
+
+    # Leases only make sense for requests every replica receives; items of
+    # a given message repository (e.g. a backfill batch) are this process's own
+    request_lease = None
+    if config.request_lease_enabled and uses_pubsub:
+        request_lease = RedisRequestLease(
+            client=redis.Redis(
+                host=config.redis_host,
+                port=config.redis_port,
+                db=config.redis_db,
+                password=config.redis_password,
+                decode_responses=True,
+            ),
+            lease_ms=config.request_lease_ms,
+            key_prefix=config.request_lease_prefix,
+        )
 
     # Create use case
     search_lyrics_use_case = SearchLyricsUseCase(lyrics_repository=lyrics_repository)
@@ -61,24 +444,52 @@ def create_service(config: Config) -> LyricsFetcherService:
     service = LyricsFetcherService(
         message_repository=message_repository,
         search_lyrics_use_case=search_lyrics_use_case,
+        max_concurrent_tasks=config.max_concurrent_tasks,
+        queue_size=config.queue_size,
+        overflow_policy=OverflowPolicy(config.overflow_policy),
+        reserved_high_priority_tasks=config.high_priority_reserved_tasks,
+        high_priority_weight=config.high_priority_weight,
+        request_lease=request_lease,
     )
 
     return service
 
 
-async def main() -> None:
-    """Main application function."""
-    # Load configuration
-    config = Config.from_env()
+def worker_process_count(config: Config) -> int:
+    """
+    Resolve the number of worker processes to run.
 
-    # Setup logging
-    setup_logging(config.log_level)
+    Args:
+        config: Application configuration
 
+    Returns:
+        Configured process count, or one per CPU core if set to 0
+    """
+    if config.worker_processes > 0:
+        return config.worker_processes
+    return os.cpu_count() or 1
+
+
+async def run_service(
+    config: Config,
+    worker_index: int | None = None,
+    health_queue: HealthQueue | None = None,
+    handle_sigint: bool = True,
+) -> None:
+    """
+    Run one fetcher service until it is stopped by a signal.
+
+    Args:
+        config: Application configuration
+        worker_index: Index of this worker when supervised (optional)
+        health_queue: Queue for heartbeats to the supervisor (optional)
+        handle_sigint: Whether SIGINT stops the service; supervised workers
+            leave it ignored and wait for the SIGTERM the supervisor relays
+    """
     logger = logging.getLogger(__name__)
-    logger.info("Starting Lyrics Fetcher application")
 
     # Create service
-    service = create_service(config)
+    service = create_service(config, worker_index=worker_index)
 
     # Setup signal handlers for graceful shutdown
     loop = asyncio.get_running_loop()
@@ -87,12 +498,128 @@ async def main() -> None:
         logger.info("Received shutdown signal")
         asyncio.create_task(service.stop())
 
-    for sig in (signal.SIGINT, signal.SIGTERM):
+    signals = (signal.SIGINT, signal.SIGTERM) if handle_sigint else (signal.SIGTERM,)
+    for sig in signals:
         loop.add_signal_handler(sig, signal_handler)
 
+    health_task = None
+    if worker_index is not None and health_queue is not None:
+        health_task = asyncio.create_task(
+            report_health(
+                service,
+                worker_index,
+                health_queue,
+                config.health_report_interval_seconds,
+            )
+        )
+
+    default_tracer.exporter = create_span_exporter(config, worker_index)
+    await default_tracer.start()
+
+    metrics_server = None
+    if config.metrics_enabled:
+        metrics_server = MetricsServer(
+            host=config.metrics_host,
+            port=config.metrics_port + (worker_index or 0),
+        )
+        await metrics_server.start()
+
     # Start service
     try:
         await service.start()
+    finally:
+        if health_task is not None:
+            health_task.cancel()
+        if metrics_server is not None:
+            await metrics_server.stop()
+        await default_tracer.stop()
+
+
+def run_worker(index: int, health_queue: HealthQueue) -> None:
+    """
+    Entry point of a supervised worker process.
+
+    Args:
+        index: Worker index assigned by the supervisor
+        health_queue: Queue for heartbeats to the supervisor
+    """
+    # Ctrl+C reaches the whole process group; let the supervisor relay SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    config = Config.from_env()
+    setup_logging(config.log_level)
+    if config.redis_consumer_name:
+        config.redis_consumer_name = f"{config.redis_consumer_name}-{index}"
+
+    asyncio.run(
+        run_service(
+            config,
+            worker_index=index,
+            health_queue=health_queue,
+            handle_sigint=False,
+        )
+    )
+
+
+async def run_supervisor(config: Config, processes: int) -> None:
+    """
+    Run the service in several supervised worker processes.
+
+    Args:
+        config: Application configuration
+        processes: Number of worker processes
+    """
+    logger = logging.getLogger(__name__)
+
+    if config.message_transport != "streams" and not config.request_lease_enabled:
+        raise ValueError(
+            "Multiple worker processes require MESSAGE_TRANSPORT=streams or "
+            "REQUEST_LEASE_ENABLED=true; with pub/sub every process would "
+            "otherwise process every request"
+        )
+    if config.genius_rate_limit > 0 and config.genius_rate_limit_backend == "local":
+        logger.warning(
+            "Local rate limiting applies per process; use "
+            "GENIUS_RATE_LIMIT_BACKEND=redis to share one budget"
+        )
+
+    supervisor = WorkerSupervisor(
+        target=run_worker,
+        processes=processes,
+        health_interval_seconds=config.health_report_interval_seconds,
+    )
+
+    loop = asyncio.get_running_loop()
+
+    def signal_handler() -> None:
+        logger.info("Received shutdown signal, stopping workers")
+        supervisor.stop()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler)
+
+    logger.info(f"Starting {processes} worker processes")
+    await supervisor.run()
+
+
+async def main() -> None:
+    """Main application function."""
+    # Load configuration
+    config = Config.from_env()
+
+    # Setup logging
+    setup_logging(config.log_level)
+
+    logger = logging.getLogger(__name__)
+    logger.info("Starting Lyrics Fetcher application")
+
+    processes = worker_process_count(config)
+
+    try:
+        if processes > 1:
+            await run_supervisor(config, processes)
+        else:
+            await run_service(config)
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
@@ -4,14 +4,87 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import time
+from dataclasses import dataclass
+from enum import StrEnum
 
+from src.domain.entities.priority import Priority
+from src.domain.entities.result_status import ResultStatus
 from src.domain.entities.search_request import SearchRequest
+from src.domain.repositories.lyrics_repository import UpstreamUnavailableError
 from src.domain.repositories.message_repository import MessageRepository
+from src.infrastructure.concurrency.priority_work_queue import PriorityWorkQueue
+from src.infrastructure.messaging.redis_request_lease import RedisRequestLease
+from src.infrastructure.metrics.common import ERRORS
+from src.infrastructure.metrics.registry import default_registry
+from src.infrastructure.tracing.tracer import default_tracer
 from src.use_cases.search_lyrics import SearchLyricsUseCase
 
 logger = logging.getLogger(__name__)
 
+REQUESTS = default_registry.counter(
+    "fetcher_requests_total", "Search requests by outcome", ["outcome"]
+)
+REQUEST_DURATION = default_registry.histogram(
+    "fetcher_request_duration_seconds",
+    "Time from a worker picking up a request to its result being published",
+)
+QUEUE_WAIT = default_registry.histogram(
+    "fetcher_queue_wait_seconds",
+    "Time requests spent waiting for a worker",
+    ["priority"],
+)
+IN_FLIGHT = default_registry.gauge(
+    "fetcher_in_flight_requests", "Requests currently being processed"
+)
+WORKERS = default_registry.gauge(
+    "fetcher_max_concurrent_tasks", "Number of workers processing requests"
+)
+QUEUE_DEPTH = default_registry.gauge(
+    "fetcher_queue_depth", "Requests waiting in the work queue"
+)
+QUEUE_CAPACITY = default_registry.gauge(
+    "fetcher_queue_capacity", "Maximum number of requests in the work queue"
+)
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with an incoming request when the work queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+
+@dataclass
+class _QueuedRequest:
+    """A request waiting in the work queue."""
+
+    request: SearchRequest
+    enqueued_at: float
+
+
+@dataclass
+class ServiceStats:
+    """Snapshot of the service's admission and queueing counters."""
+
+    queue_depth: int = 0
+    queue_capacity: int = 0
+    in_flight: int = 0
+    accepted: int = 0
+    dropped: int = 0
+    rejected: int = 0
+    expired: int = 0
+    duplicates: int = 0
+    processed: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+
+    @property
+    def queue_wait_seconds_avg(self) -> float:
+        """Average time a processed request spent in the queue."""
+        return self.queue_wait_seconds_total / self.processed if self.processed else 0.0
+
 
 class LyricsFetcherService:
     """Service that listens to Redis requests and publishes results."""
@@ -21,6 +94,11 @@ class LyricsFetcherService:
         message_repository: MessageRepository,
         search_lyrics_use_case: SearchLyricsUseCase,
         max_concurrent_tasks: int = 10,
+        queue_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        reserved_high_priority_tasks: int = 0,
+        high_priority_weight: int = 4,
+        request_lease: RedisRequestLease | None = None,
     ) -> None:
         """
         Initialize the fetcher service.
@@ -28,46 +106,327 @@ class LyricsFetcherService:
         Args:
             message_repository: Repository for pub/sub operations
             search_lyrics_use_case: Use case for searching lyrics
-            max_concurrent_tasks: Maximum number of concurrent tasks to process
+            max_concurrent_tasks: Number of workers processing requests concurrently
+            queue_size: Maximum number of requests waiting for a worker
+            overflow_policy: Behaviour when a request arrives and the queue is full
+            reserved_high_priority_tasks: Workers kept free of low-priority requests
+            high_priority_weight: High-priority requests started per low-priority
+                one while both are waiting
+            request_lease: Cross-replica claim skipping requests another
+                replica is processing, renewed when a worker picks the
+                request up (optional, owned by this service)
         """
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive")
+
         self.message_repository = message_repository
         self.search_lyrics_use_case = search_lyrics_use_case
         self._running = False
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._semaphore: asyncio.Semaphore | None = None
-        self._tasks: set[asyncio.Task[Any]] = set()
+        self._queue_size = queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._reserved_high_priority_tasks = reserved_high_priority_tasks
+        self._high_priority_weight = high_priority_weight
+        self._request_lease = request_lease
+        self._queue: PriorityWorkQueue[_QueuedRequest] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._subscription: asyncio.Task[None] | None = None
+        self._stop_task: asyncio.Task[None] | None = None
+        self._stats = ServiceStats(queue_capacity=queue_size)
+
+    @property
+    def stats(self) -> ServiceStats:
+        """Current admission and queueing counters."""
+        self._stats.queue_depth = self._queue.qsize() if self._queue else 0
+        return self._stats
 
-    async def _process_request(self, request: SearchRequest) -> None:
+    async def _process_request(
+        self, request: SearchRequest, queued_seconds: float = 0.0
+    ) -> None:
         """
         Process a single request asynchronously.
 
+        The request is traced from the moment it was queued; requests without
+        a trace ID get a new one, which is echoed in the result.
+
         Args:
             request: Search request to process
+            queued_seconds: Time the request spent in the work queue
         """
-        if self._semaphore is None:
-            raise RuntimeError("Semaphore not initialized")
+        now_ns = time.time_ns()
+        received_ns = now_ns - int(queued_seconds * 1e9)
+
+        with default_tracer.span(
+            "process_request",
+            trace_id=request.trace_id,
+            start_ns=received_ns,
+            title=request.title,
+            artist=request.artist,
+        ) as span:
+            request.trace_id = span.trace_id
+            default_tracer.record("queue_wait", received_ns, now_ns)
 
-        async with self._semaphore:
             try:
                 logger.info(f"Processing request: {request.title} - {request.artist}")
 
-                # Search for lyrics
-                song = await self.search_lyrics_use_case.execute(request)
+                # Search for lyrics, abandoning the lookup once the requester
+                # has given up; cancellation reaches the in-flight HTTP calls
+                try:
+                    async with asyncio.timeout(request.remaining_seconds()) as deadline:
+                        song = await self.search_lyrics_use_case.execute(request)
+                except TimeoutError:
+                    if not deadline.expired():
+                        raise
+                    self._record_expired(request, "during lookup")
+                    span.set_attribute("outcome", "expired")
+                    return
 
                 if song:
                     # Publish result with original request info
                     await self.message_repository.publish_result(song, request)
+                    REQUESTS.inc(outcome="found")
+                    span.set_attribute("outcome", "found")
                     logger.info(f"Successfully processed: {song.title}")
                 else:
                     logger.warning(
                         f"No results found for: {request.title} - {request.artist}"
                     )
+                    await self.message_repository.publish_status(
+                        request, ResultStatus.NOT_FOUND
+                    )
+                    REQUESTS.inc(outcome="not_found")
+                    span.set_attribute("outcome", "not_found")
 
+            except UpstreamUnavailableError as e:
+                logger.warning(
+                    f"Failing fast for {request.title} - {request.artist}: {e}"
+                )
+                REQUESTS.inc(outcome="unavailable")
+                span.set_attribute("outcome", "unavailable")
+                await self._publish_error(request, ResultStatus.UNAVAILABLE, str(e))
             except Exception as e:
                 logger.error(
                     f"Error processing request {request.title} - {request.artist}: {e}",
                     exc_info=True,
                 )
+                REQUESTS.inc(outcome="error")
+                ERRORS.inc(stage="process", type=type(e).__name__)
+                span.error = type(e).__name__
+                await self._publish_error(request)
+            finally:
+                await self._release_lease(request)
+                await self._acknowledge(request)
+
+    def _record_expired(self, request: SearchRequest, stage: str) -> None:
+        """
+        Count a request abandoned because its deadline passed.
+
+        No result is published, since nobody is waiting for it any more.
+
+        Args:
+            request: Expired request
+            stage: Where the deadline was noticed, for the log
+        """
+        logger.warning(
+            f"Deadline passed {stage}, dropping: {request.title} - {request.artist}"
+        )
+        self._stats.expired += 1
+        REQUESTS.inc(outcome="expired")
+
+    async def _release_lease(self, request: SearchRequest) -> None:
+        """
+        Hand back the cross-replica lease of an admitted request, if any.
+
+        Args:
+            request: Request leaving the service
+        """
+        if self._request_lease is not None:
+            await self._request_lease.release(request)
+
+    async def _skip_duplicate(self, request: SearchRequest) -> None:
+        """
+        Drop a request whose song another replica is looking up.
+
+        With pub/sub that replica received the same request, and its result
+        answers it.
+
+        Args:
+            request: Request leased elsewhere
+        """
+        logger.debug(
+            f"Skipping request leased elsewhere: {request.title} - {request.artist}"
+        )
+        self._stats.duplicates += 1
+        REQUESTS.inc(outcome="duplicate")
+        await self._acknowledge(request)
+
+    async def _acknowledge(self, request: SearchRequest) -> None:
+        """
+        Acknowledge a processed request without failing the task.
+
+        Args:
+            request: Processed search request
+        """
+        try:
+            await self.message_repository.acknowledge(request)
+        except Exception as e:
+            logger.error(
+                f"Error acknowledging request {request.title} - {request.artist}: {e}",
+                exc_info=True,
+            )
+
+    async def _publish_error(
+        self,
+        request: SearchRequest,
+        status: ResultStatus = ResultStatus.ERROR,
+        detail: str = "Lyrics lookup failed",
+    ) -> None:
+        """
+        Tell the requester that processing failed instead of letting it time out.
+
+        Args:
+            request: Request whose processing raised
+            status: Failure status to report
+            detail: Human-readable explanation
+        """
+        try:
+            await self.message_repository.publish_status(request, status, detail)
+        except Exception as e:
+            logger.error(f"Error publishing error status: {e}", exc_info=True)
+
+    async def _reject(self, request: SearchRequest, reason: str) -> None:
+        """
+        Answer a request that will not be processed with an error result.
+
+        Args:
+            request: Request turned away by admission control
+            reason: Why the request was not processed
+        """
+        logger.warning(f"{reason}: {request.title} - {request.artist}")
+        try:
+            await self.message_repository.publish_status(
+                request, ResultStatus.REJECTED, reason
+            )
+        except Exception as e:
+            logger.error(f"Error publishing rejection: {e}", exc_info=True)
+        finally:
+            await self._release_lease(request)
+            await self._acknowledge(request)
+
+    async def _admit(self, request: SearchRequest) -> None:
+        """
+        Put a request on the work queue according to the overflow policy.
+
+        With the blocking policy this waits for free capacity, which stops the
+        subscription loop from pulling further messages until a worker frees up.
+        Otherwise a full queue makes room for a high-priority request at the
+        expense of a waiting low-priority one, and a low-priority request
+        never pushes out a high-priority one.
+
+        Args:
+            request: Incoming search request
+        """
+        if self._queue is None:
+            raise RuntimeError("Work queue not initialized")
+
+        if request.expired():
+            self._record_expired(request, "before admission")
+            await self._acknowledge(request)
+            return
+
+        if self._request_lease is not None and not await self._request_lease.acquire(
+            request
+        ):
+            await self._skip_duplicate(request)
+            return
+
+        item = _QueuedRequest(request=request, enqueued_at=time.monotonic())
+
+        if self._queue.full() and self._overflow_policy is not OverflowPolicy.BLOCK:
+            victim, reason = self._overflow_victim(request.priority)
+            if victim is None:
+                self._stats.rejected += 1
+                REQUESTS.inc(outcome="rejected")
+                await self._reject(request, "Work queue is full")
+                return
+
+            self._stats.dropped += 1
+            REQUESTS.inc(outcome="dropped")
+            await self._reject(victim.request, reason)
+
+        await self._queue.put(item, request.priority)
+        self._stats.accepted += 1
+
+    def _overflow_victim(self, priority: Priority) -> tuple[_QueuedRequest | None, str]:
+        """
+        Take a waiting request out of the full queue to make room, if allowed.
+
+        Args:
+            priority: Priority of the incoming request
+
+        Returns:
+            The removed request (None if the incoming one must be rejected)
+            and the reason reported to its requester
+        """
+        if self._queue is None:
+            raise RuntimeError("Work queue not initialized")
+
+        if self._overflow_policy is OverflowPolicy.DROP_OLDEST:
+            victim = self._queue.pop_oldest(Priority.LOW)
+            if victim is None and priority is Priority.HIGH:
+                victim = self._queue.pop_oldest(Priority.HIGH)
+            return victim, "Dropped from full work queue"
+
+        if priority is Priority.HIGH:
+            victim = self._queue.pop_newest(Priority.LOW)
+            return victim, "Displaced by a high-priority request"
+        return None, ""
+
+    async def _worker(self) -> None:
+        """Take requests from the work queue and process them one at a time."""
+        if self._queue is None:
+            raise RuntimeError("Work queue not initialized")
+
+        while True:
+            item, priority = await self._queue.get()
+            if item.request.expired():
+                # Dropped before taking up a worker
+                try:
+                    self._record_expired(item.request, "in the work queue")
+                    await self._release_lease(item.request)
+                    await self._acknowledge(item.request)
+                finally:
+                    await self._queue.task_done(priority)
+                continue
+
+            if self._request_lease is not None and not await self._request_lease.renew(
+                item.request
+            ):
+                # The lease ran out while the request waited and another
+                # replica claimed the song
+                try:
+                    await self._release_lease(item.request)
+                    await self._skip_duplicate(item.request)
+                finally:
+                    await self._queue.task_done(priority)
+                continue
+
+            try:
+                waited = time.monotonic() - item.enqueued_at
+                self._stats.queue_wait_seconds_total += waited
+                self._stats.queue_wait_seconds_max = max(
+                    self._stats.queue_wait_seconds_max, waited
+                )
+                QUEUE_WAIT.observe(waited, priority=priority.value)
+                self._stats.in_flight += 1
+                IN_FLIGHT.inc()
+                with REQUEST_DURATION.time():
+                    await self._process_request(item.request, waited)
+            finally:
+                self._stats.in_flight -= 1
+                IN_FLIGHT.dec()
+                self._stats.processed += 1
+                await self._queue.task_done(priority)
 
     async def start(self) -> None:
         """Start the lyrics fetcher service."""
@@ -76,20 +435,35 @@ class LyricsFetcherService:
         try:
             await self.message_repository.connect()
             self._running = True
-            self._semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
+            self._queue = PriorityWorkQueue(
+                capacity=self._queue_size,
+                workers=self._max_concurrent_tasks,
+                reserved_workers=self._reserved_high_priority_tasks,
+                high_weight=self._high_priority_weight,
+            )
+            WORKERS.set(self._max_concurrent_tasks)
+            QUEUE_CAPACITY.set(self._queue_size)
+            QUEUE_DEPTH.set_function(lambda: self.stats.queue_depth)
+            self._workers = [
+                asyncio.create_task(self._worker())
+                for _ in range(self._max_concurrent_tasks)
+            ]
 
             logger.info(
-                f"Service started. Waiting for requests (max {self._max_concurrent_tasks} concurrent tasks)..."
+                f"Service started. Waiting for requests (max {self._max_concurrent_tasks} concurrent tasks, "
+                f"queue size {self._queue_size}, overflow policy {self._overflow_policy.value}, "
+                f"{self._reserved_high_priority_tasks} reserved for high priority)..."
             )
 
-            async for request in self.message_repository.subscribe_requests():
-                if not self._running:
-                    break
-
-                # Create task for concurrent processing
-                task = asyncio.create_task(self._process_request(request))
-                self._tasks.add(task)
-                task.add_done_callback(self._tasks.discard)
+            self._subscription = asyncio.create_task(self._subscribe())
+            try:
+                await self._subscription
+            except asyncio.CancelledError:
+                # stop() cancels the subscription before draining the queue;
+                # only propagate if this task itself is being cancelled
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
 
         except asyncio.CancelledError:
             logger.info("Service cancelled")
@@ -100,15 +474,49 @@ class LyricsFetcherService:
         finally:
             await self.stop()
 
+    async def _subscribe(self) -> None:
+        """Admit incoming requests until the service stops."""
+        async for request in self.message_repository.subscribe_requests():
+            if not self._running:
+                break
+
+            await self._admit(request)
+
     async def stop(self) -> None:
-        """Stop the lyrics fetcher service."""
+        """
+        Stop the lyrics fetcher service.
+
+        Safe to call repeatedly and concurrently (e.g. from a signal handler
+        and from start() returning); every call waits for the same shutdown.
+        """
+        if self._stop_task is None:
+            self._stop_task = asyncio.create_task(self._shutdown())
+        await asyncio.shield(self._stop_task)
+
+    async def _shutdown(self) -> None:
+        """Stop admitting requests, drain the queue and release resources."""
         logger.info("Stopping lyrics fetcher service...")
         self._running = False
 
-        # Wait for all running tasks to complete
-        if self._tasks:
-            logger.info(f"Waiting for {len(self._tasks)} tasks to complete...")
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+        # No new requests may be admitted while the queue drains
+        if self._subscription is not None and not self._subscription.done():
+            self._subscription.cancel()
+            await asyncio.gather(self._subscription, return_exceptions=True)
+
+        # Let the workers drain every accepted request before shutting down
+        if self._queue is not None and self._workers:
+            pending = self._queue.qsize() + self._stats.in_flight
+            if pending:
+                logger.info(f"Waiting for {pending} tasks to complete...")
+            await self._queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
 
         await self.message_repository.disconnect()
+        await self.search_lyrics_use_case.close()
+        if self._request_lease is not None:
+            await self._request_lease.close()
         logger.info("Service stopped")
@@ -0,0 +1,65 @@
+"""HTTP endpoint exposing metrics to Prometheus."""
+
+from __future__ import annotations
+
+import logging
+
+from aiohttp import web
+
+from src.infrastructure.metrics.registry import MetricsRegistry, default_registry
+
+logger = logging.getLogger(__name__)
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """Small aiohttp server answering ``GET /metrics``."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = default_registry,
+        host: str = "0.0.0.0",
+        port: int = 9100,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            registry: Registry rendered on each scrape
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._runner: web.AppRunner | None = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """Render the registry in the Prometheus text format."""
+        return web.Response(
+            body=self.registry.render().encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    async def start(self) -> None:
+        """Start listening."""
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        # Resolve the actual port when 0 was requested
+        if self._runner.addresses:
+            self.port = self._runner.addresses[0][1]
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
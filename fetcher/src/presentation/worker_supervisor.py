@@ -0,0 +1,242 @@
+"""Supervisor running several fetcher worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from typing import Any
+
+from src.presentation.lyrics_fetcher_service import LyricsFetcherService, ServiceStats
+
+logger = logging.getLogger(__name__)
+
+HealthQueue = Queue[Any]
+WorkerTarget = Callable[[int, HealthQueue], None]
+
+
+@dataclass
+class WorkerHeartbeat:
+    """Periodic status report sent by a worker process."""
+
+    index: int
+    pid: int
+    stats: ServiceStats
+    sent_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class SupervisorHealth:
+    """Health of all workers, summed over their latest heartbeats."""
+
+    workers_total: int
+    workers_alive: int = 0
+    restarts: int = 0
+    accepted: int = 0
+    processed: int = 0
+    rejected: int = 0
+    dropped: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+
+
+async def report_health(
+    service: LyricsFetcherService,
+    index: int,
+    health_queue: HealthQueue,
+    interval_seconds: float,
+) -> None:
+    """
+    Send the service's stats to the supervisor until cancelled.
+
+    Args:
+        service: Service running in this worker
+        index: Worker index assigned by the supervisor
+        health_queue: Queue read by the supervisor
+        interval_seconds: Seconds between heartbeats
+    """
+    while True:
+        heartbeat = WorkerHeartbeat(index=index, pid=os.getpid(), stats=service.stats)
+        try:
+            health_queue.put_nowait(heartbeat)
+        except queue.Full:
+            logger.warning("Health queue is full, skipping heartbeat")
+        await asyncio.sleep(interval_seconds)
+
+
+class WorkerSupervisor:
+    """
+    Run a fixed number of worker processes and keep them alive.
+
+    Workers are started with the ``spawn`` method so each gets a fresh
+    interpreter and event loop. A worker that exits while the supervisor is
+    running is restarted after a short delay. ``stop`` sends SIGTERM to every
+    worker, waits for them to drain their queues, and kills whatever is
+    still running after the shutdown timeout.
+    """
+
+    def __init__(
+        self,
+        target: WorkerTarget,
+        processes: int,
+        health_interval_seconds: float = 30.0,
+        restart_delay_seconds: float = 1.0,
+        shutdown_timeout_seconds: float = 30.0,
+        poll_interval_seconds: float = 0.5,
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            target: Picklable function run in each worker with its index and
+                the health queue
+            processes: Number of worker processes
+            health_interval_seconds: Seconds between aggregated health logs
+            restart_delay_seconds: Delay before a crashed worker is restarted
+            shutdown_timeout_seconds: Grace period for workers on shutdown
+            poll_interval_seconds: How often worker liveness is checked
+        """
+        if processes <= 0:
+            raise ValueError("processes must be positive")
+
+        self.target = target
+        self.processes = processes
+        self.health_interval_seconds = health_interval_seconds
+        self.restart_delay_seconds = restart_delay_seconds
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self._context = multiprocessing.get_context("spawn")
+        self.health_queue: HealthQueue = self._context.Queue()
+        self._workers: dict[int, BaseProcess] = {}
+        self._restart_at: dict[int, float] = {}
+        self._heartbeats: dict[int, WorkerHeartbeat] = {}
+        self._restarts = 0
+        self._running = False
+
+    def health(self) -> SupervisorHealth:
+        """Aggregate the latest heartbeat of every live worker."""
+        self._collect_heartbeats()
+        alive = {
+            index for index, process in self._workers.items() if process.is_alive()
+        }
+        health = SupervisorHealth(
+            workers_total=self.processes,
+            workers_alive=len(alive),
+            restarts=self._restarts,
+        )
+        for index, heartbeat in self._heartbeats.items():
+            if index not in alive:
+                continue
+            stats = heartbeat.stats
+            health.accepted += stats.accepted
+            health.processed += stats.processed
+            health.rejected += stats.rejected
+            health.dropped += stats.dropped
+            health.in_flight += stats.in_flight
+            health.queue_depth += stats.queue_depth
+        return health
+
+    def _collect_heartbeats(self) -> None:
+        """Drain the health queue, keeping the newest heartbeat per worker."""
+        while True:
+            try:
+                heartbeat = self.health_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._heartbeats[heartbeat.index] = heartbeat
+
+    def _spawn(self, index: int) -> None:
+        """Start the worker process with the given index."""
+        process = self._context.Process(
+            target=self.target,
+            args=(index, self.health_queue),
+            name=f"lyrics-fetcher-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[index] = process
+        logger.info(f"Started worker {index} (pid {process.pid})")
+
+    def _check_workers(self) -> None:
+        """Schedule restarts for exited workers and start due ones."""
+        now = time.monotonic()
+
+        for index, process in list(self._workers.items()):
+            if index in self._restart_at or process.is_alive():
+                continue
+            process.join(timeout=0)
+            logger.warning(
+                f"Worker {index} (pid {process.pid}) exited with code "
+                f"{process.exitcode}, restarting in {self.restart_delay_seconds}s"
+            )
+            self._heartbeats.pop(index, None)
+            self._restart_at[index] = now + self.restart_delay_seconds
+
+        for index, restart_at in list(self._restart_at.items()):
+            if now >= restart_at:
+                del self._restart_at[index]
+                self._restarts += 1
+                self._spawn(index)
+
+    async def run(self) -> None:
+        """Start the workers and supervise them until ``stop`` is called."""
+        self._running = True
+        for index in range(self.processes):
+            self._spawn(index)
+
+        last_report = time.monotonic()
+        try:
+            while self._running:
+                self._check_workers()
+
+                if time.monotonic() - last_report >= self.health_interval_seconds:
+                    last_report = time.monotonic()
+                    health = self.health()
+                    logger.info(
+                        f"Health: {health.workers_alive}/{health.workers_total} "
+                        f"workers alive, {health.processed} processed, "
+                        f"{health.in_flight} in flight, {health.queue_depth} queued, "
+                        f"{health.rejected + health.dropped} rejected, "
+                        f"{health.restarts} restarts"
+                    )
+
+                await asyncio.sleep(self.poll_interval_seconds)
+        finally:
+            await self._shutdown()
+
+    def stop(self) -> None:
+        """Ask the supervisor to shut all workers down."""
+        self._running = False
+
+    async def _shutdown(self) -> None:
+        """Terminate the workers, escalating to SIGKILL after the timeout."""
+        self._running = False
+        self._restart_at.clear()
+
+        for process in self._workers.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_timeout_seconds
+        while time.monotonic() < deadline and any(
+            process.is_alive() for process in self._workers.values()
+        ):
+            await asyncio.sleep(self.poll_interval_seconds)
+
+        for index, process in self._workers.items():
+            if process.is_alive():
+                logger.warning(f"Worker {index} did not stop in time, killing it")
+                process.kill()
+            process.join()
+
+        self._collect_heartbeats()
+        self.health_queue.close()
+        self.health_queue.join_thread()
+        logger.info("All workers stopped")
@@ -32,6 +32,9 @@ class SearchLyricsUseCase:
 
         Returns:
             Song entity if found, None otherwise
+
+        Raises:
+            Exception: If the lyrics source could not be queried
         """
         logger.info(f"Searching for song: {request.to_search_query()}")
 
@@ -52,4 +55,8 @@ class SearchLyricsUseCase:
 
         except Exception as e:
             logger.error(f"Error searching for song: {e}", exc_info=True)
-            return None
+            raise
+
+    async def close(self) -> None:
+        """Release resources held by the underlying repository."""
+        await self.lyrics_repository.close()
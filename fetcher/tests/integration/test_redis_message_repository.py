@@ -8,6 +8,7 @@ import json
 import pytest
 import redis.asyncio as redis
 
+from src.domain.entities.result_status import ResultStatus
 from src.domain.entities.search_request import SearchRequest
 from src.domain.entities.song import Song
 from src.infrastructure.messaging.redis_message_repository import (
@@ -159,6 +160,38 @@ class TestRedisMessageRepository:
         await pubsub.close()
         assert received
 
+    async def test_publish_status(
+        self, repository: RedisMessageRepository, redis_client: redis.Redis
+    ) -> None:
+        """Test publishing a status result without a song."""
+        pubsub = redis_client.pubsub()
+        await pubsub.subscribe("test:results")
+
+        async for message in pubsub.listen():
+            if message["type"] == "subscribe":
+                break
+
+        original_request = SearchRequest(title="busy title", artist="busy artist")
+
+        await repository.publish_status(
+            original_request, ResultStatus.REJECTED, "Work queue is full"
+        )
+
+        received = False
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                data = json.loads(message["data"])
+                assert data["status"] == "rejected"
+                assert data["detail"] == "Work queue is full"
+                assert data["request_title"] == "busy title"
+                assert data["request_artist"] == "busy artist"
+                assert "lyrics" not in data
+                received = True
+                break
+
+        await pubsub.close()
+        assert received
+
     async def test_subscribe_requests(
         self, repository: RedisMessageRepository, redis_client: redis.Redis
     ) -> None:
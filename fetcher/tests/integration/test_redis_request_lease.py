@@ -0,0 +1,234 @@
+"""Integration tests for cross-replica request leases."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.asyncio as redis
+
+from src.domain.entities.search_request import SearchRequest
+from src.domain.entities.song import Song
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.messaging.redis_request_lease import RedisRequestLease
+from src.presentation.lyrics_fetcher_service import LyricsFetcherService
+
+# Mark all tests in this module as integration tests
+pytestmark = pytest.mark.integration
+
+PREFIX = "test:lease:"
+KEY = PREFIX + normalize_key("Song", "Artist")
+
+
+@pytest.fixture
+async def redis_client() -> AsyncIterator[redis.Redis]:
+    """Create a Redis client for testing."""
+    client = redis.Redis(host="localhost", port=6379, db=15, decode_responses=True)
+    try:
+        await client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not available")
+
+    yield client
+
+    # Cleanup
+    await client.flushdb()
+    await client.close()
+
+
+def make_lease(owner: str, lease_ms: int = 1000) -> RedisRequestLease:
+    """Create a lease manager with its own client, as each replica would."""
+    client = redis.Redis(host="localhost", port=6379, db=15, decode_responses=True)
+    return RedisRequestLease(
+        client=client,
+        lease_ms=lease_ms,
+        key_prefix=PREFIX,
+        owner=owner,
+    )
+
+
+class TestRedisRequestLease:
+    """Integration tests for RedisRequestLease."""
+
+    async def test_only_one_replica_gets_the_request(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a request is claimed once across replicas."""
+        # Arrange
+        first = make_lease("first")
+        second = make_lease("second")
+        request = SearchRequest(title="Song", artist="Artist")
+        duplicate = SearchRequest(title="song ", artist="ARTIST")
+
+        # Act
+        claimed = await asyncio.gather(
+            first.acquire(request), second.acquire(duplicate)
+        )
+
+        # Assert
+        assert sorted(claimed) == [False, True]
+        await first.close()
+        await second.close()
+
+    async def test_release_lets_the_next_request_through(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a finished request frees the key for later requests."""
+        first = make_lease("first")
+        second = make_lease("second")
+        request = SearchRequest(title="Song", artist="Artist")
+
+        assert await first.acquire(request)
+        await second.release(request)
+        assert not await second.acquire(request)
+        await first.release(request)
+
+        assert await second.acquire(request)
+        await first.close()
+        await second.close()
+
+    async def test_song_requested_again_right_after_release_is_answered(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a re-request of an answered song is processed by one replica."""
+        # Arrange
+        replicas = [make_lease("first"), make_lease("second")]
+        request = SearchRequest(title="Song", artist="Artist")
+        assert await replicas[0].acquire(request)
+        await replicas[0].release(request)
+
+        # Act
+        again = SearchRequest(title="Song", artist="Artist")
+        claimed = await asyncio.gather(*(lease.acquire(again) for lease in replicas))
+
+        # Assert
+        assert sorted(claimed) == [False, True]
+        for lease in replicas:
+            await lease.close()
+
+    async def test_renew_extends_the_lease(self, redis_client: redis.Redis) -> None:
+        """Test that picking a request up restarts the lease timeout."""
+        lease = make_lease("first", lease_ms=1000)
+        request = SearchRequest(title="Song", artist="Artist")
+        assert await lease.acquire(request)
+        await redis_client.pexpire(KEY, 100)
+
+        assert await lease.renew(request)
+
+        assert await redis_client.pttl(KEY) > 100
+        await lease.close()
+
+    async def test_renew_fails_once_another_replica_took_over(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a request whose lease expired in the queue is given up."""
+        waiting = make_lease("waiting", lease_ms=50)
+        other = make_lease("other")
+        request = SearchRequest(title="Song", artist="Artist")
+        assert await waiting.acquire(request)
+        await asyncio.sleep(0.1)
+        assert await other.acquire(request)
+
+        assert not await waiting.renew(request)
+
+        await waiting.release(request)
+        assert await redis_client.get(KEY) == "other"
+        await waiting.close()
+        await other.close()
+
+    async def test_renew_retakes_an_expired_unclaimed_lease(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a lease that expired without a new holder is taken again."""
+        lease = make_lease("first", lease_ms=50)
+        request = SearchRequest(title="Song", artist="Artist")
+        assert await lease.acquire(request)
+        await asyncio.sleep(0.1)
+
+        assert await lease.renew(request)
+
+        assert await redis_client.get(KEY) == "first"
+        await lease.close()
+
+    async def test_replicas_answer_each_request_for_a_song_once(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a song requested twice in a row gets two results."""
+        # Arrange
+        answered = asyncio.Event()
+
+        async def execute(request: SearchRequest) -> Song:
+            answered.set()
+            return Song(title="Song", artist="Artist", lyrics="Lyrics")
+
+        use_case = AsyncMock()
+        use_case.execute.side_effect = execute
+        repositories = [AsyncMock(), AsyncMock()]
+        services = [
+            LyricsFetcherService(
+                message_repository=repository,
+                search_lyrics_use_case=use_case,
+                request_lease=make_lease(f"replica {i}"),
+            )
+            for i, repository in enumerate(repositories)
+        ]
+        # Every replica receives both messages, the second one only after
+        # the first was answered
+
+        def make_subscription(service: LyricsFetcherService) -> Any:
+            async def subscribe() -> AsyncIterator[SearchRequest]:
+                yield SearchRequest(title="Song", artist="Artist")
+                await answered.wait()
+                await asyncio.sleep(0.05)
+                yield SearchRequest(title="Song", artist="Artist")
+                await asyncio.sleep(0.05)
+                service._running = False
+
+            return subscribe()
+
+        for service, repository in zip(services, repositories, strict=True):
+            repository.subscribe_requests = MagicMock(
+                return_value=make_subscription(service)
+            )
+
+        # Act
+        await asyncio.gather(*(service.start() for service in services))
+
+        # Assert
+        published = sum(r.publish_result.await_count for r in repositories)
+        assert published == 2
+        assert sum(service.stats.duplicates for service in services) == 2
+
+    async def test_lease_is_reentrant_within_a_replica(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that identical requests on one replica are all processed."""
+        lease = make_lease("first")
+        request = SearchRequest(title="Song", artist="Artist")
+
+        assert await lease.acquire(request)
+        assert await lease.acquire(request)
+        await lease.release(request)
+
+        assert await redis_client.get(KEY) == "first"
+        await lease.release(request)
+        assert await redis_client.get(KEY) is None
+        await lease.close()
+
+    async def test_lease_of_crashed_replica_expires(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a lease never released is taken over after it expires."""
+        crashed = make_lease("crashed", lease_ms=50)
+        survivor = make_lease("survivor")
+        request = SearchRequest(title="Song", artist="Artist")
+
+        assert await crashed.acquire(request)
+        await asyncio.sleep(0.1)
+
+        assert await survivor.acquire(request)
+        await crashed.close()
+        await survivor.close()
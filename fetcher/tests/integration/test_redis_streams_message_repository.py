@@ -0,0 +1,138 @@
+"""Integration tests for Redis Streams message repository."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+import redis.asyncio as redis
+
+from src.domain.entities.search_request import SearchRequest
+from src.infrastructure.messaging.redis_streams_message_repository import (
+    RedisStreamsMessageRepository,
+)
+
+# Mark all tests in this module as integration tests
+pytestmark = pytest.mark.integration
+
+STREAM = "test:requests:stream"
+GROUP = "test-fetchers"
+
+
+@pytest.fixture
+async def redis_client() -> AsyncIterator[redis.Redis]:
+    """Create a Redis client for testing."""
+    client = redis.Redis(host="localhost", port=6379, db=15, decode_responses=True)
+    try:
+        await client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not available")
+
+    await client.delete(STREAM)
+    yield client
+
+    # Cleanup
+    await client.flushdb()
+    await client.close()
+
+
+def make_repository(consumer_name: str) -> RedisStreamsMessageRepository:
+    """Create a streams repository consuming the test stream."""
+    return RedisStreamsMessageRepository(
+        host="localhost",
+        port=6379,
+        db=15,
+        request_stream=STREAM,
+        result_channel="test:results",
+        consumer_group=GROUP,
+        consumer_name=consumer_name,
+        block_ms=100,
+        claim_min_idle_ms=0,
+        claim_interval_seconds=0,
+        max_len=100,
+    )
+
+
+async def next_request(repository: RedisStreamsMessageRepository) -> SearchRequest:
+    """Read the next request with a timeout."""
+    iterator = repository.subscribe_requests()
+    return await asyncio.wait_for(anext(iterator), timeout=2.0)
+
+
+class TestRedisStreamsMessageRepository:
+    """Integration tests for RedisStreamsMessageRepository."""
+
+    async def test_reads_and_acknowledges_request(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that a consumed request is removed from the pending list."""
+        repository = make_repository("consumer-a")
+        await repository.connect()
+        await redis_client.xadd(
+            STREAM, {"data": json.dumps({"title": "Test Song", "artist": "Artist"})}
+        )
+
+        request = await next_request(repository)
+        await repository.acknowledge(request)
+
+        assert request.title == "Test Song"
+        assert request.artist == "Artist"
+        assert request.message_id is not None
+        pending = await redis_client.xpending(STREAM, GROUP)
+        assert pending["pending"] == 0
+
+        await repository.disconnect()
+
+    async def test_accepts_plain_fields(self, redis_client: redis.Redis) -> None:
+        """Test entries with title/artist fields instead of a JSON payload."""
+        repository = make_repository("consumer-a")
+        await repository.connect()
+        await redis_client.xadd(STREAM, {"title": "Plain", "artist": "Fields"})
+
+        request = await next_request(repository)
+
+        assert request.title == "Plain"
+        assert request.artist == "Fields"
+
+        await repository.disconnect()
+
+    async def test_reclaims_entries_from_crashed_consumer(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that unacknowledged entries are taken over by another consumer."""
+        crashed = make_repository("consumer-crashed")
+        survivor = make_repository("consumer-survivor")
+        await crashed.connect()
+        await survivor.connect()
+        await redis_client.xadd(STREAM, {"title": "Lost", "artist": "Artist"})
+
+        lost = await next_request(crashed)
+        await crashed.disconnect()
+
+        reclaimed = await next_request(survivor)
+        await survivor.acknowledge(reclaimed)
+
+        assert reclaimed.message_id == lost.message_id
+        pending = await redis_client.xpending(STREAM, GROUP)
+        assert pending["pending"] == 0
+
+        await survivor.disconnect()
+
+    async def test_invalid_entries_are_acknowledged_and_skipped(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Test that malformed entries do not block the stream."""
+        repository = make_repository("consumer-a")
+        await repository.connect()
+        await redis_client.xadd(STREAM, {"data": "invalid json"})
+        await redis_client.xadd(STREAM, {"title": "Valid", "artist": "Artist"})
+
+        request = await next_request(repository)
+
+        assert request.title == "Valid"
+        pending = await redis_client.xpending(STREAM, GROUP)
+        assert pending["pending"] == 1
+
+        await repository.disconnect()
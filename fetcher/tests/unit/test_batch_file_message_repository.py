@@ -0,0 +1,151 @@
+"""Unit tests for batch backfills."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.batch_search_request import BatchSearchRequest
+from src.domain.entities.search_request import SearchRequest
+from src.domain.entities.song import Song
+from src.infrastructure.messaging.batch_file_message_repository import (
+    BatchFileMessageRepository,
+    read_batch_file,
+)
+from src.presentation.lyrics_fetcher_service import LyricsFetcherService
+
+
+def make_batch(size: int) -> BatchSearchRequest:
+    """Build a batch of numbered songs."""
+    return BatchSearchRequest(
+        batch_id="chart",
+        items=[SearchRequest(title=f"Song {i}", artist="Artist") for i in range(size)],
+    )
+
+
+async def run(
+    batch: BatchSearchRequest, tmp_path: Path, use_case: AsyncMock
+) -> BatchFileMessageRepository:
+    """Process a batch through the fetcher service."""
+    repository = BatchFileMessageRepository(
+        batch, tmp_path / "out.jsonl", tmp_path / "out.checkpoint"
+    )
+    service = LyricsFetcherService(
+        message_repository=repository,
+        search_lyrics_use_case=use_case,
+        max_concurrent_tasks=3,
+        queue_size=2,
+    )
+    await service.start()
+    return repository
+
+
+def read_results(tmp_path: Path) -> list[dict[str, object]]:
+    """Read the result lines written so far."""
+    lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class TestReadBatchFile:
+    """Tests for loading batch files."""
+
+    def test_jsonl_skips_invalid_lines(self, tmp_path: Path) -> None:
+        """Test that malformed and incomplete lines are skipped."""
+        # Arrange
+        path = tmp_path / "albums.jsonl"
+        path.write_text(
+            '{"title": "맨발", "artist": "블랙넛"}\n'
+            "not json\n"
+            "\n"
+            '{"title": "only title"}\n'
+            '{"title": "Song", "artist": "Artist"}\n',
+            encoding="utf-8",
+        )
+
+        # Act
+        batch = read_batch_file(path)
+
+        # Assert
+        assert batch.batch_id == "albums"
+        assert [item.title for item in batch.items] == ["맨발", "Song"]
+
+    def test_csv_uses_header_columns(self, tmp_path: Path) -> None:
+        """Test that CSV rows are read by column name."""
+        # Arrange
+        path = tmp_path / "chart.csv"
+        path.write_text('rank,artist,title\n1,Artist,"Song, Part 1"\n')
+
+        # Act
+        batch = read_batch_file(path, batch_id="weekly")
+
+        # Assert
+        assert batch.batch_id == "weekly"
+        assert batch.items == [SearchRequest(title="Song, Part 1", artist="Artist")]
+
+    def test_empty_batch_is_rejected(self, tmp_path: Path) -> None:
+        """Test that a file without valid rows is an error."""
+        path = tmp_path / "empty.jsonl"
+        path.write_text("\n")
+
+        with pytest.raises(ValueError):
+            read_batch_file(path)
+
+
+class TestBatchFileMessageRepository:
+    """Tests for BatchFileMessageRepository."""
+
+    async def test_every_item_gets_one_result(self, tmp_path: Path) -> None:
+        """Test that results are streamed per item with their outcome."""
+        # Arrange
+        use_case = AsyncMock()
+        use_case.execute.side_effect = lambda request: (
+            Song(title=request.title, artist="Artist", lyrics="Lyrics")
+            if request.title != "Song 2"
+            else None
+        )
+
+        # Act
+        repository = await run(make_batch(5), tmp_path, use_case)
+
+        # Assert
+        results = sorted(read_results(tmp_path), key=lambda r: str(r["index"]))
+        assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+        assert results[2]["status"] == "not_found"
+        assert results[0]["lyrics"] == "Lyrics"
+        assert results[0]["batch_id"] == "chart"
+        assert repository.progress.outcomes == {"ok": 4, "not_found": 1}
+        assert repository.progress.remaining == 0
+
+    async def test_resumes_after_checkpointed_items(self, tmp_path: Path) -> None:
+        """Test that a second run only processes unfinished items."""
+        # Arrange
+        batch = make_batch(4)
+        (tmp_path / "out.checkpoint").write_text("# batch chart\n0\n2\n")
+        use_case = AsyncMock()
+        use_case.execute.return_value = None
+
+        # Act
+        repository = await run(batch, tmp_path, use_case)
+
+        # Assert
+        titles = {call.args[0].title for call in use_case.execute.await_args_list}
+        assert titles == {"Song 1", "Song 3"}
+        assert repository.progress.resumed == 2
+        assert repository.progress.completed == 2
+        checkpoint = (tmp_path / "out.checkpoint").read_text().splitlines()
+        assert sorted(checkpoint[1:]) == ["0", "1", "2", "3"]
+
+    async def test_checkpoint_of_other_batch_is_rejected(self, tmp_path: Path) -> None:
+        """Test that a checkpoint is not applied to a different batch."""
+        # Arrange
+        (tmp_path / "out.checkpoint").write_text("# batch other\n0\n")
+        repository = BatchFileMessageRepository(
+            make_batch(1), tmp_path / "out.jsonl", tmp_path / "out.checkpoint"
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="another batch"):
+            await repository.connect()
@@ -0,0 +1,79 @@
+"""Smoke tests for the benchmark harness."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from benchmarks.fake_genius_server import (
+    FakeGeniusOptions,
+    FakeGeniusServer,
+    build_page,
+)
+from benchmarks.run_benchmark import BenchmarkConfig, percentile, run_benchmark
+from src.infrastructure.external.genius_lyrics_parser import parse_lyrics
+
+
+@pytest.fixture
+async def fake_genius() -> AsyncIterator[FakeGeniusServer]:
+    """Start a fast fake Genius server in this process."""
+    server = FakeGeniusServer(FakeGeniusOptions(latency_ms=1, jitter_ms=0, page_kb=20))
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestBenchmark:
+    """Tests for the benchmark harness."""
+
+    async def test_in_memory_run_completes_every_request(
+        self, fake_genius: FakeGeniusServer
+    ) -> None:
+        """Test that every sent request is matched to its result."""
+        # Arrange
+        config = BenchmarkConfig(rate=500, requests=20, result_timeout_seconds=10)
+
+        # Act
+        result = await run_benchmark(config, fake_genius.base_url)
+
+        # Assert
+        assert result.completed == 20
+        assert result.outcomes == {"ok": 20}
+        assert result.throughput_rps > 0
+        assert result.latency_ms["p50"] <= result.latency_ms["p99"]
+
+    async def test_injected_errors_are_reported(
+        self, fake_genius: FakeGeniusServer
+    ) -> None:
+        """Test that failing Genius calls show up as error results."""
+        # Arrange
+        fake_genius.options.error_rate = 1.0
+        config = BenchmarkConfig(
+            rate=500, requests=5, max_retries=0, result_timeout_seconds=10
+        )
+
+        # Act
+        result = await run_benchmark(config, fake_genius.base_url)
+
+        # Assert
+        assert result.outcomes == {"error": 5}
+
+    def test_fake_page_contains_lyrics(self) -> None:
+        """Test that generated pages parse like real ones."""
+        # Act
+        page = build_page(page_kb=50, lyrics_lines=10)
+
+        # Assert
+        assert len(page) >= 50 * 1024 * 0.9
+        assert parse_lyrics(page) == "\n".join(
+            f"Line {i} of the fake lyrics" for i in range(1, 10) if i % 8
+        )
+
+    def test_percentile_uses_nearest_rank(self) -> None:
+        """Test percentiles over a small sample."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([3.0], 0.95) == 3
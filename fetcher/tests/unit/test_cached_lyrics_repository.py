@@ -0,0 +1,412 @@
+"""Unit tests for the tiered lyrics cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import asdict
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.song import Song
+from src.infrastructure.cache.background_refresher import BackgroundRefresher
+from src.infrastructure.cache.cached_lyrics_repository import (
+    CachedLyricsRepository,
+)
+from src.infrastructure.cache.lru_cache import TTLLRUCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def song() -> Song:
+    """Create a song with lyrics."""
+    return Song(title="Test Song", artist="Test Artist", lyrics="Test lyrics")
+
+
+@pytest.fixture
+def mock_inner() -> AsyncMock:
+    """Create a mock upstream repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    """Create a mock Redis client with an empty cache."""
+    client = AsyncMock()
+    client.get.return_value = None
+    return client
+
+
+@pytest.fixture
+def repository(
+    mock_inner: AsyncMock, mock_redis: AsyncMock, clock: FakeClock
+) -> CachedLyricsRepository:
+    """Create a cached repository with both tiers."""
+    return CachedLyricsRepository(
+        inner=mock_inner,
+        local_cache=TTLLRUCache[str, Song](max_entries=2, ttl_seconds=60, clock=clock),
+        redis_client=mock_redis,
+        redis_ttl_seconds=600,
+    )
+
+
+class TestTTLLRUCache:
+    """Tests for TTLLRUCache."""
+
+    def test_evicts_least_recently_used(self, clock: FakeClock) -> None:
+        """Test that the oldest untouched entry is evicted first."""
+        cache = TTLLRUCache[str, int](max_entries=2, ttl_seconds=60, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_expires_entries_after_ttl(self, clock: FakeClock) -> None:
+        """Test that entries are not served past their TTL."""
+        cache = TTLLRUCache[str, int](max_entries=2, ttl_seconds=60, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 61
+
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_rejects_non_positive_size(self) -> None:
+        """Test that a cache needs room for at least one entry."""
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            TTLLRUCache[str, int](max_entries=0, ttl_seconds=60)
+
+
+class TestCachedLyricsRepository:
+    """Tests for CachedLyricsRepository."""
+
+    async def test_miss_fetches_upstream_and_fills_both_tiers(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+        song: Song,
+    ) -> None:
+        """Test that a miss goes upstream and caches the result."""
+        mock_inner.search_song.return_value = song
+
+        result = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        assert result == song
+        mock_inner.search_song.assert_awaited_once_with(
+            title="Test Song", artist="Test Artist"
+        )
+        mock_redis.set.assert_awaited_once()
+        assert mock_redis.set.call_args.kwargs["ex"] == 600
+        assert repository.stats.misses == 1
+
+    async def test_repeat_lookup_is_served_from_memory(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+        song: Song,
+    ) -> None:
+        """Test that normalized repeat lookups skip all outbound I/O."""
+        mock_inner.search_song.return_value = song
+        await repository.search_song(title="Test Song", artist="Test Artist")
+        mock_redis.get.reset_mock()
+
+        result = await repository.search_song(
+            title="  test   SONG ", artist="TEST ARTIST"
+        )
+
+        assert result == song
+        assert mock_inner.search_song.await_count == 1
+        mock_redis.get.assert_not_called()
+        assert repository.stats.local_hits == 1
+
+    async def test_redis_hit_populates_memory(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+        song: Song,
+    ) -> None:
+        """Test that a Redis hit skips upstream and warms the local tier."""
+        mock_redis.get.return_value = json.dumps(
+            {"title": song.title, "artist": song.artist, "lyrics": song.lyrics}
+        )
+
+        first = await repository.search_song(title="Test Song", artist="Test Artist")
+        second = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        assert first == song
+        assert second == song
+        mock_inner.search_song.assert_not_called()
+        assert mock_redis.get.await_count == 1
+        assert repository.stats.redis_hits == 1
+        assert repository.stats.local_hits == 1
+
+    async def test_songs_without_lyrics_are_not_cached(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+    ) -> None:
+        """Test that incomplete results are fetched again next time."""
+        mock_inner.search_song.return_value = Song(title="T", artist="A")
+
+        await repository.search_song(title="T", artist="A")
+        await repository.search_song(title="T", artist="A")
+
+        assert mock_inner.search_song.await_count == 2
+        mock_redis.set.assert_not_called()
+
+    async def test_not_found_is_cached_until_negative_ttl(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+        clock: FakeClock,
+    ) -> None:
+        """Test that repeated misses are answered without calling upstream."""
+        mock_inner.search_song.return_value = None
+
+        first = await repository.search_song(title="Missing", artist="Artist")
+        second = await repository.search_song(title="Missing", artist="Artist")
+        clock.now += 61
+        await repository.search_song(title="Missing", artist="Artist")
+
+        assert first is None
+        assert second is None
+        assert mock_inner.search_song.await_count == 2
+        assert repository.stats.negative_hits == 1
+        key, value = mock_redis.set.call_args.args
+        assert value == "null"
+        assert mock_redis.set.call_args.kwargs == {"px": 60000}
+
+    async def test_redis_not_found_marker_is_a_miss(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+    ) -> None:
+        """Test that a not-found marker in Redis short-circuits the lookup."""
+        mock_redis.get.return_value = "null"
+
+        result = await repository.search_song(title="Missing", artist="Artist")
+        await repository.search_song(title="Missing", artist="Artist")
+
+        assert result is None
+        mock_inner.search_song.assert_not_called()
+        assert mock_redis.get.await_count == 1
+        assert repository.stats.negative_hits == 2
+
+    async def test_upstream_errors_are_not_cached(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+    ) -> None:
+        """Test that failures are retried instead of remembered as misses."""
+        mock_inner.search_song.side_effect = RuntimeError("API down")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await repository.search_song(title="T", artist="A")
+
+        assert mock_inner.search_song.await_count == 2
+        mock_redis.set.assert_not_called()
+
+    async def test_negative_caching_can_be_disabled(
+        self, mock_inner: AsyncMock, clock: FakeClock
+    ) -> None:
+        """Test that a zero negative TTL always asks upstream."""
+        repository = CachedLyricsRepository(
+            inner=mock_inner,
+            local_cache=TTLLRUCache[str, Song](
+                max_entries=2, ttl_seconds=60, clock=clock
+            ),
+            negative_ttl_seconds=0,
+        )
+        mock_inner.search_song.return_value = None
+
+        await repository.search_song(title="T", artist="A")
+        await repository.search_song(title="T", artist="A")
+
+        assert mock_inner.search_song.await_count == 2
+
+    async def test_redis_errors_fall_back_to_upstream(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+        song: Song,
+    ) -> None:
+        """Test that an unavailable Redis tier does not fail lookups."""
+        mock_redis.get.side_effect = ConnectionError("down")
+        mock_redis.set.side_effect = ConnectionError("down")
+        mock_inner.search_song.return_value = song
+
+        result = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        assert result == song
+
+    async def test_stats_report_evictions(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+    ) -> None:
+        """Test that local evictions are reflected in the stats."""
+        mock_inner.search_song.side_effect = lambda title, artist: Song(
+            title=title, artist=artist, lyrics="la"
+        )
+
+        for i in range(3):
+            await repository.search_song(title=f"Song {i}", artist="Artist")
+
+        assert repository.stats.evictions == 1
+        assert repository.stats.hit_ratio == 0.0
+
+    async def test_close_closes_inner_and_redis(
+        self,
+        repository: CachedLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_redis: AsyncMock,
+    ) -> None:
+        """Test that close releases both the upstream and Redis."""
+        await repository.close()
+
+        mock_inner.close.assert_awaited_once()
+        mock_redis.close.assert_awaited_once()
+
+
+class TestStaleWhileRevalidate:
+    """Tests for background refreshes of old cache entries."""
+
+    @staticmethod
+    def make_repository(
+        inner: AsyncMock, redis_client: AsyncMock, refresher: BackgroundRefresher
+    ) -> CachedLyricsRepository:
+        """Create a cached repository refreshing entries older than an hour."""
+        return CachedLyricsRepository(
+            inner=inner,
+            local_cache=TTLLRUCache[str, Song](max_entries=10, ttl_seconds=60),
+            redis_client=redis_client,
+            refresher=refresher,
+            refresh_after_seconds=3600,
+        )
+
+    async def test_stale_hit_is_served_and_refreshed(
+        self, mock_inner: AsyncMock, mock_redis: AsyncMock
+    ) -> None:
+        """Test that an old entry answers at once and is replaced later."""
+        # Arrange
+        stale = Song(title="Song", artist="Artist", lyrics="Old", fetched_at=0.0)
+        mock_redis.get.return_value = json.dumps(asdict(stale))
+        fresh = Song(title="Song", artist="Artist", lyrics="Corrected")
+        mock_inner.refresh_song.return_value = fresh
+        refresher = BackgroundRefresher(workers=1)
+        repository = self.make_repository(mock_inner, mock_redis, refresher)
+
+        # Act
+        served = await repository.search_song(title="Song", artist="Artist")
+        await refresher.join()
+        after_refresh = await repository.search_song(title="Song", artist="Artist")
+
+        # Assert
+        assert served is not None and served.lyrics == "Old"
+        assert after_refresh is not None and after_refresh.lyrics == "Corrected"
+        mock_inner.search_song.assert_not_called()
+        mock_inner.refresh_song.assert_awaited_once_with(title="Song", artist="Artist")
+        assert json.loads(mock_redis.set.call_args.args[1])["lyrics"] == "Corrected"
+        assert repository.stats.stale_hits == 1
+        await repository.close()
+
+    async def test_fresh_hit_is_not_refreshed(
+        self, mock_inner: AsyncMock, mock_redis: AsyncMock
+    ) -> None:
+        """Test that recently fetched entries are left alone."""
+        mock_inner.search_song.return_value = Song(
+            title="Song", artist="Artist", lyrics="Lyrics"
+        )
+        refresher = BackgroundRefresher(workers=1)
+        repository = self.make_repository(mock_inner, mock_redis, refresher)
+
+        await repository.search_song(title="Song", artist="Artist")
+        await repository.search_song(title="Song", artist="Artist")
+        await refresher.join()
+
+        mock_inner.refresh_song.assert_not_called()
+        await repository.close()
+
+    async def test_failed_refresh_keeps_stale_entry(
+        self, mock_inner: AsyncMock, mock_redis: AsyncMock
+    ) -> None:
+        """Test that an upstream failure leaves the cached song servable."""
+        stale = Song(title="Song", artist="Artist", lyrics="Old", fetched_at=0.0)
+        mock_redis.get.return_value = json.dumps(asdict(stale))
+        mock_inner.refresh_song.side_effect = RuntimeError("Genius is down")
+        refresher = BackgroundRefresher(workers=1)
+        repository = self.make_repository(mock_inner, mock_redis, refresher)
+
+        await repository.search_song(title="Song", artist="Artist")
+        await refresher.join()
+        result = await repository.search_song(title="Song", artist="Artist")
+
+        assert result == stale
+        mock_redis.set.assert_not_called()
+        await repository.close()
+
+
+class TestBackgroundRefresher:
+    """Tests for BackgroundRefresher."""
+
+    async def test_pending_keys_are_deduplicated_and_overflow_dropped(self) -> None:
+        """Test that a key is refreshed once and a full queue drops work."""
+        # Arrange
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        def refresh(key: str):
+            async def run() -> None:
+                calls.append(key)
+                started.set()
+                await release.wait()
+
+            return run
+
+        refresher = BackgroundRefresher(workers=1, queue_size=1)
+        assert refresher.schedule("a", refresh("a"))
+        await started.wait()
+
+        # Act
+        duplicate = refresher.schedule("a", refresh("a"))
+        queued = refresher.schedule("b", refresh("b"))
+        overflow = refresher.schedule("c", refresh("c"))
+        release.set()
+        await refresher.join()
+
+        # Assert
+        assert (duplicate, queued, overflow) == (False, True, False)
+        assert calls == ["a", "b"]
+        await refresher.close()
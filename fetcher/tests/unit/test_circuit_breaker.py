@@ -0,0 +1,237 @@
+"""Unit tests for the circuit breaker and its repository decorator."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.song import Song
+from src.domain.repositories.lyrics_repository import UpstreamUnavailableError
+from src.infrastructure.external.circuit_breaker_lyrics_repository import (
+    CircuitBreakerLyricsRepository,
+)
+from src.infrastructure.resilience.circuit_breaker import (
+    STATE,
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """Create a breaker that opens after two failures out of four calls."""
+    return CircuitBreaker(
+        name="test",
+        window_seconds=10,
+        min_calls=4,
+        failure_rate=0.5,
+        slow_call_seconds=1,
+        open_seconds=5,
+        clock=clock,
+    )
+
+
+def run_calls(breaker: CircuitBreaker, outcomes: list[bool]) -> None:
+    """Record a sequence of fast calls, True meaning failed."""
+    for failed in outcomes:
+        permit = breaker.acquire()
+        breaker.record(permit, 0.1, failed=failed)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_at_failure_rate(self, breaker: CircuitBreaker) -> None:
+        """Test that the breaker opens once enough recent calls failed."""
+        # Act
+        run_calls(breaker, [False, True, False])
+        state_before = breaker.state
+        run_calls(breaker, [True])
+
+        # Assert
+        assert state_before is CircuitState.CLOSED
+        assert breaker.state is CircuitState.OPEN
+        assert STATE.value(name="test") == 2
+        with pytest.raises(UpstreamUnavailableError, match="test is unavailable"):
+            breaker.acquire()
+
+    def test_slow_calls_count_as_failures(self, breaker: CircuitBreaker) -> None:
+        """Test that latency alone can open the breaker."""
+        for _ in range(4):
+            permit = breaker.acquire()
+            breaker.record(permit, 2.0)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_old_failures_leave_the_window(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that only calls within the window are counted."""
+        # Arrange
+        run_calls(breaker, [True, True])
+        clock.now = 20
+
+        # Act
+        run_calls(breaker, [False, False, False, True])
+
+        # Assert
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_one_trial(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that only a single call probes the upstream after the wait."""
+        # Arrange
+        run_calls(breaker, [True] * 4)
+        clock.now = 5
+
+        # Act
+        breaker.acquire()
+
+        # Assert
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(UpstreamUnavailableError):
+            breaker.acquire()
+
+    def test_successful_trial_closes(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that the breaker closes when the trial call succeeds."""
+        run_calls(breaker, [True] * 4)
+        clock.now = 5
+
+        run_calls(breaker, [False])
+
+        assert breaker.state is CircuitState.CLOSED
+        assert STATE.value(name="test") == 0
+
+    def test_failed_trial_reopens(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that a failed trial call restarts the open period."""
+        run_calls(breaker, [True] * 4)
+        clock.now = 5
+
+        run_calls(breaker, [True])
+        clock.now = 9
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_released_trial_slot_is_reused(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that a cancelled trial call lets another one through."""
+        run_calls(breaker, [True] * 4)
+        clock.now = 5
+        permit = breaker.acquire()
+
+        breaker.release(permit)
+
+        breaker.acquire()
+
+    def test_call_admitted_before_opening_is_not_a_trial(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that a slow call from the closed state cannot close the breaker."""
+        # Arrange
+        stale = breaker.acquire()
+        run_calls(breaker, [True] * 4)
+        clock.now = 5
+        trial = breaker.acquire()
+
+        # Act
+        breaker.record(stale, 0.1)
+
+        # Assert
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(UpstreamUnavailableError):
+            breaker.acquire()
+        breaker.record(trial, 0.1)
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestCircuitBreakerLyricsRepository:
+    """Tests for CircuitBreakerLyricsRepository."""
+
+    async def test_fails_fast_while_open(self, breaker: CircuitBreaker) -> None:
+        """Test that the upstream is not called once the breaker opened."""
+        # Arrange
+        inner = AsyncMock()
+        inner.search_song.side_effect = RuntimeError("Genius is down")
+        repository = CircuitBreakerLyricsRepository(inner, breaker)
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                await repository.search_song("Song", "Artist")
+
+        # Act & Assert
+        with pytest.raises(UpstreamUnavailableError):
+            await repository.search_song("Song", "Artist")
+        assert inner.search_song.await_count == 4
+
+    async def test_misses_count_as_success(self, breaker: CircuitBreaker) -> None:
+        """Test that a song not found is a healthy answer."""
+        inner = AsyncMock()
+        inner.search_song.return_value = None
+        repository = CircuitBreakerLyricsRepository(inner, breaker)
+
+        for _ in range(10):
+            assert await repository.search_song("Song", "Artist") is None
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_hits_without_lyrics_count_as_failures(
+        self, breaker: CircuitBreaker
+    ) -> None:
+        """Test that failing lyrics pages open the breaker."""
+        # Arrange
+        inner = AsyncMock()
+        inner.search_song.return_value = Song(title="Song", artist="Artist")
+        repository = CircuitBreakerLyricsRepository(inner, breaker)
+
+        # Act
+        for _ in range(4):
+            await repository.search_song("Song", "Artist")
+
+        # Assert
+        assert breaker.state is CircuitState.OPEN
+
+    async def test_cancelled_trial_is_released(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test that cancelling the trial call frees its slot."""
+        # Arrange
+        run_calls(breaker, [True] * 4)
+        clock.now = 5
+        inner = AsyncMock()
+        inner.search_song.side_effect = [
+            asyncio.CancelledError(),
+            Song(title="Song", artist="Artist", lyrics="Lyrics"),
+        ]
+        repository = CircuitBreakerLyricsRepository(inner, breaker)
+
+        # Act
+        with pytest.raises(asyncio.CancelledError):
+            await repository.search_song("Song", "Artist")
+        song = await repository.search_song("Song", "Artist")
+
+        # Assert
+        assert song is not None
+        assert breaker.state is CircuitState.CLOSED
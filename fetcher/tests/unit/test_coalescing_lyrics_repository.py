@@ -0,0 +1,202 @@
+"""Unit tests for request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.entities.search_request import SearchRequest
+from src.domain.entities.song import Song
+from src.infrastructure.cache.coalescing_lyrics_repository import (
+    CoalescingLyricsRepository,
+)
+from src.infrastructure.concurrency.single_flight import SingleFlight
+from src.presentation.lyrics_fetcher_service import LyricsFetcherService
+from src.use_cases.search_lyrics import SearchLyricsUseCase
+
+
+@pytest.fixture
+def mock_inner() -> AsyncMock:
+    """Create a slow mock upstream repository."""
+    inner = AsyncMock()
+
+    async def slow_search(title: str, artist: str) -> Song:
+        await asyncio.sleep(0.05)
+        return Song(title=title.title(), artist=artist.title(), lyrics="Lyrics")
+
+    inner.search_song.side_effect = slow_search
+    return inner
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_exception_is_shared_and_flight_is_cleared(self) -> None:
+        """Test that all waiters see the error and the key can be retried."""
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def failing() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        results = await asyncio.gather(
+            flights.do("key", failing),
+            flights.do("key", failing),
+            return_exceptions=True,
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "key" not in flights
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self) -> None:
+        """Test that the call survives while someone is still waiting."""
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        async def work() -> int:
+            await asyncio.sleep(0.05)
+            return 42
+
+        first = asyncio.create_task(flights.do("key", work))
+        second = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_last_cancelled_waiter_cancels_call(self) -> None:
+        """Test that an abandoned call is cancelled."""
+        flights: SingleFlight[str, int] = SingleFlight()
+        finished = False
+
+        async def work() -> int:
+            nonlocal finished
+            await asyncio.sleep(0.05)
+            finished = True
+            return 42
+
+        task = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0.1)
+
+        assert finished is False
+        assert flights.in_flight() == 0
+
+    async def test_caller_joining_while_last_waiter_cancels_starts_new_call(
+        self,
+    ) -> None:
+        """Test that a call being cancelled is not handed to a new caller."""
+        # Arrange
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        async def work() -> int:
+            await asyncio.sleep(0.01)
+            return 42
+
+        abandoned = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        # Let the last waiter leave and cancel the call, but not the call
+        # finish cancelling
+        await asyncio.sleep(0)
+
+        # Act
+        result = await flights.do("key", work)
+
+        # Assert
+        assert result == 42
+        assert abandoned.cancelled()
+
+    async def test_cancelled_shared_call_is_an_error_for_waiters(self) -> None:
+        """Test that waiters that were not cancelled see an ordinary error."""
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        async def work() -> int:
+            await asyncio.sleep(1)
+            return 42
+
+        waiter = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        flights._flights["key"].task.cancel()
+
+        with pytest.raises(RuntimeError):
+            await waiter
+
+
+class TestCoalescingLyricsRepository:
+    """Tests for CoalescingLyricsRepository."""
+
+    async def test_identical_concurrent_searches_share_one_fetch(
+        self, mock_inner: AsyncMock
+    ) -> None:
+        """Test that normalized duplicates make a single upstream call."""
+        repository = CoalescingLyricsRepository(inner=mock_inner)
+
+        results = await asyncio.gather(
+            repository.search_song(title="Test Song", artist="Test Artist"),
+            repository.search_song(title="test song", artist="TEST ARTIST"),
+            repository.search_song(title="Test Song", artist="Test Artist"),
+        )
+
+        assert mock_inner.search_song.await_count == 1
+        assert results[0] is results[1] is results[2]
+        assert repository.coalesced_requests == 2
+
+    async def test_different_searches_are_not_coalesced(
+        self, mock_inner: AsyncMock
+    ) -> None:
+        """Test that distinct queries run independently."""
+        repository = CoalescingLyricsRepository(inner=mock_inner)
+
+        await asyncio.gather(
+            repository.search_song(title="Song A", artist="Artist"),
+            repository.search_song(title="Song B", artist="Artist"),
+        )
+
+        assert mock_inner.search_song.await_count == 2
+
+    async def test_sequential_searches_fetch_again(self, mock_inner: AsyncMock) -> None:
+        """Test that completed flights are not reused as a cache."""
+        repository = CoalescingLyricsRepository(inner=mock_inner)
+
+        await repository.search_song(title="Test Song", artist="Test Artist")
+        await repository.search_song(title="Test Song", artist="Test Artist")
+
+        assert mock_inner.search_song.await_count == 2
+
+    async def test_service_publishes_once_per_original_request(
+        self, mock_inner: AsyncMock
+    ) -> None:
+        """Test that every coalesced request still gets its own result."""
+        repository = CoalescingLyricsRepository(inner=mock_inner)
+        message_repository = AsyncMock()
+        service = LyricsFetcherService(
+            message_repository=message_repository,
+            search_lyrics_use_case=SearchLyricsUseCase(lyrics_repository=repository),
+        )
+        requests = [
+            SearchRequest(title="Test Song", artist="Test Artist"),
+            SearchRequest(title="test song", artist="test artist"),
+        ]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+            service._running = False
+
+        message_repository.subscribe_requests = MagicMock(return_value=mock_subscribe())
+
+        await service.start()
+
+        assert mock_inner.search_song.await_count == 1
+        published = [c.args for c in message_repository.publish_result.call_args_list]
+        assert [request for _, request in published] == requests
+        assert published[0][0] is published[1][0]
@@ -0,0 +1,196 @@
+"""Unit tests for the multi-provider lyrics repository."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.song import Song
+from src.infrastructure.external.composite_lyrics_repository import (
+    CompositeLyricsRepository,
+    ProviderMode,
+    ProviderStats,
+)
+
+
+def make_provider(result: Song | Exception | None, delay: float = 0.0) -> AsyncMock:
+    """Create a provider answering after ``delay`` seconds."""
+    provider = AsyncMock()
+
+    async def search_song(title: str, artist: str) -> Song | None:
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    provider.search_song.side_effect = search_song
+    return provider
+
+
+def make_song(source: str, lyrics: str | None = "Lyrics") -> Song:
+    """Create a song tagged with the provider it came from."""
+    return Song(title="Test Song", artist="Test Artist", lyrics=lyrics, url=source)
+
+
+class TestFallbackMode:
+    """Tests for the fallback chain."""
+
+    async def test_first_hit_skips_later_providers(self) -> None:
+        """Test that later providers are not asked after a hit."""
+        # Arrange
+        genius = make_provider(make_song("genius"))
+        musixmatch = make_provider(make_song("musixmatch"))
+        repository = CompositeLyricsRepository(
+            {"genius": genius, "musixmatch": musixmatch}
+        )
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.url == "genius"
+        musixmatch.search_song.assert_not_called()
+
+    async def test_miss_falls_back_to_next_provider(self) -> None:
+        """Test that a miss is retried with the next provider."""
+        # Arrange
+        repository = CompositeLyricsRepository(
+            {
+                "genius": make_provider(None),
+                "musixmatch": make_provider(make_song("musixmatch")),
+            }
+        )
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.url == "musixmatch"
+        assert repository.stats["genius"].misses == 1
+        assert repository.stats["musixmatch"].hits == 1
+
+    async def test_song_without_lyrics_is_last_resort(self) -> None:
+        """Test that metadata-only results lose to a later result with lyrics."""
+        # Arrange
+        repository = CompositeLyricsRepository(
+            {
+                "genius": make_provider(make_song("genius", lyrics=None)),
+                "musixmatch": make_provider(None),
+            }
+        )
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.url == "genius"
+
+    async def test_all_misses_return_none(self) -> None:
+        """Test that None is returned when no provider knows the song."""
+        # Arrange
+        repository = CompositeLyricsRepository(
+            {"genius": make_provider(None), "musixmatch": make_provider(None)}
+        )
+
+        # Act & Assert
+        assert await repository.search_song(title="T", artist="A") is None
+
+    async def test_error_without_match_is_raised(self) -> None:
+        """Test that a failed provider prevents a definitive miss."""
+        # Arrange
+        repository = CompositeLyricsRepository(
+            {
+                "genius": make_provider(RuntimeError("down")),
+                "musixmatch": make_provider(None),
+            }
+        )
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await repository.search_song(title="T", artist="A")
+        assert repository.stats["genius"].errors == 1
+
+
+class TestHedgedMode:
+    """Tests for hedged requests."""
+
+    async def test_slow_provider_is_hedged(self) -> None:
+        """Test that a faster second provider wins over a slow first one."""
+        # Arrange
+        repository = CompositeLyricsRepository(
+            {
+                "genius": make_provider(make_song("genius"), delay=1.0),
+                "musixmatch": make_provider(make_song("musixmatch"), delay=0.01),
+            },
+            mode=ProviderMode.HEDGED,
+            hedge_delay_seconds=0.02,
+        )
+
+        # Act
+        song = await asyncio.wait_for(
+            repository.search_song(title="Test Song", artist="Test Artist"),
+            timeout=0.5,
+        )
+
+        # Assert
+        assert song is not None
+        assert song.url == "musixmatch"
+        assert repository.stats["genius"].cancelled == 1
+
+    async def test_fast_provider_is_not_hedged(self) -> None:
+        """Test that no second request is sent within the hedge delay."""
+        # Arrange
+        musixmatch = make_provider(make_song("musixmatch"))
+        repository = CompositeLyricsRepository(
+            {"genius": make_provider(make_song("genius")), "musixmatch": musixmatch},
+            mode=ProviderMode.HEDGED,
+            hedge_delay_seconds=1.0,
+        )
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.url == "genius"
+        musixmatch.search_song.assert_not_called()
+
+    async def test_hedge_delay_follows_p95_latency(self) -> None:
+        """Test that the hedge delay switches to the observed p95."""
+        # Arrange
+        repository = CompositeLyricsRepository(
+            {"genius": make_provider(None), "musixmatch": make_provider(None)},
+            mode=ProviderMode.HEDGED,
+            hedge_delay_seconds=1.0,
+            hedge_min_samples=10,
+        )
+
+        # Act
+        repository.stats["genius"].latencies.extend(i / 100 for i in range(1, 21))
+
+        # Assert
+        assert repository.hedge_delay("genius") == pytest.approx(0.20)
+        assert repository.hedge_delay("musixmatch") == 1.0
+
+
+class TestProviderStats:
+    """Tests for ProviderStats."""
+
+    def test_hit_rate_and_quantile(self) -> None:
+        """Test hit rate over completed lookups and latency quantiles."""
+        stats = ProviderStats(hits=3, misses=1, cancelled=5)
+        stats.latencies.extend([0.3, 0.1, 0.2])
+
+        assert stats.hit_rate == 0.75
+        assert stats.latency_quantile(0.5) == 0.2
+        assert ProviderStats().latency_quantile(0.95) is None
+
+    def test_requires_a_provider(self) -> None:
+        """Test that an empty provider list is rejected."""
+        with pytest.raises(ValueError):
+            CompositeLyricsRepository({})
@@ -94,3 +94,14 @@ class TestSearchRequest:
         request = SearchRequest(title="Test Song", artist="Test Artist")
 
         assert request.to_search_query() == "Test Song - Test Artist"
+
+    def test_deadline(self) -> None:
+        """Test that a request expires once its deadline passes."""
+        request = SearchRequest(
+            title="Test Song", artist="Test Artist", expires_at=10.0
+        )
+
+        assert request.remaining_seconds(now=7.5) == 2.5
+        assert not request.expired(now=9.9)
+        assert request.expired(now=10.0)
+        assert not SearchRequest(title="Test Song", artist="Test Artist").expired()
@@ -0,0 +1,270 @@
+"""Unit tests for GeniusClient against a local HTTP server."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.infrastructure.external.genius_client import (
+    GeniusAPIError,
+    GeniusClient,
+    parse_retry_after,
+)
+from src.infrastructure.external.genius_lyrics_parser import (
+    LyricsStreamParser,
+    parse_lyrics,
+)
+from src.infrastructure.ratelimit.token_bucket import TokenBucket
+
+SONG_PAGE = """
+<html><body>
+<div class="LyricsHeader__Container">Test Song Lyrics</div>
+<div data-lyrics-container="true">[Verse 1]<br/>First line<br/><i>Second line</i></div>
+<div data-lyrics-container="true">[Chorus]<br/>Chorus line</div>
+</body></html>
+"""
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[TestServer]:
+    """Start a local server that mimics the Genius API and website."""
+
+    async def search(request: web.Request) -> web.Response:
+        assert request.headers["Authorization"] == "Bearer token"
+        return web.json_response(
+            {"meta": {"status": 200}, "response": {"hits": [{"q": request.query["q"]}]}}
+        )
+
+    async def song(request: web.Request) -> web.Response:
+        song_id = request.match_info["song_id"]
+        return web.json_response({"response": {"song": {"id": int(song_id)}}})
+
+    async def album_tracks(request: web.Request) -> web.Response:
+        return web.json_response(
+            {"response": {"tracks": [{"number": 1, "song": {"id": 7}}]}}
+        )
+
+    async def artist_songs(request: web.Request) -> web.Response:
+        return web.json_response({"response": {"songs": [dict(request.query)]}})
+
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(text=SONG_PAGE, content_type="text/html")
+
+    async def unauthorized(request: web.Request) -> web.Response:
+        return web.json_response({"error": "invalid_token"}, status=401)
+
+    busy_calls = 0
+
+    async def busy(request: web.Request) -> web.Response:
+        nonlocal busy_calls
+        busy_calls += 1
+        if busy_calls == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"response": {"hits": []}})
+
+    async def unavailable(request: web.Request) -> web.Response:
+        return web.Response(status=503, text="maintenance")
+
+    app = web.Application()
+    app.router.add_get("/search", search)
+    app.router.add_get("/songs/{song_id}", song)
+    app.router.add_get("/albums/{album_id}/tracks", album_tracks)
+    app.router.add_get("/artists/{artist_id}/songs", artist_songs)
+    app.router.add_get("/test-song-lyrics", page)
+    app.router.add_get("/private/search", unauthorized)
+    app.router.add_get("/busy/search", busy)
+    app.router.add_get("/down/search", unavailable)
+
+    test_server = TestServer(app)
+    await test_server.start_server()
+    yield test_server
+    await test_server.close()
+
+
+@pytest.fixture
+async def client(server: TestServer) -> AsyncIterator[GeniusClient]:
+    """Create a GeniusClient pointed at the local server."""
+    genius = GeniusClient(
+        api_token="token",
+        api_root=str(server.make_url("/")),
+        web_root=str(server.make_url("/")),
+    )
+    yield genius
+    await genius.close()
+
+
+class TestGeniusClient:
+    """Tests for GeniusClient."""
+
+    async def test_search_songs_returns_response_payload(
+        self, client: GeniusClient
+    ) -> None:
+        """Test that search unwraps the API response payload."""
+        result = await client.search_songs("Test Artist - Test Song")
+
+        assert result == {"hits": [{"q": "Test Artist - Test Song"}]}
+
+    async def test_get_song_returns_song_payload(self, client: GeniusClient) -> None:
+        """Test fetching song metadata by ID."""
+        result = await client.get_song(42)
+
+        assert result == {"id": 42}
+
+    async def test_get_album_tracks_returns_tracks(self, client: GeniusClient) -> None:
+        """Test fetching an album's tracklist."""
+        result = await client.get_album_tracks(3)
+
+        assert result == [{"number": 1, "song": {"id": 7}}]
+
+    async def test_get_artist_songs_sorts_by_popularity(
+        self, client: GeniusClient
+    ) -> None:
+        """Test that artist songs are requested by popularity, one page."""
+        result = await client.get_artist_songs(5, per_page=3)
+
+        assert result == [{"sort": "popularity", "per_page": "3"}]
+
+    async def test_fetch_lyrics_parses_page(
+        self, client: GeniusClient, server: TestServer
+    ) -> None:
+        """Test that lyrics are scraped from the song page."""
+        lyrics = await client.fetch_lyrics(str(server.make_url("/test-song-lyrics")))
+
+        assert lyrics == "First line\nSecond line\nChorus line"
+
+    async def test_fetch_lyrics_streams_large_page(
+        self, client: GeniusClient, server: TestServer
+    ) -> None:
+        """Test parsing a page that arrives in many chunks."""
+        client.CHUNK_SIZE = 8
+
+        lyrics = await client.fetch_lyrics(str(server.make_url("/test-song-lyrics")))
+
+        assert lyrics == "First line\nSecond line\nChorus line"
+
+    async def test_error_status_raises(
+        self, client: GeniusClient, server: TestServer
+    ) -> None:
+        """Test that non-200 responses raise GeniusAPIError."""
+        client.api_root = str(server.make_url("/private/"))
+
+        with pytest.raises(GeniusAPIError) as exc_info:
+            await client.search_songs("anything")
+
+        assert exc_info.value.status == 401
+
+    async def test_throttled_request_is_retried_and_slows_down(
+        self, client: GeniusClient, server: TestServer
+    ) -> None:
+        """Test that a 429 is retried after Retry-After and lowers the rate."""
+        limiter = TokenBucket(rate=100, burst=10)
+        client.api_root = str(server.make_url("/busy/"))
+        client.rate_limiter = limiter
+
+        result = await client.search_songs("anything")
+
+        assert result == {"hits": []}
+        assert limiter.effective_rate < limiter.rate
+
+    async def test_retries_are_bounded(
+        self, client: GeniusClient, server: TestServer
+    ) -> None:
+        """Test that a persistently failing endpoint eventually raises."""
+        client.api_root = str(server.make_url("/down/"))
+        client.max_retries = 2
+        client.retry_backoff = 0
+
+        with pytest.raises(GeniusAPIError) as exc_info:
+            await client.search_songs("anything")
+
+        assert exc_info.value.status == 503
+
+    async def test_session_is_reused_between_requests(
+        self, client: GeniusClient
+    ) -> None:
+        """Test that one pooled session serves every request."""
+        await client.search_songs("first")
+        session = client._session
+        await client.get_song(1)
+
+        assert session is not None
+        assert client._session is session
+
+    async def test_close_is_idempotent(self, client: GeniusClient) -> None:
+        """Test closing the client more than once."""
+        await client.search_songs("query")
+
+        await client.close()
+        await client.close()
+
+        assert client._session is None
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("5", 5.0), ("0.5", 0.5), ("-1", 0.0), (None, None), ("soon", None)],
+    )
+    def test_parses_seconds(self, value: str | None, expected: float | None) -> None:
+        """Test delay-seconds values and malformed headers."""
+        assert parse_retry_after(value) == expected
+
+    def test_parses_http_date(self) -> None:
+        """Test that a date in the past means retrying immediately."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestParseLyrics:
+    """Tests for Genius lyrics page parsing."""
+
+    def test_keeps_section_headers_when_requested(self) -> None:
+        """Test parsing without removing section headers."""
+        lyrics = parse_lyrics(SONG_PAGE, strip_headers=False)
+
+        assert lyrics == "[Verse 1]\nFirst line\nSecond line[Chorus]\nChorus line"
+
+    def test_returns_none_without_lyrics_containers(self) -> None:
+        """Test that pages without lyrics containers return None."""
+        assert parse_lyrics("<html><body><p>No lyrics</p></body></html>") is None
+
+    def test_skips_excluded_elements(self) -> None:
+        """Test that elements excluded from selection are ignored."""
+        html = (
+            '<div data-lyrics-container="true">Line'
+            '<span data-exclude-from-selection="true">Ad</span></div>'
+        )
+
+        assert parse_lyrics(html) == "Line"
+
+    def test_skips_headers_nested_in_containers(self) -> None:
+        """Test that LyricsHeader divs and their children are dropped."""
+        html = (
+            '<div data-lyrics-container="true">'
+            '<div class="LyricsHeader__Container"><b>Title</b></div>'
+            "A &amp; B<br>C<a><span>D</span></a></div>"
+        )
+
+        assert parse_lyrics(html) == "A & B\nCD"
+
+    def test_incremental_feed_matches_single_feed(self) -> None:
+        """Test that splitting the page across chunks gives the same lyrics."""
+        parser = LyricsStreamParser()
+        for start in range(0, len(SONG_PAGE), 5):
+            parser.feed(SONG_PAGE[start : start + 5])
+
+        assert parser.lyrics() == parse_lyrics(SONG_PAGE)
+
+    def test_empty_container_adds_line_break(self) -> None:
+        """Test that an empty container separates its neighbours."""
+        html = (
+            '<div data-lyrics-container="true">A</div>'
+            '<div data-lyrics-container="true"></div>'
+            '<div data-lyrics-container="true">B</div>'
+        )
+
+        assert parse_lyrics(html, strip_headers=False) == "A\nB"
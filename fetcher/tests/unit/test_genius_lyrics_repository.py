@@ -0,0 +1,233 @@
+"""Unit tests for GeniusLyricsRepository."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.song import Song
+from src.infrastructure.external.genius_lyrics_repository import (
+    GeniusLyricsRepository,
+)
+
+
+def make_hit(
+    song_id: int = 1,
+    title: str = "Test Song",
+    artist: str = "Test Artist",
+    url: str = "https://genius.com/test-artist-test-song-lyrics",
+) -> dict[str, Any]:
+    """Build a Genius search hit."""
+    return {
+        "result": {
+            "id": song_id,
+            "title": title,
+            "url": url,
+            "primary_artist": {"name": artist},
+            "release_date_for_display": "January 1, 2024",
+        }
+    }
+
+
+def make_song(song_id: int, title: str = "Test Song") -> Song:
+    """Build a song found on Genius by an earlier search."""
+    return Song(
+        title=title,
+        artist="Test Artist",
+        lyrics="Lyrics",
+        source="genius",
+        source_id=song_id,
+        source_artist_id=9,
+    )
+
+
+@pytest.fixture
+def mock_client() -> AsyncMock:
+    """Create a mock Genius client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repository(mock_client: AsyncMock) -> GeniusLyricsRepository:
+    """Create a GeniusLyricsRepository with a mock client."""
+    return GeniusLyricsRepository(api_token="token", client=mock_client)
+
+
+class TestGeniusLyricsRepository:
+    """Tests for GeniusLyricsRepository."""
+
+    async def test_search_song_returns_song_with_lyrics(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that a search hit is turned into a Song with lyrics."""
+        # Arrange
+        hit = make_hit()
+        mock_client.search_songs.return_value = {"hits": [hit]}
+        mock_client.fetch_lyrics.return_value = "Test lyrics"
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.title == "Test Song"
+        assert song.artist == "Test Artist"
+        assert song.lyrics == "Test lyrics"
+        assert song.url == hit["result"]["url"]
+        assert song.release_date == "January 1, 2024"
+        mock_client.search_songs.assert_awaited_once_with("Test Artist - Test Song")
+        mock_client.fetch_lyrics.assert_awaited_once_with(
+            hit["result"]["url"], remove_section_headers=True
+        )
+        mock_client.get_song.assert_not_called()
+
+    async def test_search_song_returns_none_without_hits(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that an empty search result returns None."""
+        # Arrange
+        mock_client.search_songs.return_value = {"hits": []}
+
+        # Act
+        song = await repository.search_song(title="Unknown", artist="Nobody")
+
+        # Assert
+        assert song is None
+        mock_client.fetch_lyrics.assert_not_called()
+
+    async def test_search_song_picks_best_matching_hit(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that a closer later hit is preferred over the first one."""
+        # Arrange
+        mock_client.search_songs.return_value = {
+            "hits": [
+                make_hit(1, title="Intro", artist="Black Nut (블랙넛)"),
+                make_hit(2, title="맨발 (Barefoot)", artist="Black Nut (블랙넛)"),
+            ]
+        }
+        mock_client.fetch_lyrics.return_value = "Lyrics"
+
+        # Act
+        song = await repository.search_song(title="맨발", artist="블랙넛")
+
+        # Assert
+        assert song is not None
+        assert song.title == "맨발 (Barefoot)"
+
+    async def test_search_song_keeps_song_when_lyrics_fetch_fails(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that a failed lyrics fetch still returns song metadata."""
+        # Arrange
+        mock_client.search_songs.return_value = {"hits": [make_hit()]}
+        mock_client.fetch_lyrics.side_effect = RuntimeError("boom")
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.lyrics is None
+
+    async def test_search_song_raises_on_search_error(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that a search error is raised rather than reported as no hits."""
+        # Arrange
+        mock_client.search_songs.side_effect = RuntimeError("API down")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await repository.search_song(title="Test Song", artist="Test Artist")
+
+    async def test_search_song_keeps_genius_ids(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that the found song carries the IDs of its hit."""
+        # Arrange
+        hit = make_hit(2)
+        hit["result"]["primary_artist"]["id"] = 9
+        mock_client.search_songs.return_value = {"hits": [hit]}
+        mock_client.fetch_lyrics.return_value = "Test lyrics"
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert (song.source, song.source_id, song.source_artist_id) == ("genius", 2, 9)
+
+    async def test_related_songs_lists_next_tracks_then_artist_hits(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that following album tracks come first, then popular songs."""
+        # Arrange
+        mock_client.get_song.return_value = {"id": 2, "album": {"id": 4}}
+        artist = {"name": "Test Artist"}
+        mock_client.get_album_tracks.return_value = [
+            {"number": n, "song": {"id": n, "title": t, "primary_artist": artist}}
+            for n, t in [(1, "First"), (2, "Second"), (3, "Third")]
+        ]
+        mock_client.get_artist_songs.return_value = [
+            {"id": 3, "title": "Third", "primary_artist": artist},
+            {"id": 8, "title": "Hit", "primary_artist": artist},
+            {"id": 9, "title": "Other Hit", "primary_artist": artist},
+        ]
+
+        # Act
+        related = await repository.related_songs(
+            song=make_song(2, title="Second"), limit=3
+        )
+
+        # Assert
+        assert related == [
+            ("Third", "Test Artist"),
+            ("First", "Test Artist"),
+            ("Hit", "Test Artist"),
+        ]
+        mock_client.search_songs.assert_not_called()
+        mock_client.get_song.assert_awaited_once_with(2)
+        mock_client.get_album_tracks.assert_awaited_once_with(4)
+        mock_client.get_artist_songs.assert_awaited_once_with(9, per_page=4)
+        mock_client.fetch_lyrics.assert_not_called()
+
+    async def test_related_songs_skips_artist_when_album_suffices(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that no artist lookup is spent once the limit is reached."""
+        mock_client.get_song.return_value = {"id": 1, "album": {"id": 4}}
+        mock_client.get_album_tracks.return_value = [
+            {"song": {"id": 1, "title": "First", "primary_artist": {"name": "A"}}},
+            {"song": {"id": 2, "title": "Second", "primary_artist": {"name": "A"}}},
+        ]
+
+        related = await repository.related_songs(
+            song=make_song(1, title="First"), limit=1
+        )
+
+        assert related == [("Second", "A")]
+        mock_client.get_artist_songs.assert_not_called()
+
+    async def test_related_songs_of_other_sources_is_empty(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that a song without Genius IDs costs no requests."""
+        song = Song(title="X", artist="Y", lyrics="Lyrics", source="musixmatch")
+
+        related = await repository.related_songs(song=song, limit=5)
+
+        assert related == []
+        mock_client.get_song.assert_not_called()
+
+    async def test_close_closes_client(
+        self, repository: GeniusLyricsRepository, mock_client: AsyncMock
+    ) -> None:
+        """Test that close releases the HTTP session."""
+        # Act
+        await repository.close()
+
+        # Assert
+        mock_client.close.assert_awaited_once()
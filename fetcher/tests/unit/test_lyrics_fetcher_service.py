@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.domain.entities.priority import Priority
+from src.domain.entities.result_status import ResultStatus
 from src.domain.entities.search_request import SearchRequest
 from src.domain.entities.song import Song
-from src.presentation.lyrics_fetcher_service import LyricsFetcherService
+from src.domain.repositories.lyrics_repository import UpstreamUnavailableError
+from src.presentation.lyrics_fetcher_service import (
+    LyricsFetcherService,
+    OverflowPolicy,
+)
 
 
 @pytest.fixture
@@ -99,8 +106,11 @@ class TestLyricsFetcherService:
 
         # Assert
         mock_search_lyrics_use_case.execute.assert_called_once_with(request)
-        # Should not publish when song is not found
+        # Should publish a not-found status instead of a song
         mock_message_repository.publish_result.assert_not_called()
+        mock_message_repository.publish_status.assert_called_once_with(
+            request, ResultStatus.NOT_FOUND
+        )
 
     async def test_start_maintains_original_request_info(
         self,
@@ -346,6 +356,44 @@ class TestLyricsFetcherService:
         assert len(completed_tasks) == 3
         assert mock_message_repository.publish_result.call_count == 3
 
+    async def test_concurrent_stops_share_one_shutdown(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that a signal-triggered stop does not repeat start()'s stop."""
+        # Arrange
+        service = LyricsFetcherService(
+            message_repository=mock_message_repository,
+            search_lyrics_use_case=mock_search_lyrics_use_case,
+        )
+        mock_search_lyrics_use_case.execute.return_value = None
+        admitted = asyncio.Event()
+        received: list[str] = []
+
+        async def mock_subscribe():
+            for i in range(100):
+                received.append(f"song {i}")
+                yield SearchRequest(title=f"song {i}", artist="artist")
+                admitted.set()
+                await asyncio.sleep(0.01)
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        # Act
+        running = asyncio.create_task(service.start())
+        await admitted.wait()
+        await asyncio.gather(service.stop(), service.stop())
+        await running
+
+        # Assert
+        assert len(received) < 100
+        assert service.stats.accepted == len(received)
+        mock_message_repository.disconnect.assert_awaited_once()
+        mock_search_lyrics_use_case.close.assert_awaited_once()
+
     async def test_error_in_task_does_not_stop_service(
         self,
         mock_message_repository: AsyncMock,
@@ -387,3 +435,452 @@ class TestLyricsFetcherService:
         # Assert
         # Only 2 successful publishes (song 1 and song 2)
         assert mock_message_repository.publish_result.call_count == 2
+        # The failed request is answered with an error status
+        mock_message_repository.publish_status.assert_called_once_with(
+            requests[0], ResultStatus.ERROR, "Lyrics lookup failed"
+        )
+
+
+class TestAdmissionControl:
+    """Tests for the bounded work queue and overflow policies."""
+
+    @staticmethod
+    def make_service(
+        message_repository: AsyncMock,
+        use_case: AsyncMock,
+        overflow_policy: OverflowPolicy,
+    ) -> LyricsFetcherService:
+        """Create a service with one worker and a queue of one request."""
+        return LyricsFetcherService(
+            message_repository=message_repository,
+            search_lyrics_use_case=use_case,
+            max_concurrent_tasks=1,
+            queue_size=1,
+            overflow_policy=overflow_policy,
+        )
+
+    @staticmethod
+    def slow_execute(delay: float = 0.1):
+        """Build an execute side effect that takes a while."""
+
+        async def execute(request: SearchRequest) -> Song:
+            await asyncio.sleep(delay)
+            return Song(title=request.title, artist=request.artist, lyrics="Lyrics")
+
+        return execute
+
+    async def test_block_policy_applies_backpressure(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that the subscription waits for capacity instead of buffering."""
+        service = self.make_service(
+            mock_message_repository, mock_search_lyrics_use_case, OverflowPolicy.BLOCK
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute()
+        max_depth = 0
+
+        async def mock_subscribe():
+            nonlocal max_depth
+            for i in range(4):
+                yield SearchRequest(title=f"song {i}", artist="artist")
+                max_depth = max(max_depth, service.stats.queue_depth)
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        assert max_depth <= 1
+        assert mock_message_repository.publish_result.call_count == 4
+        mock_message_repository.publish_status.assert_not_called()
+        assert service.stats.accepted == 4
+        assert service.stats.processed == 4
+
+    async def test_reject_policy_publishes_rejection(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that requests arriving at a full queue are answered with an error."""
+        service = self.make_service(
+            mock_message_repository, mock_search_lyrics_use_case, OverflowPolicy.REJECT
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute()
+        requests = [SearchRequest(title=f"song {i}", artist="artist") for i in range(3)]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+                await asyncio.sleep(0)
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        # One request is being processed, one waits in the queue, one is rejected
+        mock_message_repository.publish_status.assert_called_once_with(
+            requests[2], ResultStatus.REJECTED, "Work queue is full"
+        )
+        assert mock_message_repository.publish_result.call_count == 2
+        assert service.stats.rejected == 1
+        assert mock_message_repository.acknowledge.call_count == 3
+
+    async def test_drop_oldest_policy_replaces_queued_request(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that the oldest waiting request makes room for the newest."""
+        service = self.make_service(
+            mock_message_repository,
+            mock_search_lyrics_use_case,
+            OverflowPolicy.DROP_OLDEST,
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute()
+        requests = [SearchRequest(title=f"song {i}", artist="artist") for i in range(3)]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+                await asyncio.sleep(0)
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        mock_message_repository.publish_status.assert_called_once_with(
+            requests[1], ResultStatus.REJECTED, "Dropped from full work queue"
+        )
+        processed = [
+            c.args[1] for c in mock_message_repository.publish_result.call_args_list
+        ]
+        assert processed == [requests[0], requests[2]]
+        assert service.stats.dropped == 1
+
+    async def test_high_priority_displaces_waiting_low_priority(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that a full queue makes room for an interactive request."""
+        service = self.make_service(
+            mock_message_repository, mock_search_lyrics_use_case, OverflowPolicy.REJECT
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute()
+        requests = [
+            SearchRequest(title="song 0", artist="artist", priority=Priority.LOW),
+            SearchRequest(title="song 1", artist="artist", priority=Priority.LOW),
+            SearchRequest(title="song 2", artist="artist", priority=Priority.HIGH),
+        ]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+                await asyncio.sleep(0)
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        mock_message_repository.publish_status.assert_called_once_with(
+            requests[1], ResultStatus.REJECTED, "Displaced by a high-priority request"
+        )
+        processed = [
+            c.args[1] for c in mock_message_repository.publish_result.call_args_list
+        ]
+        assert processed == [requests[0], requests[2]]
+        assert service.stats.dropped == 1
+
+    async def test_low_priority_never_drops_high_priority(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that a bulk request is rejected rather than pushing one out."""
+        service = self.make_service(
+            mock_message_repository,
+            mock_search_lyrics_use_case,
+            OverflowPolicy.DROP_OLDEST,
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute()
+        requests = [
+            SearchRequest(title="song 0", artist="artist"),
+            SearchRequest(title="song 1", artist="artist"),
+            SearchRequest(title="song 2", artist="artist", priority=Priority.LOW),
+        ]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+                await asyncio.sleep(0)
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        mock_message_repository.publish_status.assert_called_once_with(
+            requests[2], ResultStatus.REJECTED, "Work queue is full"
+        )
+        assert service.stats.rejected == 1
+
+    async def test_expired_requests_are_dropped_without_result(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that requests whose deadline passed never reach a worker."""
+        service = self.make_service(
+            mock_message_repository, mock_search_lyrics_use_case, OverflowPolicy.BLOCK
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute(0.1)
+        requests = [
+            SearchRequest(title="song 0", artist="artist"),
+            # Expires while song 0 holds the only worker
+            SearchRequest(
+                title="song 1", artist="artist", expires_at=time.time() + 0.05
+            ),
+            SearchRequest(title="song 2", artist="artist", expires_at=time.time() - 1),
+        ]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        executed = [
+            c.args[0] for c in mock_search_lyrics_use_case.execute.call_args_list
+        ]
+        assert executed == [requests[0]]
+        mock_message_repository.publish_status.assert_not_called()
+        assert service.stats.expired == 2
+        assert mock_message_repository.acknowledge.call_count == 3
+
+    async def test_requests_leased_elsewhere_are_skipped(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that only requests this replica leased are processed."""
+        # Arrange
+        lease = AsyncMock()
+        lease.acquire.side_effect = [True, False]
+        lease.renew.return_value = True
+        service = LyricsFetcherService(
+            message_repository=mock_message_repository,
+            search_lyrics_use_case=mock_search_lyrics_use_case,
+            request_lease=lease,
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute(0.01)
+        requests = [
+            SearchRequest(title="song 0", artist="artist"),
+            SearchRequest(title="song 1", artist="artist"),
+        ]
+
+        async def mock_subscribe():
+            for request in requests:
+                yield request
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        # Act
+        await service.start()
+
+        # Assert
+        mock_search_lyrics_use_case.execute.assert_called_once_with(requests[0])
+        assert mock_message_repository.publish_result.call_count == 1
+        mock_message_repository.publish_status.assert_not_called()
+        lease.release.assert_awaited_once_with(requests[0])
+        assert mock_message_repository.acknowledge.call_count == 2
+        assert service.stats.duplicates == 1
+        lease.close.assert_awaited()
+
+    async def test_requests_claimed_elsewhere_while_queued_are_skipped(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that a request whose lease was lost in the queue is not processed."""
+        # Arrange
+        lease = AsyncMock()
+        lease.acquire.return_value = True
+        lease.renew.return_value = False
+        service = LyricsFetcherService(
+            message_repository=mock_message_repository,
+            search_lyrics_use_case=mock_search_lyrics_use_case,
+            request_lease=lease,
+        )
+        request = SearchRequest(title="song", artist="artist")
+
+        async def mock_subscribe():
+            yield request
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        # Act
+        await service.start()
+
+        # Assert
+        lease.renew.assert_awaited_once_with(request)
+        mock_search_lyrics_use_case.execute.assert_not_called()
+        lease.release.assert_awaited_once_with(request)
+        mock_message_repository.acknowledge.assert_awaited_once_with(request)
+        assert service.stats.duplicates == 1
+
+    async def test_deadline_cancels_lookup_in_progress(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+        service: LyricsFetcherService,
+    ) -> None:
+        """Test that a lookup outliving its deadline is cancelled."""
+        cancelled = asyncio.Event()
+
+        async def execute(request: SearchRequest) -> Song:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return Song(title="song", artist="artist", lyrics="Lyrics")
+
+        mock_search_lyrics_use_case.execute.side_effect = execute
+        request = SearchRequest(
+            title="song", artist="artist", expires_at=time.time() + 0.05
+        )
+
+        await asyncio.wait_for(service._process_request(request), timeout=1)
+
+        assert cancelled.is_set()
+        mock_message_repository.publish_result.assert_not_called()
+        mock_message_repository.publish_status.assert_not_called()
+        mock_message_repository.acknowledge.assert_awaited_once_with(request)
+        assert service.stats.expired == 1
+
+    async def test_open_circuit_publishes_unavailable(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+        service: LyricsFetcherService,
+    ) -> None:
+        """Test that a fast-failed lookup is reported as unavailable."""
+        mock_search_lyrics_use_case.execute.side_effect = UpstreamUnavailableError(
+            "genius is unavailable (circuit open)"
+        )
+        request = SearchRequest(title="song", artist="artist")
+
+        await service._process_request(request)
+
+        mock_message_repository.publish_status.assert_called_once_with(
+            request, ResultStatus.UNAVAILABLE, "genius is unavailable (circuit open)"
+        )
+        mock_message_repository.acknowledge.assert_awaited_once_with(request)
+
+    async def test_upstream_timeout_is_not_mistaken_for_deadline(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+        service: LyricsFetcherService,
+    ) -> None:
+        """Test that a timeout raised by the lookup itself is an error."""
+        mock_search_lyrics_use_case.execute.side_effect = TimeoutError()
+        request = SearchRequest(
+            title="song", artist="artist", expires_at=time.time() + 10
+        )
+
+        await service._process_request(request)
+
+        mock_message_repository.publish_status.assert_called_once_with(
+            request, ResultStatus.ERROR, "Lyrics lookup failed"
+        )
+        assert service.stats.expired == 0
+
+    async def test_stats_track_queue_wait(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that time spent waiting for a worker is recorded."""
+        service = self.make_service(
+            mock_message_repository, mock_search_lyrics_use_case, OverflowPolicy.BLOCK
+        )
+        mock_search_lyrics_use_case.execute.side_effect = self.slow_execute(0.05)
+
+        async def mock_subscribe():
+            yield SearchRequest(title="song 0", artist="artist")
+            yield SearchRequest(title="song 1", artist="artist")
+            service._running = False
+
+        mock_message_repository.subscribe_requests = MagicMock(
+            return_value=mock_subscribe()
+        )
+
+        await service.start()
+
+        assert service.stats.queue_wait_seconds_max >= 0.04
+        assert service.stats.queue_wait_seconds_avg > 0
+        assert service.stats.in_flight == 0
+
+    async def test_trace_id_is_kept_or_assigned(
+        self,
+        service: LyricsFetcherService,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that results carry the request's trace ID or a new one."""
+        # Arrange
+        traced = SearchRequest(title="song", artist="artist", trace_id="a" * 32)
+        untraced = SearchRequest(title="song", artist="artist")
+        mock_search_lyrics_use_case.execute.return_value = None
+
+        # Act
+        await service._process_request(traced)
+        await service._process_request(untraced)
+
+        # Assert
+        published = [
+            call.args[0].trace_id
+            for call in mock_message_repository.publish_status.call_args_list
+        ]
+        assert published[0] == "a" * 32
+        assert published[1] is not None and len(published[1]) == 32
+
+    def test_rejects_non_positive_queue_size(
+        self,
+        mock_message_repository: AsyncMock,
+        mock_search_lyrics_use_case: AsyncMock,
+    ) -> None:
+        """Test that the work queue needs room for at least one request."""
+        with pytest.raises(ValueError, match="queue_size must be positive"):
+            LyricsFetcherService(
+                message_repository=mock_message_repository,
+                search_lyrics_use_case=mock_search_lyrics_use_case,
+                queue_size=0,
+            )
@@ -0,0 +1,87 @@
+"""Unit tests for query normalization and candidate ranking."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.utils.matching import best_match, similarity
+from src.domain.utils.normalization import normalize_key, search_text
+from src.domain.utils.romanization import romanize
+
+
+class TestNormalization:
+    """Tests for lookup normalization."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Song (feat. Drake)", "song"),
+            ("Song [Ft. X] (Remix)", "song remix"),
+            ("Song featuring Someone", "song"),
+            ("Don’t Stop!", "dont stop"),
+            ("ＢＬＡＣＫ　ＮＵＴ", "black nut"),
+            ("Featherweight", "featherweight"),
+            ("?", "?"),
+        ],
+    )
+    def test_search_text(self, text: str, expected: str) -> None:
+        """Test that credits and punctuation are dropped but remixes are kept."""
+        assert search_text(text) == expected
+
+    def test_equivalent_queries_share_a_key(self) -> None:
+        """Test that cache and dedupe keys ignore credits and punctuation."""
+        assert normalize_key("Don't Stop (feat. X)", "Artist") == normalize_key(
+            "dont stop", "ARTIST"
+        )
+        assert normalize_key("Song (Remix)", "Artist") != normalize_key(
+            "Song", "Artist"
+        )
+
+
+class TestRomanization:
+    """Tests for Hangul and Kana romanization."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("블랙넛", "beulraekneot"),
+            ("강남 스타일", "gangnam seutail"),
+            ("しゃしん", "shashin"),
+            ("がっこう", "gakkou"),
+            ("キャッチ", "kyatchi"),
+            ("東京 Drift", "東京 Drift"),
+        ],
+    )
+    def test_romanize(self, text: str, expected: str) -> None:
+        """Test transliteration of each script."""
+        assert romanize(text) == expected
+
+
+class TestRanking:
+    """Tests for candidate ranking."""
+
+    def test_parenthesized_alias_matches(self) -> None:
+        """Test that a name matches its parenthesized alias on Genius."""
+        assert similarity("블랙넛", "Black Nut (블랙넛)") == 1.0
+
+    def test_scripts_are_compared_after_romanization(self) -> None:
+        """Test that Hangul and romanized spellings are similar."""
+        assert similarity("Gangnam Style", "강남스타일") > similarity(
+            "Gangnam Style", "Daddy"
+        )
+
+    def test_best_candidate_wins(self) -> None:
+        """Test that the closest candidate is picked over the first."""
+        candidates = [("Intro", "Black Nut"), ("맨발 (Barefoot)", "Black Nut")]
+
+        assert best_match("맨발", "블랙넛", candidates) == 1
+
+    def test_near_ties_keep_provider_order(self) -> None:
+        """Test that equally good candidates keep the provider's ranking."""
+        candidates = [("Hello", "Adele"), ("Hello", "Adele")]
+
+        assert best_match("Hello", "Adele", candidates) == 0
+
+    def test_no_candidates(self) -> None:
+        """Test that an empty candidate list has no best match."""
+        assert best_match("Hello", "Adele", []) is None
@@ -0,0 +1,128 @@
+"""Unit tests for the metrics registry and endpoint."""
+
+from __future__ import annotations
+
+import aiohttp
+import pytest
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.presentation.metrics_server import CONTENT_TYPE, MetricsServer
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_counter_renders_each_label_set(self) -> None:
+        """Test that counters render help, type and one line per label set."""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ["outcome"])
+
+        # Act
+        counter.inc(outcome="found")
+        counter.inc(2, outcome="not_found")
+
+        # Assert
+        assert registry.render() == (
+            "# HELP requests_total Requests\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{outcome="found"} 1.0\n'
+            'requests_total{outcome="not_found"} 2.0\n'
+        )
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test that bucket counts include every smaller observation."""
+        # Arrange
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+
+        # Act
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        # Assert
+        rendered = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1.0' in rendered
+        assert 'latency_seconds_bucket{le="1.0"} 2.0' in rendered
+        assert 'latency_seconds_bucket{le="+Inf"} 3.0' in rendered
+        assert "latency_seconds_sum 3.55" in rendered
+        assert "latency_seconds_count 3.0" in rendered
+        assert histogram.count() == 3
+
+    def test_gauge_function_is_read_at_render_time(self) -> None:
+        """Test that callback gauges report the current value."""
+        # Arrange
+        registry = MetricsRegistry()
+        gauge = registry.gauge("queue_depth", "Depth")
+        depth = [1]
+        gauge.set_function(lambda: depth[0])
+
+        # Act
+        depth[0] = 7
+
+        # Assert
+        assert "queue_depth 7.0" in registry.render()
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test that quotes in label values do not break the format."""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("errors_total", "Errors", ["type"])
+
+        # Act
+        counter.inc(type='say "hi"')
+
+        # Assert
+        assert 'errors_total{type="say \\"hi\\""} 1.0' in registry.render()
+
+    def test_wrong_labels_are_rejected(self) -> None:
+        """Test that samples must carry exactly the declared labels."""
+        # Arrange
+        counter = MetricsRegistry().counter("errors_total", "Errors", ["stage"])
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            counter.inc(kind="timeout")
+
+    def test_registration_is_idempotent(self) -> None:
+        """Test that modules declaring the same metric share one instance."""
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        first = registry.counter("errors_total", "Errors", ["stage"])
+        second = registry.counter("errors_total", "Errors", ["stage"])
+
+        # Assert
+        assert first is second
+        with pytest.raises(ValueError):
+            registry.gauge("errors_total", "Errors", ["stage"])
+
+
+class TestMetricsServer:
+    """Tests for MetricsServer."""
+
+    async def test_serves_registry_on_metrics_path(self) -> None:
+        """Test that GET /metrics returns the rendered registry."""
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests").inc()
+        server = MetricsServer(registry=registry, host="127.0.0.1", port=0)
+        await server.start()
+
+        # Act
+        try:
+            async with (
+                aiohttp.ClientSession() as session,
+                session.get(f"http://127.0.0.1:{server.port}/metrics") as response,
+            ):
+                body = await response.text()
+                content_type = response.headers["Content-Type"]
+        finally:
+            await server.stop()
+
+        # Assert
+        assert response.status == 200
+        assert content_type == CONTENT_TYPE
+        assert "requests_total 1.0" in body
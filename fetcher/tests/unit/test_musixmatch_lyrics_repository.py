@@ -0,0 +1,132 @@
+"""Unit tests for MusixmatchLyricsRepository."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.external.musixmatch_lyrics_repository import (
+    LYRICS_DISCLAIMER,
+    MusixmatchLyricsRepository,
+    clean_lyrics,
+)
+
+
+def make_search_response(*tracks: dict[str, Any]) -> dict[str, Any]:
+    """Build a Musixmatch track.search response."""
+    return {"message": {"body": {"track_list": [{"track": track} for track in tracks]}}}
+
+
+def make_lyrics_response(lyrics_body: str) -> dict[str, Any]:
+    """Build a Musixmatch track.lyrics.get response."""
+    return {"message": {"body": {"lyrics": {"lyrics_body": lyrics_body}}}}
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    """Create a mock synchronous Musixmatch client."""
+    client = MagicMock()
+    client.search_tracks.return_value = make_search_response(
+        {
+            "track_id": 7,
+            "track_name": "Test Song",
+            "artist_name": "Test Artist",
+            "album_name": "Test Album",
+            "track_share_url": "https://www.musixmatch.com/lyrics/test",
+            "first_release_date": "2024-01-01T00:00:00Z",
+        }
+    )
+    client.get_track_lyrics.return_value = make_lyrics_response(
+        f"First line\nSecond line\n\n{LYRICS_DISCLAIMER}\n(1409624)"
+    )
+    return client
+
+
+@pytest.fixture
+def repository(mock_client: MagicMock) -> MusixmatchLyricsRepository:
+    """Create a MusixmatchLyricsRepository with a mock client."""
+    return MusixmatchLyricsRepository(client=mock_client)
+
+
+class TestMusixmatchLyricsRepository:
+    """Tests for MusixmatchLyricsRepository."""
+
+    async def test_search_song_returns_song_with_lyrics(
+        self, repository: MusixmatchLyricsRepository, mock_client: MagicMock
+    ) -> None:
+        """Test that a matching track is returned with cleaned lyrics."""
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.title == "Test Song"
+        assert song.artist == "Test Artist"
+        assert song.album == "Test Album"
+        assert song.lyrics == "First line\nSecond line"
+        mock_client.search_tracks.assert_called_once_with("Test Artist Test Song")
+        mock_client.get_track_lyrics.assert_called_once_with(track_id=7)
+
+    async def test_search_song_picks_best_matching_track(
+        self, repository: MusixmatchLyricsRepository, mock_client: MagicMock
+    ) -> None:
+        """Test that tracks are ranked instead of taking the first."""
+        # Arrange
+        mock_client.search_tracks.return_value = make_search_response(
+            {"track_id": 1, "track_name": "Test Song", "artist_name": "Cover Band"},
+            {"track_id": 2, "track_name": "Test Song", "artist_name": "Test Artist"},
+        )
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.artist == "Test Artist"
+        mock_client.get_track_lyrics.assert_called_once_with(track_id=2)
+
+    async def test_search_song_returns_none_without_tracks(
+        self, repository: MusixmatchLyricsRepository, mock_client: MagicMock
+    ) -> None:
+        """Test that an empty track list means no match."""
+        # Arrange
+        mock_client.search_tracks.return_value = make_search_response()
+
+        # Act
+        song = await repository.search_song(title="Unknown", artist="Nobody")
+
+        # Assert
+        assert song is None
+        mock_client.get_track_lyrics.assert_not_called()
+
+    async def test_search_song_keeps_song_when_lyrics_fetch_fails(
+        self, repository: MusixmatchLyricsRepository, mock_client: MagicMock
+    ) -> None:
+        """Test that a lyrics failure still returns the track metadata."""
+        # Arrange
+        mock_client.get_track_lyrics.side_effect = RuntimeError("boom")
+
+        # Act
+        song = await repository.search_song(title="Test Song", artist="Test Artist")
+
+        # Assert
+        assert song is not None
+        assert song.lyrics is None
+
+    async def test_search_song_raises_on_search_error(
+        self, repository: MusixmatchLyricsRepository, mock_client: MagicMock
+    ) -> None:
+        """Test that a search error is raised rather than reported as no match."""
+        # Arrange
+        mock_client.search_tracks.side_effect = RuntimeError("API down")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await repository.search_song(title="Test Song", artist="Test Artist")
+
+    @pytest.mark.parametrize("body", [None, "", f"\n{LYRICS_DISCLAIMER}"])
+    def test_clean_lyrics_returns_none_without_text(self, body: str | None) -> None:
+        """Test that bodies without lyrics text are treated as missing."""
+        assert clean_lyrics(body) is None
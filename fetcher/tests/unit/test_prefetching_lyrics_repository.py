@@ -0,0 +1,168 @@
+"""Unit tests for related-song prefetching."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.song import Song
+from src.infrastructure.cache.background_refresher import BackgroundRefresher
+from src.infrastructure.cache.prefetching_lyrics_repository import (
+    PrefetchingLyricsRepository,
+)
+
+
+@pytest.fixture
+def mock_inner() -> AsyncMock:
+    """Create a mock caching repository finding every song."""
+    inner = AsyncMock()
+
+    async def search(title: str, artist: str) -> Song:
+        return Song(title=title, artist=artist, lyrics=f"{title} lyrics")
+
+    inner.search_song.side_effect = search
+    return inner
+
+
+@pytest.fixture
+def mock_related() -> AsyncMock:
+    """Create a mock related-song source."""
+    related = AsyncMock()
+    related.related_songs.return_value = [("Next", "Artist"), ("Hit", "Artist")]
+    return related
+
+
+@pytest.fixture
+def pool() -> BackgroundRefresher:
+    """Create a single-worker prefetch pool."""
+    return BackgroundRefresher(workers=1, name="prefetch")
+
+
+@pytest.fixture
+def repository(
+    mock_inner: AsyncMock, mock_related: AsyncMock, pool: BackgroundRefresher
+) -> PrefetchingLyricsRepository:
+    """Create a prefetching repository over the mocks."""
+    return PrefetchingLyricsRepository(
+        inner=mock_inner, related=mock_related, pool=pool, max_songs=2
+    )
+
+
+class TestPrefetchingLyricsRepository:
+    """Tests for PrefetchingLyricsRepository."""
+
+    async def test_found_song_prefetches_related_songs(
+        self,
+        repository: PrefetchingLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_related: AsyncMock,
+        pool: BackgroundRefresher,
+    ) -> None:
+        """Test that related songs are looked up in the background."""
+        # Act
+        song = await repository.search_song(title="Song", artist="Artist")
+        await pool.join()
+
+        # Assert
+        assert song is not None
+        mock_related.related_songs.assert_awaited_once_with(song=song, limit=2)
+        searched = [call.kwargs["title"] for call in mock_inner.search_song.mock_calls]
+        assert searched == ["Song", "Next", "Hit"]
+        assert repository.stats.prefetched == 2
+        await repository.close()
+
+    async def test_request_for_prefetched_song_counts_as_hit(
+        self,
+        repository: PrefetchingLyricsRepository,
+        mock_related: AsyncMock,
+        pool: BackgroundRefresher,
+    ) -> None:
+        """Test the hit ratio of prefetched songs."""
+        # Arrange
+        await repository.search_song(title="Song", artist="Artist")
+        await pool.join()
+        mock_related.related_songs.return_value = []
+
+        # Act
+        await repository.search_song(title="next", artist="ARTIST")
+        await repository.search_song(title="next", artist="ARTIST")
+        await pool.join()
+
+        # Assert
+        assert repository.stats.hits == 1
+        assert repository.stats.hit_ratio == 0.5
+        await repository.close()
+
+    async def test_songs_already_cached_do_not_count_as_prefetched(
+        self,
+        repository: PrefetchingLyricsRepository,
+        mock_inner: AsyncMock,
+        pool: BackgroundRefresher,
+    ) -> None:
+        """Test that only songs fetched upstream count towards the hit ratio."""
+        # Arrange
+        fetch = mock_inner.search_song.side_effect
+
+        async def search(title: str, artist: str) -> Song:
+            song = await fetch(title, artist)
+            if title == "Hit":
+                # Fetched an hour ago and answered from the cache
+                song.fetched_at -= 3600
+            return song
+
+        mock_inner.search_song.side_effect = search
+
+        # Act
+        await repository.search_song(title="Song", artist="Artist")
+        await pool.join()
+        await repository.search_song(title="Hit", artist="Artist")
+
+        # Assert
+        assert repository.stats.prefetched == 1
+        assert repository.stats.hits == 0
+        await repository.close()
+
+    async def test_song_is_expanded_once(
+        self,
+        repository: PrefetchingLyricsRepository,
+        mock_related: AsyncMock,
+        pool: BackgroundRefresher,
+    ) -> None:
+        """Test that repeated searches do not look up related songs again."""
+        await repository.search_song(title="Song", artist="Artist")
+        await pool.join()
+        await repository.search_song(title="Song", artist="Artist")
+        await pool.join()
+
+        assert mock_related.related_songs.await_count == 1
+        await repository.close()
+
+    async def test_missing_song_is_not_expanded(
+        self,
+        repository: PrefetchingLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_related: AsyncMock,
+        pool: BackgroundRefresher,
+    ) -> None:
+        """Test that nothing is prefetched for a song that was not found."""
+        mock_inner.search_song.side_effect = None
+        mock_inner.search_song.return_value = None
+
+        assert await repository.search_song(title="Song", artist="Artist") is None
+        await pool.join()
+
+        mock_related.related_songs.assert_not_called()
+        await repository.close()
+
+    async def test_close_closes_pool_and_sources(
+        self,
+        repository: PrefetchingLyricsRepository,
+        mock_inner: AsyncMock,
+        mock_related: AsyncMock,
+    ) -> None:
+        """Test that close releases the related-song source and inner repository."""
+        await repository.close()
+
+        mock_related.close.assert_awaited_once()
+        mock_inner.close.assert_awaited_once()
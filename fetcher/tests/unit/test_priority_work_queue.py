@@ -0,0 +1,111 @@
+"""Unit tests for the two-lane work queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.domain.entities.priority import Priority
+from src.infrastructure.concurrency.priority_work_queue import PriorityWorkQueue
+
+
+async def drain(queue: PriorityWorkQueue[str]) -> list[str]:
+    """Take every waiting item one at a time, finishing each before the next."""
+    taken = []
+    while queue.qsize():
+        item, priority = await queue.get()
+        taken.append(item)
+        await queue.task_done(priority)
+    return taken
+
+
+class TestPriorityWorkQueue:
+    """Tests for PriorityWorkQueue."""
+
+    async def test_high_priority_is_taken_first(self) -> None:
+        """Test that waiting high-priority items overtake low-priority ones."""
+        # Arrange
+        queue: PriorityWorkQueue[str] = PriorityWorkQueue(capacity=10, workers=1)
+        await queue.put("low 0", Priority.LOW)
+        await queue.put("high 0", Priority.HIGH)
+        await queue.put("high 1", Priority.HIGH)
+
+        # Act
+        taken = await drain(queue)
+
+        # Assert
+        assert taken == ["high 0", "high 1", "low 0"]
+
+    async def test_low_priority_is_not_starved(self) -> None:
+        """Test that a low-priority item runs after every high_weight high ones."""
+        # Arrange
+        queue: PriorityWorkQueue[str] = PriorityWorkQueue(
+            capacity=10, workers=1, high_weight=2
+        )
+        for i in range(4):
+            await queue.put(f"high {i}", Priority.HIGH)
+        await queue.put("low 0", Priority.LOW)
+        await queue.put("low 1", Priority.LOW)
+
+        # Act
+        taken = await drain(queue)
+
+        # Assert
+        assert taken == ["high 0", "high 1", "low 0", "high 2", "high 3", "low 1"]
+
+    async def test_reserved_workers_stay_free_of_low_priority(self) -> None:
+        """Test that low-priority items leave the reserved workers idle."""
+        # Arrange
+        queue: PriorityWorkQueue[str] = PriorityWorkQueue(
+            capacity=10, workers=3, reserved_workers=2
+        )
+        await queue.put("low 0", Priority.LOW)
+        await queue.put("low 1", Priority.LOW)
+        await queue.get()
+
+        # Act
+        blocked = asyncio.create_task(queue.get())
+        await asyncio.sleep(0.01)
+        await queue.put("high 0", Priority.HIGH)
+
+        # Assert
+        assert await blocked == ("high 0", Priority.HIGH)
+        assert queue.in_flight(Priority.LOW) == 1
+        assert queue.qsize(Priority.LOW) == 1
+
+    async def test_low_priority_uses_idle_workers_without_reservation(self) -> None:
+        """Test that a reservation covering every worker still leaves one."""
+        # Arrange
+        queue: PriorityWorkQueue[str] = PriorityWorkQueue(
+            capacity=10, workers=2, reserved_workers=5
+        )
+        await queue.put("low 0", Priority.LOW)
+
+        # Act
+        item = await asyncio.wait_for(queue.get(), timeout=1)
+
+        # Assert
+        assert item == ("low 0", Priority.LOW)
+
+    async def test_put_waits_for_room_and_join_for_completion(self) -> None:
+        """Test that the shared capacity applies backpressure across lanes."""
+        # Arrange
+        queue: PriorityWorkQueue[str] = PriorityWorkQueue(capacity=1, workers=1)
+        await queue.put("low 0", Priority.LOW)
+        put = asyncio.create_task(queue.put("high 0", Priority.HIGH))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+
+        # Act
+        await drain(queue)
+        await put
+        await drain(queue)
+
+        # Assert
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    def test_rejects_non_positive_capacity(self) -> None:
+        """Test that the queue needs room for at least one item."""
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            PriorityWorkQueue[str](capacity=0, workers=1)
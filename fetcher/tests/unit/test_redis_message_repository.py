@@ -0,0 +1,388 @@
+"""Unit tests for RedisMessageRepository batching and reconnects."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.asyncio as redis
+
+from src.domain.entities.priority import Priority
+from src.domain.entities.result_status import ResultStatus
+from src.domain.entities.search_request import SearchRequest
+from src.domain.entities.song import Song
+from src.infrastructure.messaging.redis_message_repository import (
+    RedisMessageRepository,
+    reconnect_delay,
+    request_expiry,
+)
+from src.infrastructure.messaging.redis_streams_message_repository import (
+    RedisStreamsMessageRepository,
+)
+from src.infrastructure.messaging.result_codec import (
+    MAGIC,
+    ResultCodec,
+    decode_result,
+)
+
+
+class FakePipeline:
+    """Pipeline stand-in recording the commands it executes."""
+
+    def __init__(
+        self, executed: list[list[str]], error: Exception | None, delay: float = 0.0
+    ) -> None:
+        self.commands: list[str] = []
+        self.executed = executed
+        self.error = error
+        self.delay = delay
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    def publish(self, channel: str, message: str) -> None:
+        self.commands.append(message)
+
+    async def execute(self) -> list[int]:
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.executed.append(self.commands)
+        return [1] * len(self.commands)
+
+
+def make_client(
+    executed: list[list[str]], error: Exception | None = None, delay: float = 0.0
+) -> MagicMock:
+    """Create a Redis client mock whose pipelines record executed batches."""
+    client = MagicMock()
+    client.publish = AsyncMock()
+    client.pipeline.side_effect = lambda transaction: FakePipeline(
+        executed, error, delay
+    )
+    return client
+
+
+def make_song(i: int) -> tuple[Song, SearchRequest]:
+    """Build a song and its originating request."""
+    return (
+        Song(title=f"Song {i}", artist="Artist", lyrics="Lyrics"),
+        SearchRequest(title=f"song {i}", artist="artist"),
+    )
+
+
+class TestBatchedPublishing:
+    """Tests for pipelined result publishing."""
+
+    async def test_unbatched_mode_publishes_directly(self) -> None:
+        """Test that batching is off by default."""
+        executed: list[list[str]] = []
+        repository = RedisMessageRepository()
+        repository.client = make_client(executed)
+
+        await repository.publish_result(*make_song(0))
+
+        repository.client.publish.assert_awaited_once()
+        assert executed == []
+
+    async def test_full_batch_is_flushed_in_order(self) -> None:
+        """Test that results are pipelined once the batch size is reached."""
+        executed: list[list[str]] = []
+        repository = RedisMessageRepository(
+            publish_batch_size=3, publish_linger_ms=1000
+        )
+        repository.client = make_client(executed)
+
+        await asyncio.gather(
+            *(repository.publish_result(*make_song(i)) for i in range(3))
+        )
+
+        assert len(executed) == 1
+        titles = [json.loads(m)["request_title"] for m in executed[0]]
+        assert titles == ["song 0", "song 1", "song 2"]
+        repository.client.publish.assert_not_called()
+
+    async def test_partial_batch_is_flushed_after_linger(self) -> None:
+        """Test that a lone result is not held longer than the linger time."""
+        executed: list[list[str]] = []
+        repository = RedisMessageRepository(publish_batch_size=10, publish_linger_ms=20)
+        repository.client = make_client(executed)
+
+        await asyncio.wait_for(repository.publish_result(*make_song(0)), timeout=1.0)
+
+        assert len(executed) == 1
+        assert len(executed[0]) == 1
+
+    async def test_pipeline_error_is_raised_to_every_publisher(self) -> None:
+        """Test that callers see publish failures of their batch."""
+        repository = RedisMessageRepository(
+            publish_batch_size=2, publish_linger_ms=1000
+        )
+        repository.client = make_client([], error=ConnectionError("down"))
+
+        results = await asyncio.gather(
+            *(repository.publish_result(*make_song(i)) for i in range(2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    async def test_disconnect_flushes_pending_results(self) -> None:
+        """Test that buffered results are sent before closing."""
+        executed: list[list[str]] = []
+        repository = RedisMessageRepository(
+            publish_batch_size=10, publish_linger_ms=10000
+        )
+        client = make_client(executed)
+        client.close = AsyncMock()
+        repository.client = client
+
+        task = asyncio.create_task(repository.publish_result(*make_song(0)))
+        await asyncio.sleep(0)
+        await repository.disconnect()
+        await task
+
+        assert len(executed) == 1
+
+    async def test_disconnect_waits_for_flush_in_progress(self) -> None:
+        """Test that disconnecting mid-flush still completes the publishers."""
+        # Arrange
+        executed: list[list[str]] = []
+        repository = RedisMessageRepository(publish_batch_size=10, publish_linger_ms=1)
+        client = make_client(executed, delay=0.05)
+        flushed_before_close: list[int] = []
+        client.close = AsyncMock(
+            side_effect=lambda: flushed_before_close.append(len(executed))
+        )
+        client.connection_pool.disconnect = AsyncMock()
+        repository.client = client
+        task = asyncio.create_task(repository.publish_result(*make_song(0)))
+        await asyncio.sleep(0.02)
+
+        # Act
+        await repository.disconnect()
+
+        # Assert
+        assert flushed_before_close == [1]
+        await asyncio.wait_for(task, timeout=1.0)
+
+    async def test_trace_id_is_echoed_in_results(self) -> None:
+        """Test that results and statuses carry the request's trace ID."""
+        repository = RedisMessageRepository()
+        repository.client = make_client([])
+        song, request = make_song(0)
+        request.trace_id = "a" * 32
+
+        await repository.publish_result(song, request)
+        await repository.publish_status(request, ResultStatus.NOT_FOUND)
+
+        messages = [
+            json.loads(call.args[1])
+            for call in repository.client.publish.await_args_list
+        ]
+        assert [m["trace_id"] for m in messages] == ["a" * 32, "a" * 32]
+
+    async def test_results_use_configured_codec(self) -> None:
+        """Test that results are published in the codec's wire format."""
+        pytest.importorskip("msgpack")
+        repository = RedisMessageRepository(
+            result_codec=ResultCodec(result_format="msgpack", compression="zlib")
+        )
+        repository.client = make_client([])
+        song, request = make_song(0)
+
+        await repository.publish_result(song, request)
+
+        message = repository.client.publish.await_args.args[1]
+        assert message[:1] == MAGIC
+        assert decode_result(message)["lyrics"] == "Lyrics"
+
+
+class TestBatchedReading:
+    """Tests for draining buffered pub/sub messages."""
+
+    async def test_read_batch_drains_buffered_messages(self) -> None:
+        """Test that one read returns every already-buffered message."""
+        repository = RedisMessageRepository(read_batch_size=2)
+        messages: list[dict[str, Any] | None] = [
+            {"type": "message", "data": json.dumps({"title": "a", "artist": "b"})},
+            {"type": "message", "data": json.dumps({"title": "c", "artist": "d"})},
+            {"type": "message", "data": json.dumps({"title": "e", "artist": "f"})},
+        ]
+        pubsub = MagicMock()
+        pubsub.get_message = AsyncMock(side_effect=messages)
+        repository.pubsub = pubsub
+
+        batch = await repository._read_batch()
+
+        assert [m["data"] for m in batch] == [m["data"] for m in messages[:2] if m]
+
+    def test_trace_id_is_parsed(self) -> None:
+        """Test that the optional trace ID is read from the request."""
+        repository = RedisMessageRepository()
+        data = json.dumps({"title": "a", "artist": "b", "trace_id": "t"})
+
+        request = repository._parse_message({"type": "message", "data": data})
+
+        assert request is not None
+        assert request.trace_id == "t"
+
+    def test_priority_defaults_to_high(self) -> None:
+        """Test that only requests marked low are treated as bulk work."""
+        repository = RedisMessageRepository()
+        low = json.dumps({"title": "a", "artist": "b", "priority": "low"})
+        unmarked = json.dumps({"title": "a", "artist": "b"})
+
+        requests = [
+            repository._parse_message({"type": "message", "data": data})
+            for data in (low, unmarked)
+        ]
+
+        assert [r.priority if r else None for r in requests] == [
+            Priority.LOW,
+            Priority.HIGH,
+        ]
+
+    def test_deadline_is_parsed(self) -> None:
+        """Test that absolute and relative deadlines become a Unix time."""
+        assert request_expiry({"expires_at": 1_700_000_000_500}) == 1_700_000_000.5
+        assert request_expiry({"deadline_ms": 2500}, sent_at=100.0) == 102.5
+        assert request_expiry({}) is None
+
+        repository = RedisMessageRepository()
+        data = json.dumps({"title": "a", "artist": "b", "deadline_ms": 10_000})
+        request = repository._parse_message({"type": "message", "data": data})
+        assert request is not None
+        assert 9 < (request.remaining_seconds() or 0) <= 10
+
+    async def test_stream_deadline_counts_from_entry_time(self) -> None:
+        """Test that a stream entry's budget starts when it was added."""
+        repository = RedisStreamsMessageRepository()
+        fields = {"title": "a", "artist": "b", "deadline_ms": "5000"}
+
+        request = await repository._parse_entry("1700000000000-0", fields)
+
+        assert request is not None
+        assert request.expires_at == 1_700_000_005.0
+        assert request.expired()
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "invalid json",
+            json.dumps({"title": "only title"}),
+            json.dumps({}),
+            json.dumps({"title": "a", "artist": "b", "priority": "urgent"}),
+            json.dumps({"title": "a", "artist": "b", "expires_at": "soon"}),
+        ],
+    )
+    def test_invalid_messages_are_skipped(self, data: str) -> None:
+        """Test that malformed requests are ignored."""
+        repository = RedisMessageRepository()
+
+        assert repository._parse_message({"type": "message", "data": data}) is None
+
+
+class TestReconnect:
+    """Tests for health checks and reconnecting after connection loss."""
+
+    @pytest.mark.parametrize("attempt", [0, 3, 20])
+    def test_reconnect_delay_is_jittered_below_cap(self, attempt: int) -> None:
+        """Test that delays stay within the exponential bound and the cap."""
+        delays = [reconnect_delay(attempt, 0.5, 30.0) for _ in range(100)]
+
+        assert all(0 <= delay <= min(30.0, 0.5 * 2**attempt) for delay in delays)
+        assert len(set(delays)) > 1
+
+    async def test_subscription_is_restored_after_connection_error(self) -> None:
+        """Test that a dropped pub/sub connection is resubscribed."""
+        # Arrange
+        repository = RedisMessageRepository(reconnect_backoff=0)
+        data = json.dumps({"title": "a", "artist": "b"})
+        broken = MagicMock()
+        broken.get_message = AsyncMock(side_effect=redis.ConnectionError("reset"))
+        broken.close = AsyncMock()
+        fresh = MagicMock()
+        fresh.subscribe = AsyncMock()
+        fresh.get_message = AsyncMock(
+            side_effect=[{"type": "message", "data": data}, None]
+        )
+        client = MagicMock()
+        client.pubsub.return_value = fresh
+        repository.consumer_client = client
+        repository.pubsub = broken
+
+        # Act
+        request = await anext(repository.subscribe_requests())
+
+        # Assert
+        assert request.title == "a"
+        broken.close.assert_awaited_once()
+        fresh.subscribe.assert_awaited_once_with("lyrics:requests")
+
+    async def test_unanswered_health_check_raises(self) -> None:
+        """Test that an idle connection whose PING goes unanswered fails."""
+        # Arrange
+        repository = RedisMessageRepository(health_check_interval=0.01)
+        pubsub = MagicMock()
+
+        async def idle(**kwargs: Any) -> None:
+            await asyncio.sleep(kwargs["timeout"])
+
+        pubsub.get_message = AsyncMock(side_effect=idle)
+        pubsub.ping = AsyncMock()
+        repository.pubsub = pubsub
+
+        # Act / Assert
+        with pytest.raises(redis.ConnectionError):
+            await repository._wait_for_message()
+        pubsub.ping.assert_awaited_once()
+
+    async def test_pong_keeps_waiting_for_message(self) -> None:
+        """Test that PONG replies are consumed, not returned."""
+        # Arrange
+        repository = RedisMessageRepository(health_check_interval=0.01)
+        message = {"type": "message", "data": "{}"}
+        pubsub = MagicMock()
+        pubsub.get_message = AsyncMock(
+            side_effect=[{"type": "pong", "data": ""}, message]
+        )
+        repository.pubsub = pubsub
+
+        # Act / Assert
+        assert await repository._wait_for_message() == message
+
+    async def test_streams_consumer_group_is_recreated(self) -> None:
+        """Test that a NOGROUP error recreates the group and keeps reading."""
+        # Arrange
+        repository = RedisStreamsMessageRepository(
+            claim_interval_seconds=3600, reconnect_backoff=0
+        )
+        repository._last_claim = time.monotonic()
+        fields = {"data": json.dumps({"title": "a", "artist": "b"})}
+        client = MagicMock()
+        client.xreadgroup = AsyncMock(
+            side_effect=[
+                redis.ConnectionError("reset"),
+                redis.ResponseError("NOGROUP No such key or consumer group"),
+                [["lyrics:requests:stream", [("1-0", fields)]]],
+            ]
+        )
+        client.ping = AsyncMock()
+        client.xgroup_create = AsyncMock()
+        repository.consumer_client = client
+
+        # Act
+        request = await anext(repository.subscribe_requests())
+
+        # Assert
+        assert request.title == "a"
+        client.ping.assert_awaited_once()
+        assert client.xgroup_create.await_count == 2
@@ -0,0 +1,89 @@
+"""Unit tests for the result wire formats."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from src.infrastructure.messaging.result_codec import (
+    MAGIC,
+    Compression,
+    ResultCodec,
+    decode_result,
+)
+
+pytest.importorskip("msgpack")
+pytest.importorskip("zstandard")
+
+RESULT: dict[str, Any] = {
+    "title": "맨발",
+    "artist": "블랙넛",
+    "lyrics": "가사 한 줄\n" * 400,
+    "url": "https://genius.com/song",
+    "album": None,
+    "status": "ok",
+    "trace_id": "a" * 32,
+}
+
+
+class TestResultCodec:
+    """Tests for ResultCodec and decode_result."""
+
+    def test_json_is_the_default(self) -> None:
+        """Test that the default codec keeps publishing plain JSON."""
+        message = ResultCodec().encode(RESULT)
+
+        assert json.loads(message) == RESULT
+
+    @pytest.mark.parametrize("compression", ["zstd", "zlib", "none"])
+    def test_compact_round_trip(self, compression: str) -> None:
+        """Test that compact frames decode to the original result."""
+        # Arrange
+        codec = ResultCodec(result_format="msgpack", compression=compression)
+
+        # Act
+        message = codec.encode(RESULT)
+
+        # Assert
+        assert message[:1] == MAGIC
+        assert message[2] == Compression[compression.upper()]
+        assert decode_result(message) == RESULT
+
+    def test_compressed_frame_is_smaller_than_json(self) -> None:
+        """Test that large lyrics shrink well below their JSON size."""
+        json_size = len(ResultCodec().encode(RESULT))
+
+        compact_size = len(ResultCodec(result_format="msgpack").encode(RESULT))
+
+        assert compact_size < json_size / 4
+
+    def test_small_results_are_not_compressed(self) -> None:
+        """Test that results below the threshold skip compression."""
+        codec = ResultCodec(result_format="msgpack", compress_threshold=1024)
+
+        message = codec.encode({"status": "not_found", "detail": None})
+
+        assert message[2] == Compression.NONE
+
+    @pytest.mark.parametrize("data", [json.dumps(RESULT), json.dumps(RESULT).encode()])
+    def test_json_messages_are_decoded(self, data: str | bytes) -> None:
+        """Test that subscribers can keep reading JSON during a migration."""
+        assert decode_result(data) == RESULT
+
+    def test_unknown_version_is_rejected(self) -> None:
+        """Test that frames from a newer format version are not misread."""
+        message = ResultCodec(result_format="msgpack").encode(RESULT)
+
+        with pytest.raises(ValueError, match="version"):
+            decode_result(MAGIC + bytes((2,)) + message[2:])
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"result_format": "protobuf"}, {"compression": "brotli"}],
+    )
+    def test_unknown_options_are_rejected(self, options: dict[str, str]) -> None:
+        """Test that misconfigured formats fail at startup."""
+        with pytest.raises(ValueError):
+            ResultCodec(**options)
@@ -63,16 +63,14 @@ class TestSearchLyricsUseCase:
             title="Unknown Song", artist="Unknown Artist"
         )
 
-    async def test_execute_returns_none_on_repository_error(
+    async def test_execute_raises_on_repository_error(
         self, use_case: SearchLyricsUseCase, mock_lyrics_repository: AsyncMock
     ) -> None:
-        """Test that execute returns None when repository raises error."""
+        """Test that repository errors are not reported as a missing song."""
         # Arrange
         request = SearchRequest(title="Error Song", artist="Error Artist")
         mock_lyrics_repository.search_song.side_effect = Exception("API Error")
 
-        # Act
-        result = await use_case.execute(request)
-
-        # Assert
-        assert result is None
+        # Act & Assert
+        with pytest.raises(Exception, match="API Error"):
+            await use_case.execute(request)
@@ -0,0 +1,229 @@
+"""Unit tests for the persistent segment store and its repository decorator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.song import Song
+from src.domain.utils.normalization import normalize_key
+from src.infrastructure.cache.persistent_lyrics_repository import (
+    PersistentLyricsRepository,
+)
+from src.infrastructure.cache.segment_store import (
+    INDEX_FILE,
+    SEGMENT_FILE,
+    SegmentStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[SegmentStore]:
+    """Create an empty store."""
+    store = SegmentStore(tmp_path / "store", initial_slots=8)
+    yield store
+    store.close()
+
+
+class TestSegmentStore:
+    """Tests for SegmentStore."""
+
+    def test_put_and_get(self, store: SegmentStore) -> None:
+        """Test that values are read back and replaced by later puts."""
+        # Act
+        store.put("a", b"first")
+        store.put("b", "가사".encode())
+        store.put("a", b"second")
+
+        # Assert
+        assert store.get("a") == b"second"
+        assert store.get("b") == "가사".encode()
+        assert store.get("missing") is None
+        assert len(store) == 2
+
+    def test_index_grows(self, store: SegmentStore) -> None:
+        """Test that the index is rehashed as keys are added."""
+        # Act
+        for i in range(100):
+            store.put(f"key {i}", str(i).encode())
+
+        # Assert
+        assert len(store) == 100
+        assert all(store.get(f"key {i}") == str(i).encode() for i in range(100))
+
+    def test_reopen_keeps_records(self, tmp_path: Path) -> None:
+        """Test that a reopened store serves earlier records from its index."""
+        # Arrange
+        store = SegmentStore(tmp_path, initial_slots=8)
+        for i in range(20):
+            store.put(f"key {i}", b"value")
+        store.close()
+
+        # Act
+        reopened = SegmentStore(tmp_path, initial_slots=8)
+
+        # Assert
+        assert len(reopened) == 20
+        assert reopened.get("key 7") == b"value"
+        reopened.close()
+
+    def test_records_after_last_sync_are_replayed(self, tmp_path: Path) -> None:
+        """Test that an index missing recent appends catches up on open."""
+        # Arrange
+        store = SegmentStore(tmp_path, initial_slots=8)
+        store.put("old", b"1")
+        store.close()
+        index = (tmp_path / INDEX_FILE).read_bytes()
+        store = SegmentStore(tmp_path, initial_slots=8)
+        store.put("new", b"2")
+        store.close()
+        (tmp_path / INDEX_FILE).write_bytes(index)
+
+        # Act
+        reopened = SegmentStore(tmp_path, initial_slots=8)
+
+        # Assert
+        assert reopened.get("old") == b"1"
+        assert reopened.get("new") == b"2"
+        reopened.close()
+
+    def test_torn_tail_is_truncated(self, tmp_path: Path) -> None:
+        """Test that a half-written last record is dropped on open."""
+        # Arrange
+        store = SegmentStore(tmp_path, initial_slots=8)
+        store.put("kept", b"value")
+        size = store.size_bytes
+        store.put("torn", b"value")
+        store.close()
+        with (tmp_path / SEGMENT_FILE).open("r+b") as file:
+            file.truncate(size + 5)
+        (tmp_path / INDEX_FILE).unlink()
+
+        # Act
+        reopened = SegmentStore(tmp_path, initial_slots=8)
+
+        # Assert
+        assert reopened.get("kept") == b"value"
+        assert reopened.get("torn") is None
+        assert reopened.size_bytes == size
+        reopened.close()
+
+    def test_second_open_is_rejected(self, store: SegmentStore) -> None:
+        """Test that two processes cannot write the same store."""
+        with pytest.raises(RuntimeError, match="in use"):
+            SegmentStore(store.directory)
+
+    def test_compaction_drops_dead_records(self, store: SegmentStore) -> None:
+        """Test that compaction keeps only the latest value of each key."""
+        # Arrange
+        for i in range(10):
+            store.put("a", str(i).encode())
+        store.put("b", b"b")
+        before = store.size_bytes
+
+        # Act
+        store.compact()
+
+        # Assert
+        assert store.size_bytes < before
+        assert store.size_bytes - 16 == store.live_bytes
+        assert store.get("a") == b"9"
+        assert store.get("b") == b"b"
+
+    def test_compacted_store_reopens(self, tmp_path: Path) -> None:
+        """Test that the swapped-in segment and index match after reopening."""
+        # Arrange
+        store = SegmentStore(tmp_path, initial_slots=8)
+        store.put("a", b"1")
+        store.put("a", b"2")
+        store.compact()
+        store.close()
+
+        # Act
+        reopened = SegmentStore(tmp_path, initial_slots=8)
+
+        # Assert
+        assert reopened.get("a") == b"2"
+        assert len(reopened) == 1
+        reopened.close()
+
+    def test_cap_evicts_oldest_records(self, tmp_path: Path) -> None:
+        """Test that exceeding the cap drops the oldest records."""
+        # Arrange
+        store = SegmentStore(tmp_path, max_bytes=1000, initial_slots=8)
+
+        # Act
+        for i in range(20):
+            store.put(f"key {i:02}", b"x" * 50)
+            store.compact_if_due()
+
+        # Assert
+        assert store.size_bytes <= 1000
+        assert store.get("key 19") == b"x" * 50
+        assert store.get("key 00") is None
+        store.close()
+
+
+class TestPersistentLyricsRepository:
+    """Tests for PersistentLyricsRepository."""
+
+    async def test_found_song_is_served_after_restart(self, tmp_path: Path) -> None:
+        """Test that a stored song is answered without going upstream."""
+        # Arrange
+        song = Song(title="맨발", artist="블랙넛", lyrics="가사")
+        inner = AsyncMock()
+        inner.search_song.return_value = song
+        repository = PersistentLyricsRepository(inner, SegmentStore(tmp_path))
+        await repository.search_song("맨발", "블랙넛")
+        await repository.close()
+
+        # Act
+        inner = AsyncMock()
+        repository = PersistentLyricsRepository(inner, SegmentStore(tmp_path))
+        result = await repository.search_song(" 맨발 ", "블랙넛")
+        await repository.close()
+
+        # Assert
+        assert result == song
+        inner.search_song.assert_not_called()
+
+    async def test_songs_without_lyrics_are_not_stored(
+        self, store: SegmentStore
+    ) -> None:
+        """Test that not-found and lyric-less results go upstream again."""
+        # Arrange
+        inner = AsyncMock()
+        inner.search_song.side_effect = [Song(title="Song", artist="Artist"), None]
+        repository = PersistentLyricsRepository(inner, store)
+
+        # Act
+        await repository.search_song("Song", "Artist")
+        await repository.search_song("Song", "Artist")
+
+        # Assert
+        assert inner.search_song.await_count == 2
+        assert len(store) == 0
+
+    async def test_store_is_compacted_in_the_background(self, tmp_path: Path) -> None:
+        """Test that writes going over the cap queue a compaction."""
+        # Arrange
+        store = SegmentStore(tmp_path, max_bytes=1000, initial_slots=8)
+        inner = AsyncMock()
+        inner.search_song.side_effect = lambda title, artist: Song(
+            title=title, artist=artist, lyrics="x" * 50
+        )
+        repository = PersistentLyricsRepository(inner, store)
+
+        # Act
+        for i in range(20):
+            await repository.search_song(f"Song {i:02}", "Artist")
+        await repository.close()
+
+        # Assert
+        assert store.size_bytes <= 1000
+        reopened = SegmentStore(tmp_path, max_bytes=1000, initial_slots=8)
+        assert reopened.get(normalize_key("Song 19", "Artist")) is not None
+        reopened.close()
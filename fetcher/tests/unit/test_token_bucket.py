@@ -0,0 +1,68 @@
+"""Unit tests for the in-process token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.ratelimit.token_bucket import TokenBucket
+
+
+async def timed_acquires(bucket: TokenBucket, count: int) -> float:
+    """Acquire ``count`` tokens concurrently and return the elapsed seconds."""
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(count)))
+    return time.monotonic() - started
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_burst_is_served_immediately(self) -> None:
+        """Test that a full bucket does not delay callers."""
+        bucket = TokenBucket(rate=1, burst=5)
+
+        elapsed = await timed_acquires(bucket, 5)
+
+        assert elapsed < 0.1
+
+    async def test_excess_callers_wait_for_refill(self) -> None:
+        """Test that callers beyond the burst are queued, not failed."""
+        bucket = TokenBucket(rate=20, burst=1)
+
+        elapsed = await timed_acquires(bucket, 3)
+
+        assert elapsed >= 0.09
+
+    async def test_pause_holds_back_callers(self) -> None:
+        """Test that a pause delays even a full bucket."""
+        bucket = TokenBucket(rate=100, burst=10)
+
+        await bucket.pause(0.1)
+        elapsed = await timed_acquires(bucket, 1)
+
+        assert elapsed >= 0.09
+
+    def test_slow_down_and_recovery(self) -> None:
+        """Test multiplicative slowdown and additive recovery."""
+        bucket = TokenBucket(rate=10, burst=1, min_rate_factor=0.2, recovery_step=0.1)
+
+        bucket.slow_down()
+        assert bucket.effective_rate == pytest.approx(5)
+        for _ in range(5):
+            bucket.slow_down()
+        assert bucket.effective_rate == pytest.approx(2)
+
+        bucket.speed_up()
+        assert bucket.effective_rate == pytest.approx(3)
+        for _ in range(20):
+            bucket.speed_up()
+        assert bucket.effective_rate == pytest.approx(10)
+
+    @pytest.mark.parametrize(("rate", "burst"), [(0, 1), (1, 0)])
+    def test_rejects_invalid_settings(self, rate: float, burst: int) -> None:
+        """Test that non-positive rate or burst is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
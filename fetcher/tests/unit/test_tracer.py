@@ -0,0 +1,189 @@
+"""Unit tests for request tracing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.tracing.json_lines_span_exporter import (
+    JsonLinesSpanExporter,
+)
+from src.infrastructure.tracing.otlp_span_exporter import encode_spans
+from src.infrastructure.tracing.span import Span
+from src.infrastructure.tracing.span_exporter import SpanExporter
+from src.infrastructure.tracing.tracer import Tracer, current_span
+
+
+class RecordingExporter(SpanExporter):
+    """Exporter keeping every exported batch in memory."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[Span]] = []
+        self.closed = False
+
+    async def export(self, spans: Sequence[Span]) -> None:
+        self.batches.append(list(spans))
+
+    async def close(self) -> None:
+        self.closed = True
+
+    @property
+    def spans(self) -> list[Span]:
+        return [span for batch in self.batches for span in batch]
+
+
+class TestTracer:
+    """Tests for Tracer."""
+
+    async def test_nested_spans_share_trace_and_link_parents(self) -> None:
+        """Test that child spans, also in new tasks, join the active trace."""
+        # Arrange
+        exporter = RecordingExporter()
+        tracer = Tracer(exporter)
+
+        async def child() -> None:
+            with tracer.span("child"):
+                await asyncio.sleep(0)
+
+        # Act
+        with tracer.span("root", trace_id="a" * 32) as root:
+            await asyncio.create_task(child())
+        await tracer.flush()
+
+        # Assert
+        spans = {span.name: span for span in exporter.spans}
+        assert spans["child"].trace_id == "a" * 32
+        assert spans["child"].parent_id == root.span_id
+        assert spans["root"].parent_id is None
+        assert current_span() is None
+
+    async def test_error_is_recorded_on_span(self) -> None:
+        """Test that an exception marks the span and propagates."""
+        # Arrange
+        exporter = RecordingExporter()
+        tracer = Tracer(exporter)
+
+        # Act
+        with pytest.raises(TimeoutError), tracer.span("search"):
+            raise TimeoutError
+
+        await tracer.flush()
+
+        # Assert
+        assert exporter.spans[0].error == "TimeoutError"
+        assert exporter.spans[0].end_ns is not None
+
+    async def test_record_adds_finished_child(self) -> None:
+        """Test that past intervals are recorded under the current span."""
+        # Arrange
+        exporter = RecordingExporter()
+        tracer = Tracer(exporter)
+
+        # Act
+        with tracer.span("root") as root:
+            tracer.record("queue_wait", root.start_ns - 2_000_000, root.start_ns)
+        await tracer.flush()
+
+        # Assert
+        wait = exporter.spans[0]
+        assert wait.name == "queue_wait"
+        assert wait.parent_id == root.span_id
+        assert wait.duration_seconds == pytest.approx(0.002)
+
+    async def test_full_batch_is_flushed_early(self) -> None:
+        """Test that reaching the batch size exports without waiting."""
+        # Arrange
+        exporter = RecordingExporter()
+        tracer = Tracer(exporter, batch_size=2, flush_interval_seconds=60)
+
+        # Act
+        for name in ("a", "b"):
+            with tracer.span(name):
+                pass
+        await asyncio.sleep(0)
+
+        # Assert
+        assert [span.name for span in exporter.spans] == ["a", "b"]
+
+    async def test_stop_exports_remaining_spans(self) -> None:
+        """Test that stopping flushes the buffer and closes the exporter."""
+        # Arrange
+        exporter = RecordingExporter()
+        tracer = Tracer(exporter, flush_interval_seconds=60)
+        await tracer.start()
+
+        # Act
+        with tracer.span("last"):
+            pass
+        await tracer.stop()
+
+        # Assert
+        assert [span.name for span in exporter.spans] == ["last"]
+        assert exporter.closed
+
+    async def test_spans_are_not_buffered_without_exporter(self) -> None:
+        """Test that tracing without an exporter only propagates context."""
+        # Arrange
+        tracer = Tracer()
+
+        # Act
+        with tracer.span("root") as span:
+            pass
+
+        # Assert
+        assert len(span.trace_id) == 32
+        assert tracer._buffer == []
+
+
+class TestSpanExporters:
+    """Tests for the span exporters."""
+
+    async def test_json_lines_exporter_appends_spans(self, tmp_path: Path) -> None:
+        """Test that each span becomes one JSON line."""
+        # Arrange
+        path = tmp_path / "traces" / "spans.jsonl"
+        exporter = JsonLinesSpanExporter(path)
+        span = Span(name="genius.search", trace_id="t", start_ns=0, end_ns=10**9)
+
+        # Act
+        await exporter.export([span])
+        await exporter.export([span])
+
+        # Assert
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        record = json.loads(lines[0])
+        assert record["name"] == "genius.search"
+        assert record["duration_seconds"] == 1.0
+
+    def test_otlp_encoding(self) -> None:
+        """Test the OTLP/HTTP JSON mapping of a failed child span."""
+        # Arrange
+        span = Span(
+            name="redis.publish",
+            trace_id="a" * 32,
+            span_id="b" * 16,
+            parent_id="c" * 16,
+            start_ns=1,
+            end_ns=2,
+            error="ConnectionError",
+            attributes={"retries": 2},
+        )
+
+        # Act
+        body = encode_spans([span], "lyrics-fetcher")
+
+        # Assert
+        resource_spans = body["resourceSpans"][0]
+        otlp_span = resource_spans["scopeSpans"][0]["spans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {
+            "stringValue": "lyrics-fetcher"
+        }
+        assert otlp_span["parentSpanId"] == "c" * 16
+        assert otlp_span["startTimeUnixNano"] == "1"
+        assert otlp_span["status"] == {"code": 2}
+        assert {"key": "retries", "value": {"intValue": "2"}} in otlp_span["attributes"]
@@ -0,0 +1,111 @@
+"""Unit tests for the multi-process worker supervisor."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import sys
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.presentation.lyrics_fetcher_service import ServiceStats
+from src.presentation.worker_supervisor import (
+    HealthQueue,
+    SupervisorHealth,
+    WorkerHeartbeat,
+    WorkerSupervisor,
+    WorkerTarget,
+)
+
+# Worker targets must be importable functions so spawned processes can run them
+
+
+def serve_until_terminated(index: int, health_queue: HealthQueue) -> None:
+    """Report one heartbeat and exit cleanly on SIGTERM."""
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    health_queue.put(
+        WorkerHeartbeat(
+            index=index, pid=os.getpid(), stats=ServiceStats(processed=index + 1)
+        )
+    )
+    while True:
+        time.sleep(0.05)
+
+
+def crash(index: int, health_queue: HealthQueue) -> None:
+    """Exit immediately with an error."""
+    sys.exit(3)
+
+
+def ignore_sigterm(index: int, health_queue: HealthQueue) -> None:
+    """Keep running through SIGTERM once the heartbeat is sent."""
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    health_queue.put(
+        WorkerHeartbeat(index=index, pid=os.getpid(), stats=ServiceStats(processed=1))
+    )
+    while True:
+        time.sleep(0.05)
+
+
+def make_supervisor(target: WorkerTarget, processes: int = 2) -> WorkerSupervisor:
+    """Create a supervisor with short intervals for testing."""
+    return WorkerSupervisor(
+        target=target,
+        processes=processes,
+        restart_delay_seconds=0.05,
+        shutdown_timeout_seconds=1.0,
+        poll_interval_seconds=0.05,
+    )
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 10.0) -> None:
+    """Poll until ``condition()`` is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.05)
+
+
+class TestWorkerSupervisor:
+    """Tests for WorkerSupervisor."""
+
+    async def test_aggregates_health_and_stops_gracefully(self) -> None:
+        """Test that heartbeats are summed and SIGTERM lets workers exit."""
+        supervisor = make_supervisor(serve_until_terminated)
+        task = asyncio.create_task(supervisor.run())
+
+        await wait_until(lambda: supervisor.health().processed == 3)
+        health = supervisor.health()
+        supervisor.stop()
+        await task
+
+        assert health == SupervisorHealth(workers_total=2, workers_alive=2, processed=3)
+        assert [p.exitcode for p in supervisor._workers.values()] == [0, 0]
+
+    async def test_restarts_crashed_workers(self) -> None:
+        """Test that exited workers are started again."""
+        supervisor = make_supervisor(crash, processes=1)
+        task = asyncio.create_task(supervisor.run())
+
+        await wait_until(lambda: supervisor.health().restarts >= 2)
+        supervisor.stop()
+        await task
+
+    async def test_kills_workers_that_ignore_sigterm(self) -> None:
+        """Test that shutdown escalates after the timeout."""
+        supervisor = make_supervisor(ignore_sigterm, processes=1)
+        task = asyncio.create_task(supervisor.run())
+
+        await wait_until(lambda: supervisor.health().processed == 1)
+        supervisor.stop()
+        await asyncio.wait_for(task, timeout=5.0)
+
+        assert supervisor._workers[0].exitcode == -signal.SIGKILL
+
+    def test_rejects_non_positive_process_count(self) -> None:
+        """Test that at least one worker is required."""
+        with pytest.raises(ValueError):
+            make_supervisor(crash, processes=0)